@@ -1,14 +1,19 @@
 import json
+import logging
 
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 
-from api.place.models import Place
-from api.review.models import Review
+from api.config import get_settings
+from api.database import SessionLocal
+from api.place.service import get_places_by_ids
 from api.recommend.schemas import RecommendResponse, RecommendedPlace
-from api.ai.model import generate_response
-from api.ai.prompts import build_recommendation_prompt
-from api.ai.context import build_places_context, build_history_text
+from api.ai.model import generate_response_async
+from api.ai.prompts import build_budgeted_prompt
+from api.ai.context import load_user_places, select_places
+from api.ai.retrieval import query_weights
+
+logger = logging.getLogger(__name__)
 
 
 def parse_ai_response(response_text: str) -> dict:
@@ -30,70 +35,109 @@ def parse_ai_response(response_text: str) -> dict:
         }
 
 
-def get_place_with_rating(db: Session, place_id: int) -> tuple[Place | None, float | None]:
-    """맛집과 평균 평점 조회"""
-    place = db.query(Place).filter(Place.id == place_id).first()
-    if not place:
-        return None, None
-
-    avg_rating = db.query(func.avg(Review.rating)).filter(
-        Review.place_id == place.id
-    ).scalar()
+def _parse_place_ids(place_ids) -> list[int]:
+    """AI 응답의 place_ids를 정수 목록으로 (형식이 잘못된 값은 무시)"""
+    result = []
+    for place_id in place_ids or []:
+        try:
+            result.append(int(place_id))
+        except (TypeError, ValueError):
+            continue
+    return result
 
-    return place, round(avg_rating, 1) if avg_rating else None
 
-
-def generate_recommendation(
+def build_prompt(
     db: Session,
     user_id: int,
     user_message: str,
     messages_history: list[dict],
     latitude: float | None = None,
     longitude: float | None = None
-) -> tuple[str, bool, list[RecommendedPlace]]:
-    """AI 추천 생성
-
-    Returns:
-        tuple: (AI 응답 메시지, 추가 질문 중인지, 추천 맛집 목록)
-    """
-    # 컨텍스트 빌드
-    places_context = build_places_context(db, user_id)
-    history_text = build_history_text(messages_history)
+) -> str:
+    """추천 프롬프트 생성 (LLM 호출 전 DB 작업)"""
+    # 컨텍스트 (현재 메시지/최근 대화와 관련 있는 맛집만)
+    settings = get_settings()
+    candidates = select_places(
+        load_user_places(db, user_id),
+        query_weights(user_message, messages_history),
+        settings.AI_CONTEXT_TOP_K
+    )
 
     location_info = ""
     if latitude and longitude:
         location_info = f"\n현재 사용자 위치: ({latitude}, {longitude})"
 
-    # 프롬프트 생성
-    prompt = build_recommendation_prompt(
-        places_context=places_context,
-        history_text=history_text,
+    # 프롬프트 생성 (토큰 예산 안에서)
+    built = build_budgeted_prompt(
+        places=candidates,
+        messages_history=messages_history,
         user_message=user_message,
-        location_info=location_info
+        location_info=location_info,
+        max_tokens=settings.AI_PROMPT_MAX_TOKENS
     )
+    logger.info(
+        f"추천 프롬프트: 약 {built.tokens}토큰, 맛집 {built.place_count}개"
+        f" (제외 {built.dropped_places}개, 요약 형식 {built.compact}), 이전 대화 {built.history_messages}개"
+    )
+    return built.prompt
+
 
-    # AI 호출
-    response_text = generate_response(prompt)
+def build_result(
+    db: Session,
+    user_id: int,
+    response_text: str
+) -> tuple[str, bool, list[RecommendedPlace]]:
+    """AI 응답 -> (메시지, 추가 질문 중인지, 추천 맛집 목록) (LLM 호출 후 DB 작업)"""
     result = parse_ai_response(response_text)
 
-    # 추천 맛집 정보 조회
-    recommended_places = []
-    for place_id in result.get("place_ids", []):
-        place, avg_rating = get_place_with_rating(db, place_id)
-        if place:
-            recommended_places.append(RecommendedPlace(
-                id=place.id,
-                name=place.name,
-                category=place.category.value if place.category else "other",
-                address=place.address,
-                latitude=place.latitude,
-                longitude=place.longitude,
-                avg_rating=avg_rating,
-                reason=result.get("reasons", {}).get(str(place_id), "")
-            ))
+    # 추천 맛집 정보 조회 (한 번에, 접근 가능한 맛집만)
+    places = get_places_by_ids(db, user_id, _parse_place_ids(result.get("place_ids")))
+    reasons = result.get("reasons") or {}
+    recommended_places = [
+        RecommendedPlace(
+            id=place["id"],
+            name=place["name"],
+            category=place["category"].value if place["category"] else "other",
+            address=place["address"],
+            latitude=place["latitude"],
+            longitude=place["longitude"],
+            avg_rating=place["avg_rating"],
+            reason=reasons.get(str(place["id"]), "")
+        )
+        for place in places
+    ]
 
     return (
         result["message"],
         result.get("is_asking", False),
         recommended_places
     )
+
+
+def _in_session(step, *args):
+    """새 DB 세션으로 step(db, *args) 실행 (스레드 풀 작업마다 자기 세션을 쓴다)"""
+    with SessionLocal() as db:
+        return step(db, *args)
+
+
+async def generate_recommendation(
+    user_id: int,
+    user_message: str,
+    messages_history: list[dict],
+    latitude: float | None = None,
+    longitude: float | None = None
+) -> tuple[str, bool, list[RecommendedPlace]]:
+    """AI 추천 생성
+
+    DB 작업(프롬프트 생성, 추천 맛집 조회)은 이벤트 루프를 막지 않도록 스레드 풀에서
+    작업마다 새 세션으로 실행하고, LLM 호출은 비동기로 기다린다.
+    (요청이 취소되어 스레드만 남아도 요청 세션과 공유하지 않으므로 안전하다)
+
+    Returns:
+        tuple: (AI 응답 메시지, 추가 질문 중인지, 추천 맛집 목록)
+    """
+    prompt = await run_in_threadpool(
+        _in_session, build_prompt, user_id, user_message, messages_history, latitude, longitude
+    )
+    response_text = await generate_response_async(prompt)
+    return await run_in_threadpool(_in_session, build_result, user_id, response_text)
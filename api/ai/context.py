@@ -1,42 +1,131 @@
+from itertools import groupby
+from typing import NamedTuple
+
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import and_
 
+from api import cache
+from api.ai import retrieval
 from api.place.models import Place
 from api.review.models import Review
 
+CONTEXT_CACHE_SIZE = 256
+
+# 압축 형식에서 리뷰/메모를 줄이는 기준
+COMPACT_REVIEW_CHARS = 80
+COMPACT_MAX_REVIEWS = 3
+COMPACT_MEMO_CHARS = 120
+
+
+class PlaceEntry(NamedTuple):
+    place_id: int
+    text: str  # 프롬프트에 넣을 맛집 블록
+    avg_rating: float | None
+    compact: str  # 프롬프트 예산이 모자랄 때 쓰는 한 줄 요약 (긴 리뷰/메모는 잘라냄)
+
+
+class UserPlaces(NamedTuple):
+    entries: list[PlaceEntry]  # 맛집 id 순
+    index: retrieval.BM25Index  # entries와 같은 순서의 문서 번호
+
+
+# (사용자, 데이터 버전) -> 맛집 블록 + 검색 인덱스
+# 맛집/리뷰 쓰기 시 버전이 올라가므로 같은 세션의 다음 대화 턴은 만들어 둔 것을 재사용한다
+context_cache = cache.LRUCache(max_size=CONTEXT_CACHE_SIZE)
+
 
-def build_places_context(db: Session, user_id: int) -> str:
-    """사용자의 맛집 데이터를 컨텍스트 문자열로 변환"""
-    places = db.query(Place).filter(Place.user_id == user_id).all()
+def load_user_places(db: Session, user_id: int) -> UserPlaces:
+    """사용자 맛집 블록/검색 인덱스 (사용자 데이터 버전 단위 캐시)"""
+    key = ("places_context", user_id, cache.get_versions(db, [cache.user_scope(user_id)]))
+    return context_cache.get_or_compute(key, lambda: _load_user_places(db, user_id))
 
-    if not places:
-        return "등록된 맛집이 없습니다."
 
-    context_parts = []
-    for place in places:
-        # 평균 평점 조회
-        avg_rating = db.query(func.avg(Review.rating)).filter(
-            Review.place_id == place.id
-        ).scalar()
+def select_places(
+    places: UserPlaces,
+    query: dict[str, float] | None,
+    top_k: int | None
+) -> list[PlaceEntry]:
+    """관련도 순 맛집 top_k (일치하는 맛집이 모자라면 평점 높은 순으로 채운다)
 
-        # 리뷰 내용 조회
-        reviews = db.query(Review).filter(Review.place_id == place.id).all()
-        review_texts = [r.content for r in reviews if r.content]
+    top_k가 없거나 맛집이 top_k개 이하여도 관련도 순으로 정렬해 돌려준다.
+    (프롬프트 예산이 모자라면 뒤에서부터 뺀다)
+    """
+    entries = places.entries
+    limit = len(entries) if top_k is None else min(top_k, len(entries))
+
+    chosen = [doc for doc, _ in places.index.search(query or {}, limit)]
+    if len(chosen) < limit:
+        picked = set(chosen)
+        rest = sorted(
+            (doc for doc in range(len(entries)) if doc not in picked),
+            key=lambda doc: (entries[doc].avg_rating or 0, -doc),
+            reverse=True
+        )
+        chosen.extend(rest[:limit - len(chosen)])
+    return [entries[doc] for doc in chosen]
+
+
+def _load_user_places(db: Session, user_id: int) -> UserPlaces:
+    """맛집 + 리뷰 내용을 조인 쿼리 한 번으로 읽어 맛집 블록/검색 인덱스 생성 (평균 평점은 비정규화 컬럼)"""
+    rows = db.query(
+        Place.id, Place.name, Place.category, Place.address, Place.latitude, Place.longitude,
+        Place.tags, Place.memo, Place.avg_rating, Review.content
+    ).outerjoin(
+        Review, and_(Review.place_id == Place.id, Review.content.isnot(None), Review.content != "")
+    ).filter(
+        Place.user_id == user_id
+    ).order_by(Place.id, Review.id).all()
+
+    entries = []
+    documents = []
+    for _, place_rows in groupby(rows, key=lambda row: row.id):
+        place_rows = list(place_rows)
+        place = place_rows[0]
+        review_texts = [row.content for row in place_rows if row.content]
+        category = place.category.value if place.category else None
 
         place_info = f"""
 [맛집 ID: {place.id}]
 - 이름: {place.name}
-- 카테고리: {place.category.value if place.category else '기타'}
+- 카테고리: {category or '기타'}
 - 주소: {place.address or '미등록'}
 - 위치: ({place.latitude}, {place.longitude})
 - 태그: {place.tags or '없음'}
 - 메모: {place.memo or '없음'}
-- 평균 평점: {round(avg_rating, 1) if avg_rating else '평가 없음'}
+- 평균 평점: {round(place.avg_rating, 1) if place.avg_rating else '평가 없음'}
 - 리뷰: {'; '.join(review_texts) if review_texts else '리뷰 없음'}
 """
-        context_parts.append(place_info)
+        entries.append(PlaceEntry(place.id, place_info, place.avg_rating, _compact_place(place, review_texts)))
+        documents.append(retrieval.tokenize(" ".join(filter(None, [
+            place.name, retrieval.CATEGORY_LABELS.get(category), category,
+            place.address, place.tags, place.memo, *review_texts
+        ]))))
+
+    return UserPlaces(entries, retrieval.BM25Index(documents))
+
+
+def _shorten(text: str, limit: int) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[:limit - 1] + "…"
+
 
-    return "\n".join(context_parts)
+def _compact_place(place, review_texts: list[str]) -> str:
+    """맛집 한 줄 요약 - 빈 항목은 빼고 리뷰는 앞의 몇 개만 짧게"""
+    parts = [f"[맛집 ID: {place.id}] {place.name}"]
+    parts.append(place.category.value if place.category else "기타")
+    if place.address:
+        parts.append(place.address)
+    parts.append(f"({place.latitude:.4f}, {place.longitude:.4f})")
+    if place.tags:
+        parts.append(f"태그: {place.tags}")
+    if place.memo:
+        parts.append(f"메모: {_shorten(place.memo, COMPACT_MEMO_CHARS)}")
+    if place.avg_rating:
+        parts.append(f"평점 {round(place.avg_rating, 1)}")
+    if review_texts:
+        reviews = "; ".join(_shorten(text, COMPACT_REVIEW_CHARS) for text in review_texts[:COMPACT_MAX_REVIEWS])
+        parts.append(f"리뷰: {reviews}")
+    return " | ".join(parts)
 
 
 def build_history_text(messages: list[dict], limit: int = 10) -> str:
@@ -1,6 +1,10 @@
+import asyncio
+
 import google.generativeai as genai
+from fastapi.concurrency import run_in_threadpool
 
 from api.config import get_settings
+from api.ai.response_cache import ResponseCache, cache_key
 
 settings = get_settings()
 
@@ -8,10 +12,43 @@ settings = get_settings()
 genai.configure(api_key=settings.GEMINI_API_KEY)
 
 # 모델 인스턴스
-gemini_model = genai.GenerativeModel("gemini-1.5-flash")
+MODEL_NAME = "gemini-1.5-flash"
+gemini_model = genai.GenerativeModel(MODEL_NAME)
+
+# 같은 프롬프트의 응답 재사용
+response_cache = ResponseCache(
+    max_size=settings.AI_RESPONSE_CACHE_SIZE,
+    ttl_seconds=settings.AI_RESPONSE_CACHE_TTL_SECONDS,
+    path=settings.AI_RESPONSE_CACHE_PATH or None
+)
+
+# 동시에 진행 중인 LLM 호출 수 상한 (프로세스 전체) - 넘는 요청은 이벤트 루프에서 대기한다
+llm_semaphore = asyncio.Semaphore(settings.AI_MAX_CONCURRENT_REQUESTS)
+
+
+async def generate_response_async(prompt: str, timeout: float | None = None) -> str:
+    """Gemini API 비동기 호출 (같은 모델/프롬프트의 응답은 캐시에서)
+
+    동시 호출 수는 llm_semaphore로 제한하며, timeout(초)은 대기 시간을 포함한다.
+    시간 초과 시 asyncio.TimeoutError, 호출한 태스크가 취소되면 진행 중인 요청도 취소된다.
+    캐시 조회/저장은 디스크(SQLite) 입출력이 있을 수 있어 스레드 풀에서 실행한다.
+    """
+    key = cache_key(MODEL_NAME, prompt)
+    cached = await run_in_threadpool(response_cache.get, key)
+    if cached is not None:
+        return cached
+
+    if timeout is None:
+        timeout = settings.AI_REQUEST_TIMEOUT_SECONDS
 
+    async def call() -> str:
+        async with llm_semaphore:
+            response = await gemini_model.generate_content_async(
+                prompt, request_options={"timeout": timeout}
+            )
+            return response.text
 
-def generate_response(prompt: str) -> str:
-    """Gemini API 호출"""
-    response = gemini_model.generate_content(prompt)
-    return response.text
+    text = await asyncio.wait_for(call(), timeout)
+    if text:
+        await run_in_threadpool(response_cache.set, key, text)
+    return text
@@ -1,3 +1,8 @@
+import math
+from typing import NamedTuple, Sequence
+
+from api.ai.context import PlaceEntry, build_history_text
+
 SYSTEM_PROMPT = """당신은 TasteMap의 맛집 추천 AI 어시스턴트입니다.
 사용자의 맛집 데이터와 리뷰를 기반으로 개인화된 추천을 제공합니다.
 
@@ -47,3 +52,106 @@ def build_recommendation_prompt(
 
 위 정보를 바탕으로 JSON 형식으로 응답하세요.
 """
+
+
+# 토큰 수 추정: 한글/한자 등 비 ASCII 문자는 글자당 1토큰, ASCII는 4글자당 1토큰으로 본다
+# (실제 토크나이저보다 약간 크게 잡아 상한이 넘지 않도록)
+ASCII_CHARS_PER_TOKEN = 4
+
+# 예산 배분 (고정 부분을 뺀 나머지 기준)
+MESSAGE_BUDGET_RATIO = 0.2  # 현재 메시지 최대 비중
+HISTORY_BUDGET_RATIO = 0.25  # 이전 대화 최대 비중 - 남은 예산은 맛집 데이터
+HISTORY_MESSAGES = 10
+
+
+class PromptBuild(NamedTuple):
+    prompt: str
+    tokens: int  # 추정 토큰 수
+    place_count: int  # 프롬프트에 들어간 맛집 수
+    dropped_places: int  # 예산 초과로 뺀 맛집 수 (관련도 낮은 순으로 제외)
+    compact: bool  # 맛집을 한 줄 요약 형식으로 넣었는지
+    history_messages: int  # 프롬프트에 들어간 이전 대화 메시지 수
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 추정 (로컬 계산)"""
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    return non_ascii + math.ceil((len(text) - non_ascii) / ASCII_CHARS_PER_TOKEN)
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """추정 토큰 수가 max_tokens 이하가 되도록 뒤를 자른다"""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if estimate_tokens(text[:mid]) + 1 <= max_tokens:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo] + "…"
+
+
+def build_budgeted_prompt(
+    places: Sequence[PlaceEntry],
+    messages_history: list[dict],
+    user_message: str,
+    location_info: str = "",
+    max_tokens: int = 8000
+) -> PromptBuild:
+    """토큰 예산 안에서 추천 프롬프트 생성
+
+    places는 관련도 높은 순이어야 한다. 예산은 시스템 프롬프트/위치(고정) ->
+    현재 메시지 -> 이전 대화(최근 것부터) -> 맛집 데이터 순으로 배분하고,
+    맛집이 다 들어가지 않으면 한 줄 요약 형식으로 바꾼 뒤 관련도 낮은 맛집부터 뺀다.
+    """
+    fixed = estimate_tokens(build_recommendation_prompt("", "", "", location_info))
+    available = max(max_tokens - fixed, 0)
+
+    message = _truncate_to_tokens(user_message, int(available * MESSAGE_BUDGET_RATIO))
+    available -= estimate_tokens(message)
+
+    # 이전 대화: 최근 메시지부터 예산 안에서
+    history_budget = int(available * HISTORY_BUDGET_RATIO)
+    recent = messages_history[-HISTORY_MESSAGES:]
+    kept = 0
+    used = 0
+    for msg in reversed(recent):
+        cost = estimate_tokens(build_history_text([msg]))
+        if used + cost > history_budget:
+            break
+        used += cost
+        kept += 1
+    history = recent[len(recent) - kept:] if kept else []
+    available -= used
+
+    # 맛집 데이터: 전체가 들어가면 원래 형식, 아니면 요약 형식으로 관련도 순으로 채운다
+    full_texts = [entry.text for entry in places]
+    compact = estimate_tokens("\n".join(full_texts)) > available
+    texts = [entry.compact for entry in places] if compact else full_texts
+
+    selected = []
+    used = 0
+    for text in texts:
+        cost = estimate_tokens(text) + 1  # 구분 줄바꿈
+        if used + cost > available:
+            break
+        selected.append(text)
+        used += cost
+
+    places_context = "\n".join(selected) if selected else "등록된 맛집이 없습니다."
+    prompt = build_recommendation_prompt(
+        places_context=places_context,
+        history_text=build_history_text(history),
+        user_message=message,
+        location_info=location_info
+    )
+    return PromptBuild(
+        prompt=prompt,
+        tokens=estimate_tokens(prompt),
+        place_count=len(selected),
+        dropped_places=len(places) - len(selected),
+        compact=compact,
+        history_messages=len(history)
+    )
@@ -0,0 +1,121 @@
+"""LLM 응답 캐시
+
+(모델 이름, 정규화한 프롬프트)의 해시를 키로 응답 텍스트를 저장한다.
+예시 질문 버튼이나 데이터가 바뀌기 전의 같은 질문은 프롬프트가 같으므로 LLM을 다시 부르지 않는다.
+
+- 메모리: 크기 제한 LRU + TTL
+- 디스크(선택): SQLite 파일 - 재시작 후에도 유지, 메모리에 없으면 여기서 찾아 올린다
+"""
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+# 디스크 캐시 정리(만료/초과분 삭제)는 저장 몇 번마다 한 번
+DISK_PRUNE_INTERVAL = 100
+
+
+def normalize_prompt(prompt: str) -> str:
+    """줄 끝 공백/빈 줄 차이는 같은 프롬프트로 본다"""
+    lines = (line.strip() for line in prompt.strip().splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def cache_key(model_name: str, prompt: str) -> str:
+    digest = hashlib.sha256()
+    digest.update(model_name.encode())
+    digest.update(b"\0")
+    digest.update(normalize_prompt(prompt).encode())
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """TTL/LRU 응답 캐시 (path를 주면 SQLite 디스크 캐시를 함께 쓴다)"""
+
+    def __init__(self, max_size: int = 512, ttl_seconds: float = 3600, path: str | None = None):
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()  # 키 -> (만료 시각, 응답)
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._disk: sqlite3.Connection | None = None
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+
+        if path:
+            self._disk = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._disk.execute(
+                """CREATE TABLE IF NOT EXISTS llm_response_cache (
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )"""
+            )
+
+    def get(self, key: str) -> str | None:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, response = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return response
+                del self._entries[key]
+
+            if self._disk is not None:
+                row = self._disk.execute(
+                    "SELECT response, expires_at FROM llm_response_cache WHERE key = ? AND expires_at > ?",
+                    (key, now)
+                ).fetchone()
+                if row is not None:
+                    response, expires_at = row
+                    self._disk.execute(
+                        "UPDATE llm_response_cache SET accessed_at = ? WHERE key = ?", (now, key)
+                    )
+                    self._remember(key, expires_at, response)
+                    self.hits += 1
+                    return response
+
+            self.misses += 1
+            return None
+
+    def set(self, key: str, response: str) -> None:
+        now = time.time()
+        expires_at = now + self._ttl
+        with self._lock:
+            self._remember(key, expires_at, response)
+            if self._disk is not None:
+                self._disk.execute(
+                    "INSERT OR REPLACE INTO llm_response_cache (key, response, expires_at, accessed_at)"
+                    " VALUES (?, ?, ?, ?)",
+                    (key, response, expires_at, now)
+                )
+                self._writes += 1
+                if self._writes % DISK_PRUNE_INTERVAL == 0:
+                    self._prune_disk(now)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self._disk is not None:
+                self._disk.execute("DELETE FROM llm_response_cache")
+
+    def _remember(self, key: str, expires_at: float, response: str) -> None:
+        self._entries[key] = (expires_at, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def _prune_disk(self, now: float) -> None:
+        """만료된 항목과 최근에 쓰지 않은 초과분 삭제 (디스크도 max_size 기준)"""
+        self._disk.execute("DELETE FROM llm_response_cache WHERE expires_at <= ?", (now,))
+        self._disk.execute(
+            """DELETE FROM llm_response_cache WHERE key IN (
+                SELECT key FROM llm_response_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )""",
+            (self._max_size,)
+        )
@@ -0,0 +1,90 @@
+"""추천 프롬프트에 넣을 맛집 후보 검색 (BM25)
+
+사용자 맛집이 많아도 프롬프트 크기가 일정하도록, 현재 메시지와 최근 대화에
+가장 관련 있는 맛집 top-k만 골라 컨텍스트에 넣는다.
+
+한국어는 조사가 붙어 띄어쓰기 단위 단어로는 잘 맞지 않으므로
+("강남에서" / "강남") 한글 등은 글자 2-gram, 영문/숫자는 단어를 토큰으로 쓴다.
+"""
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+HISTORY_WEIGHT = 0.5  # 이전 사용자 메시지 토큰의 가중치 (현재 메시지는 1)
+HISTORY_MESSAGES = 2
+
+_WORD = re.compile(r"\w+")
+
+CATEGORY_LABELS = {
+    "korean": "한식",
+    "japanese": "일식",
+    "chinese": "중식",
+    "western": "양식",
+    "cafe": "카페",
+    "bar": "술집",
+    "fastfood": "패스트푸드",
+    "dessert": "디저트",
+    "other": "기타",
+}
+
+
+def tokenize(text: str | None) -> list[str]:
+    """텍스트 -> 검색 토큰 (영문/숫자 단어는 그대로, 그 외는 글자 2-gram)"""
+    if not text:
+        return []
+    tokens = []
+    for word in _WORD.findall(text.lower()):
+        if word.isascii() or len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def query_weights(message: str, history: list[dict] | None = None) -> dict[str, float]:
+    """현재 메시지 + 최근 사용자 메시지 -> 토큰별 가중치"""
+    weights: dict[str, float] = {}
+    previous = [m["content"] for m in history or [] if m.get("role") == "user"][-HISTORY_MESSAGES:]
+    for text in previous:
+        for token in tokenize(text):
+            weights[token] = HISTORY_WEIGHT
+    for token in tokenize(message):
+        weights[token] = 1.0
+    return weights
+
+
+class BM25Index:
+    """문서(토큰 목록) 집합의 BM25 역색인 - 문서 번호는 입력 순서"""
+
+    def __init__(self, documents: list[list[str]], k1: float = BM25_K1, b: float = BM25_B):
+        self._k1 = k1
+        self._postings: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        for doc, tokens in enumerate(documents):
+            for term, tf in Counter(tokens).items():
+                self._postings[term].append((doc, tf))
+
+        count = len(documents)
+        lengths = [len(tokens) for tokens in documents]
+        avg_length = (sum(lengths) / count if count else 0) or 1.0
+        self._norms = [k1 * (1 - b + b * length / avg_length) for length in lengths]
+        self._idf = {
+            term: math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for term, postings in self._postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._norms)
+
+    def search(self, weights: dict[str, float], k: int) -> list[tuple[int, float]]:
+        """점수 높은 순 (문서 번호, 점수) 최대 k개 - 일치하는 토큰이 없는 문서는 제외"""
+        scores: dict[int, float] = defaultdict(float)
+        for term, weight in weights.items():
+            idf = self._idf.get(term)
+            if idf is None:
+                continue
+            for doc, tf in self._postings[term]:
+                scores[doc] += weight * idf * tf * (self._k1 + 1) / (tf + self._norms[doc])
+        return heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -item[0]))
@@ -0,0 +1,94 @@
+"""사용자 데이터 버전과 버전 키 캐시
+
+집계성 응답(패싯, 통계 등)은 (사용자, 데이터 버전, 요청 조건)을 키로 프로세스 안에 캐시한다.
+버전은 DB(data_versions)에 두고 맛집/리뷰 쓰기 시 같은 트랜잭션에서 증가시키므로
+워커가 여러 개여도 다른 워커의 쓰기 이후에는 새 키로 다시 계산된다. (무효화가 필요 없다)
+
+- user:{id}: 그 사용자의 맛집, 그 사용자가 쓴 리뷰, 그 사용자 맛집에 달린 리뷰가 바뀔 때
+- public: 공개 맛집 또는 공개 맛집의 리뷰가 바뀔 때
+"""
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Iterable
+
+from sqlalchemy import Column, Integer, String, bindparam, select
+from sqlalchemy.orm import Session
+
+from api.database import Base, upsert
+
+PUBLIC_SCOPE = "public"
+
+
+class DataVersion(Base):
+    __tablename__ = "data_versions"
+
+    scope = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+
+def user_scope(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def get_versions(db: Session, scopes: list[str]) -> tuple[int, ...]:
+    """범위별 현재 버전 (scopes 순서, 없으면 0)"""
+    rows = db.execute(
+        select(DataVersion.scope, DataVersion.version).where(DataVersion.scope.in_(scopes))
+    )
+    versions = dict(rows.all())
+    return tuple(versions.get(scope, 0) for scope in scopes)
+
+
+def bump_versions(db: Session, scopes: Iterable[str]) -> None:
+    """범위별 버전 증가 - 커밋은 호출자가 한다"""
+    scopes = sorted(set(scopes))
+    if not scopes:
+        return
+
+    # 조회 후 INSERT하면 같은 범위를 처음 올리는 동시 요청끼리 충돌하므로 UPSERT 한 문장으로
+    table = DataVersion.__table__
+    db.execute(
+        upsert(table).values(scope=bindparam("target"), version=1).on_conflict_do_update(
+            index_elements=[table.c.scope], set_={"version": table.c.version + 1}
+        ),
+        [{"target": scope} for scope in scopes]
+    )
+
+
+def bump_user_data(db: Session, user_ids: Iterable[int], public: bool = False) -> None:
+    """사용자들의 데이터 버전 증가 (공개 데이터가 바뀌었으면 public도) - 커밋은 호출자가 한다"""
+    scopes = [user_scope(user_id) for user_id in user_ids]
+    if public:
+        scopes.append(PUBLIC_SCOPE)
+    bump_versions(db, scopes)
+
+
+class LRUCache:
+    """크기 제한 LRU 캐시 (키에 버전이 포함되므로 무효화 대신 오래된 항목이 밀려난다)"""
+
+    def __init__(self, max_size: int = 1024):
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, object] = OrderedDict()
+        self._max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], object]):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        value = compute()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -9,6 +9,9 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     OAUTH_STATE_EXPIRE_MINUTES: int = 10
 
+    # 인메모리 공간 인덱스 (프로세스 단위 - 워커 1개로 실행할 때만 사용)
+    SPATIAL_INDEX_ENABLED: bool = False
+
     # 네이버 OAuth
     NAVER_CLIENT_ID: str = ""
     NAVER_CLIENT_SECRET: str = ""
@@ -17,6 +20,20 @@ class Settings(BaseSettings):
     # Gemini API
     GEMINI_API_KEY: str = ""
 
+    # 추천 프롬프트에 넣을 맛집 수 (메시지와 관련 있는 순으로 선택)
+    AI_CONTEXT_TOP_K: int = 30
+    # 추천 프롬프트 크기 상한 (추정 토큰 수)
+    AI_PROMPT_MAX_TOKENS: int = 8000
+
+    # LLM 응답 캐시 (경로를 지정하면 SQLite 파일에도 저장해 재시작 후에도 유지)
+    AI_RESPONSE_CACHE_SIZE: int = 512
+    AI_RESPONSE_CACHE_TTL_SECONDS: int = 3600
+    AI_RESPONSE_CACHE_PATH: str = ""
+
+    # LLM 호출 동시 실행 수 / 호출당 제한 시간(초, 대기 시간 포함)
+    AI_MAX_CONCURRENT_REQUESTS: int = 8
+    AI_REQUEST_TIMEOUT_SECONDS: float = 30.0
+
     class Config:
         env_file = ".env"
 
@@ -1,4 +1,5 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 from api.config import get_settings
@@ -15,9 +16,41 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+def upsert(table):
+    """INSERT ... ON CONFLICT DO UPDATE를 만들 수 있는 insert (SQLite/PostgreSQL)
+
+    조회 후 INSERT 대신 한 문장으로 처리하므로 같은 행을 동시에 처음 쓰는 요청끼리
+    기본 키 충돌이 나지 않는다. 사용법은 두 방언이 같다:
+    upsert(t).values(...).on_conflict_do_update(index_elements=[...], set_={...})
+    """
+    dialect = postgresql if engine.dialect.name == "postgresql" else sqlite
+    return dialect.insert(table)
+
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+def init_db():
+    """테이블 생성 + 기존 테이블에 누락된 컬럼/인덱스 추가 (간이 마이그레이션)"""
+    Base.metadata.create_all(bind=engine)
+
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            existing_columns = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing_columns:
+                    column_type = column.type.compile(dialect=engine.dialect)
+                    conn.execute(text(
+                        f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"
+                    ))
+
+            existing_indexes = {i["name"] for i in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in existing_indexes:
+                    index.create(conn)
@@ -1,14 +1,32 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
-from api.database import Base, engine
+from api.config import get_settings
+from api.database import SessionLocal, init_db
 from api.auth.router import router as auth_router
 from api.place.router import router as place_router
 from api.review.router import router as review_router
 from api.recommend.router import router as recommend_router
+from api.user.router import router as user_router
+from api.place.service import (
+    backfill_geohashes, repair_rating_aggregates, load_spatial_index, ensure_place_tags
+)
+from api.place.cluster import ensure_place_cells
+from api.place.search_index import init_search_index
+
+# 테이블 생성 (+ 누락 컬럼 보정)
+init_db()
+init_search_index()
 
-# 테이블 생성
-Base.metadata.create_all(bind=engine)
+# 기존 데이터의 공간 인덱스 키/평점 집계/클러스터 집계/태그 행 채우기
+with SessionLocal() as db:
+    backfill_geohashes(db)
+    repair_rating_aggregates(db, only_missing=True)
+    ensure_place_cells(db)
+    ensure_place_tags(db)
+    if get_settings().SPATIAL_INDEX_ENABLED:
+        load_spatial_index(db)
 
 app = FastAPI(
     title="Taste Map API",
@@ -25,11 +43,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 큰 응답(지도 영역 마커, 내보내기 등) 압축
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # 라우터 등록
 app.include_router(auth_router)
 app.include_router(place_router)
 app.include_router(review_router)
 app.include_router(recommend_router)
+app.include_router(user_router)
 
 
 @app.get("/")
@@ -0,0 +1,143 @@
+"""커서(keyset) 기반 페이지네이션
+
+정렬 컬럼 + id 값으로 "마지막으로 본 행 다음"을 조건으로 걸기 때문에
+OFFSET처럼 앞 페이지 행들을 건너뛰며 읽지 않는다. 커서는 (정렬 값, id)를
+base64로 감싼 불투명 문자열이다.
+
+NULL은 SQLite처럼 가장 작은 값으로 취급한다. (오름차순이면 맨 앞, 내림차순이면 맨 뒤)
+날짜 정렬 값은 커서에 ISO 8601 문자열로 담고 datetime.fromisoformat으로 검증한다.
+"""
+import base64
+import json
+from datetime import datetime
+
+from fastapi import HTTPException
+from sqlalchemy import DateTime, String, and_, or_, type_coerce
+from sqlalchemy.orm import Query, Session
+
+
+def encode_cursor(sort_value, row_id: int) -> str:
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    raw = json.dumps([sort_value, row_id], ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(status_code=400, detail="잘못된 커서입니다")
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """커서 -> (정렬 값, id) - 정렬 값은 문자열/숫자/None만 허용 (그 외는 400)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        if isinstance(row_id, bool) or not isinstance(row_id, int):
+            raise TypeError
+    except (ValueError, TypeError):
+        raise _invalid_cursor()
+    if isinstance(sort_value, bool) or not isinstance(sort_value, (str, int, float, type(None))):
+        raise _invalid_cursor()
+    return sort_value, row_id
+
+
+def _sort_value_for(sort_column, sort_value, raw_datetime: bool):
+    """커서의 정렬 값을 정렬 컬럼 타입에 맞는 비교 값으로 (타입이 맞지 않으면 400)"""
+    if sort_value is None:
+        return None
+
+    if isinstance(sort_column.type, DateTime):
+        if not isinstance(sort_value, str):
+            raise _invalid_cursor()
+        try:
+            parsed = datetime.fromisoformat(sort_value)
+        except ValueError:
+            raise _invalid_cursor()
+        # SQLite는 날짜를 문자열로 저장하므로 커서에 담아 둔 저장 값 그대로 비교한다
+        return sort_value if raw_datetime else parsed
+
+    try:
+        python_type = sort_column.type.python_type
+    except NotImplementedError:
+        return sort_value
+    if python_type is str and not isinstance(sort_value, str):
+        raise _invalid_cursor()
+    if python_type in (int, float) and not isinstance(sort_value, (int, float)):
+        raise _invalid_cursor()
+    return sort_value
+
+
+def _after(sort_column, id_column, sort_value, row_id: int, descending: bool, nullable: bool):
+    """정렬 순서상 (sort_value, row_id) 다음 행들의 조건"""
+    if descending:
+        if sort_value is None:
+            return and_(sort_column.is_(None), id_column < row_id)
+        condition = and_(sort_column <= sort_value, or_(sort_column < sort_value, id_column < row_id))
+        return or_(condition, sort_column.is_(None)) if nullable else condition
+
+    if sort_value is None:
+        return or_(and_(sort_column.is_(None), id_column > row_id), sort_column.isnot(None))
+    return and_(sort_column >= sort_value, or_(sort_column > sort_value, id_column > row_id))
+
+
+def sort_key_column(db: Session, column):
+    """커서 정렬/비교에 쓸 컬럼
+
+    SQLite의 날짜 컬럼은 저장된 문자열 그대로 읽고 비교한다. (server_default로 저장된 값은
+    소수점 이하 초가 없어 datetime 바인딩 값과 문자열 형식이 다르다) 다른 DB는 날짜 타입 그대로.
+    """
+    if isinstance(column.type, DateTime) and db.get_bind().dialect.name == "sqlite":
+        return type_coerce(column, String)
+    return column
+
+
+def paginate(
+    query: Query,
+    sort_column,
+    id_column,
+    descending: bool = False,
+    nullable: bool = False,
+    cursor: str | None = None,
+    skip: int = 0,
+    limit: int = 100,
+    with_total: bool = False
+) -> tuple[list, int | None, str | None]:
+    """query를 (sort_column, id_column) 순으로 한 페이지 조회
+
+    cursor가 있으면 커서 다음부터, 없으면 skip(OFFSET)부터 읽는다.
+    with_total=False면 전체 개수를 세지 않는다. (None)
+
+    query가 엔티티/컬럼 하나만 조회하면 행 목록은 그 값의 목록, 여럿이면 튜플 목록이다.
+
+    Returns:
+        tuple: (행 목록, 전체 개수 또는 None, 다음 페이지 커서 또는 None)
+    """
+    single = len(query.column_descriptions) == 1
+    total = query.count() if with_total else None
+
+    value_column = sort_column
+    sort_column = sort_key_column(query.session, sort_column)
+    raw_datetime = sort_column is not value_column
+
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+    query = query.add_columns(sort_column.label("_sort_key"), id_column.label("_row_id"))
+
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor)
+        sort_value = _sort_value_for(value_column, sort_value, raw_datetime)
+        query = query.filter(_after(sort_column, id_column, sort_value, row_id, descending, nullable))
+    elif skip:
+        query = query.offset(skip)
+
+    rows = query.limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1]._sort_key, rows[-1]._row_id)
+
+    # 정렬 키/id 보조 컬럼 제외
+    items = [row[0] for row in rows] if single else [tuple(row[:-2]) for row in rows]
+    return items, total, next_cursor
@@ -0,0 +1,263 @@
+"""지도 마커 클러스터링
+
+geohash 앞자리가 곧 격자 계층이므로, 줌 레벨마다 geohash 자릿수를 정해
+같은 셀의 맛집을 하나의 클러스터로 묶는다.
+
+- 공개 맛집: 자릿수별 셀 집계(place_cells)를 맛집/리뷰 쓰기 시점에 갱신해 두고 그대로 읽는다.
+- 내 비공개 맛집: 조회 시 (user_id, geohash) 인덱스로 즉석 집계해 합친다.
+"""
+from collections import Counter
+
+from sqlalchemy import and_, bindparam, delete, func, or_
+from sqlalchemy.orm import Session
+
+from api.database import upsert
+from api.place.geo import cell_size, covering_cells, cell_ranges
+from api.place.models import Category, Place, PlaceCell, Visibility
+from api.place.schemas import PlaceCluster
+
+PLACES_MIN_ZOOM = 16  # 이 줌 이상에서는 클러스터 대신 개별 맛집 반환
+# 셀 집계를 두는 자릿수 - 6자리가 클러스터를 그리는 마지막 줌(PLACES_MIN_ZOOM - 1)의 자릿수
+CLUSTER_PRECISIONS = range(1, 7)
+
+
+def precision_for_zoom(zoom: int) -> int:
+    """줌 레벨에 맞는 클러스터 geohash 자릿수 (셀 하나가 타일의 1/4 정도가 되도록)"""
+    target_lng_size = 360.0 / (2 ** zoom) / 4
+    for precision in reversed(CLUSTER_PRECISIONS):
+        if cell_size(precision)[1] >= target_lng_size:
+            return precision
+    return CLUSTER_PRECISIONS[0]
+
+
+def _accumulate(
+    deltas: dict[tuple, list],
+    place: Place,
+    place_delta: int,
+    rating_delta: float,
+    review_delta: int
+) -> None:
+    """공개 맛집 하나의 기여분을 셀 키별 변화량에 누적"""
+    if place.visibility != Visibility.PUBLIC or not place.geohash:
+        return
+
+    category = place.category or Category.OTHER
+    for precision in CLUSTER_PRECISIONS:
+        key = (precision, place.geohash[:precision], category)
+        delta = deltas.setdefault(key, [0, 0.0, 0.0, 0.0, 0])
+        delta[0] += place_delta
+        delta[1] += place_delta * place.latitude
+        delta[2] += place_delta * place.longitude
+        delta[3] += rating_delta
+        delta[4] += review_delta
+
+
+def _apply_deltas(db: Session, deltas: dict[tuple, list]) -> None:
+    """누적된 변화량을 셀 집계에 반영 (셀이 많을 수 있어 executemany UPSERT로 처리)"""
+    if not deltas:
+        return
+
+    table = PlaceCell.__table__
+    params = [
+        {
+            "cell_precision": precision, "cell_cell": cell, "cell_category": category,
+            "place_delta": delta[0], "lat_delta": delta[1], "lng_delta": delta[2],
+            "rating_delta": delta[3], "review_delta": delta[4]
+        }
+        for (precision, cell, category), delta in deltas.items()
+    ]
+
+    stmt = upsert(table).values(
+        precision=bindparam("cell_precision"),
+        cell=bindparam("cell_cell"),
+        category=bindparam("cell_category"),
+        place_count=bindparam("place_delta"),
+        latitude_sum=bindparam("lat_delta"),
+        longitude_sum=bindparam("lng_delta"),
+        rating_sum=bindparam("rating_delta"),
+        review_count=bindparam("review_delta")
+    )
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[table.c.precision, table.c.cell, table.c.category],
+            set_={
+                "place_count": table.c.place_count + stmt.excluded.place_count,
+                "latitude_sum": table.c.latitude_sum + stmt.excluded.latitude_sum,
+                "longitude_sum": table.c.longitude_sum + stmt.excluded.longitude_sum,
+                "rating_sum": table.c.rating_sum + stmt.excluded.rating_sum,
+                "review_count": table.c.review_count + stmt.excluded.review_count
+            }
+        ),
+        params
+    )
+
+    # 맛집이 빠진 셀(또는 집계에 없던 셀에 들어간 리뷰 변화량)은 비었으면 지운다
+    emptied = [p for p in params if p["place_delta"] <= 0]
+    if emptied:
+        db.execute(
+            delete(table).where(
+                table.c.precision == bindparam("cell_precision"),
+                table.c.cell == bindparam("cell_cell"),
+                table.c.category == bindparam("cell_category"),
+                table.c.place_count <= 0
+            ),
+            emptied
+        )
+
+
+def _apply(
+    db: Session,
+    place: Place,
+    place_delta: int,
+    rating_delta: float,
+    review_delta: int
+) -> None:
+    """공개 맛집 하나의 기여분을 모든 자릿수의 셀 집계에 반영"""
+    deltas: dict[tuple, list] = {}
+    _accumulate(deltas, place, place_delta, rating_delta, review_delta)
+    _apply_deltas(db, deltas)
+
+
+def add_place(db: Session, place: Place, rating_sum: float = 0.0, review_count: int = 0) -> None:
+    """맛집(과 그 리뷰 합계)을 셀 집계에 추가 - 커밋은 호출자가 한다"""
+    _apply(db, place, 1, rating_sum, review_count)
+
+
+def add_places(db: Session, places: list[Place]) -> None:
+    """리뷰가 없는 새 맛집 여러 개를 한 번에 셀 집계에 추가 - 커밋은 호출자가 한다"""
+    deltas: dict[tuple, list] = {}
+    for place in places:
+        _accumulate(deltas, place, 1, 0.0, 0)
+    _apply_deltas(db, deltas)
+
+
+def remove_place(db: Session, place: Place, rating_sum: float = 0.0, review_count: int = 0) -> None:
+    """맛집(과 그 리뷰 합계)을 셀 집계에서 제거 - 커밋은 호출자가 한다"""
+    _apply(db, place, -1, -rating_sum, -review_count)
+
+
+def apply_review(db: Session, place: Place, rating_delta: float, review_delta: int) -> None:
+    """리뷰 작성/수정/삭제에 따른 평점 합계 변경 반영 - 커밋은 호출자가 한다"""
+    _apply(db, place, 0, rating_delta, review_delta)
+
+
+def rebuild_place_cells(db: Session) -> None:
+    """셀 집계 전체 재계산"""
+    db.query(PlaceCell).delete()
+
+    # 카테고리가 없는 맛집은 OTHER 셀에 합친다 (증분 갱신의 _accumulate와 같은 기준)
+    category = func.coalesce(Place.category, Category.OTHER.name)
+    for precision in CLUSTER_PRECISIONS:
+        cell = func.substr(Place.geohash, 1, precision)
+        rows = db.query(
+            cell.label("cell"),
+            category,
+            func.count(Place.id),
+            func.sum(Place.latitude),
+            func.sum(Place.longitude),
+            func.coalesce(func.sum(Place.rating_sum), 0.0),
+            func.coalesce(func.sum(Place.review_count), 0)
+        ).filter(
+            Place.visibility == Visibility.PUBLIC,
+            Place.geohash.isnot(None)
+        ).group_by(cell, category).all()
+
+        db.add_all(
+            PlaceCell(
+                precision=precision,
+                cell=row[0],
+                category=row[1],
+                place_count=row[2],
+                latitude_sum=row[3],
+                longitude_sum=row[4],
+                rating_sum=row[5],
+                review_count=row[6]
+            )
+            for row in rows
+        )
+    db.commit()
+
+
+def ensure_place_cells(db: Session) -> None:
+    """셀 집계가 비어있는데 공개 맛집이 있으면 재계산 (기존 DB 최초 기동 시)"""
+    if db.query(PlaceCell.cell).first() is not None:
+        return
+    if db.query(Place.id).filter(Place.visibility == Visibility.PUBLIC).first() is None:
+        return
+    rebuild_place_cells(db)
+
+
+def _range_filter(column, ranges: list[tuple[str, str | None]]):
+    terms = []
+    for lo, hi in ranges:
+        if hi is None:
+            terms.append(column >= lo)
+        else:
+            terms.append(and_(column >= lo, column < hi))
+    return or_(*terms)
+
+
+def get_clusters(
+    db: Session,
+    user_id: int,
+    min_lat: float,
+    max_lat: float,
+    min_lng: float,
+    max_lng: float,
+    precision: int,
+    include_public: bool = False
+) -> list[PlaceCluster]:
+    """영역과 겹치는 precision 자리 셀별 클러스터"""
+    prefixes = {c[:precision] for c in covering_cells(min_lat, max_lat, min_lng, max_lng)}
+    ranges = cell_ranges(sorted(prefixes))
+
+    # cell -> [맛집 수, 위도 합, 경도 합, 카테고리별 수, 평점 합, 리뷰 수]
+    acc: dict[str, list] = {}
+
+    def accumulate(cell, category, place_count, lat_sum, lng_sum, rating_sum, review_count):
+        entry = acc.setdefault(cell, [0, 0.0, 0.0, Counter(), 0.0, 0])
+        entry[0] += place_count
+        entry[1] += lat_sum
+        entry[2] += lng_sum
+        entry[3][category or Category.OTHER] += place_count
+        entry[4] += rating_sum or 0.0
+        entry[5] += review_count or 0
+
+    if include_public:
+        cells = db.query(PlaceCell).filter(
+            PlaceCell.precision == precision,
+            _range_filter(PlaceCell.cell, ranges)
+        )
+        for c in cells:
+            accumulate(c.cell, c.category, c.place_count, c.latitude_sum,
+                       c.longitude_sum, c.rating_sum, c.review_count)
+        # 공개 맛집은 셀 집계에 이미 포함됨
+        own_scope = and_(Place.user_id == user_id, Place.visibility != Visibility.PUBLIC)
+    else:
+        own_scope = Place.user_id == user_id
+
+    own_filter = and_(own_scope, _range_filter(Place.geohash, ranges))
+    cell = func.substr(Place.geohash, 1, precision)
+
+    own_places = db.query(
+        cell, Place.category,
+        func.count(Place.id), func.sum(Place.latitude), func.sum(Place.longitude),
+        func.sum(Place.rating_sum), func.sum(Place.review_count)
+    ).filter(own_filter).group_by(cell, Place.category)
+    for row in own_places:
+        accumulate(*row)
+
+    clusters = [
+        PlaceCluster(
+            geohash=cell,
+            count=place_count,
+            latitude=lat_sum / place_count,
+            longitude=lng_sum / place_count,
+            dominant_category=categories.most_common(1)[0][0],
+            avg_rating=round(rating_sum / review_count, 1) if review_count else None
+        )
+        for cell, (place_count, lat_sum, lng_sum, categories, rating_sum, review_count) in acc.items()
+        if place_count > 0
+    ]
+    clusters.sort(key=lambda c: c.count, reverse=True)
+    return clusters
@@ -0,0 +1,98 @@
+"""지도 마커용 압축(컬럼형 바이너리) 응답 형식
+
+마커에는 id/좌표/카테고리/평점 정도만 필요하므로 맛집 행을 필드별 배열로 모으고
+숫자 필드는 리틀 엔디언 고정 폭 배열을 base64로 감싸 보낸다.
+
+    {
+      "format": "compact",
+      "count": 2,
+      "columns": {
+        "id": {"dtype": "u4", "data": "..."},
+        "latitude": {"dtype": "f4", "data": "..."},
+        "category": {"dtype": "u1", "data": "...", "codes": ["korean", ...]},
+        "avg_rating": {"dtype": "u1", "data": "...", "scale": 10},
+        "name": ["김밥천국", "..."]
+      }
+    }
+
+- codes: 값이 코드 표의 위치 (카테고리, 값이 없으면 컬럼 기본값의 코드)
+- scale: 값 / scale이 실제 값이고 0은 null (평점 x10)
+- 배열(list)인 컬럼은 압축하지 않은 문자열 등 그대로의 값
+
+좌표는 float32(경도 127도에서 약 1m 정밀도)로 줄인다. 정수 컬럼은 값이 모두 들어가는
+가장 좁은 폭(u2/u4/u8)을 응답마다 고르므로 클라이언트는 dtype을 보고 읽어야 한다.
+"""
+import base64
+import json
+import sys
+from array import array
+
+from api.place.models import Category, Visibility
+
+DEFAULT_FIELDS = ("id", "latitude", "longitude", "category", "avg_rating")
+
+CATEGORY_CODES = [category.value for category in Category]
+VISIBILITY_CODES = [visibility.value for visibility in Visibility]
+
+# 필드 -> 폭이 좁은 순 (dtype, array 타입 코드, 최댓값) 후보 - 값이 모두 들어가는 첫 후보를 쓴다
+_U2 = ("u2", "H", 2 ** 16 - 1)
+_U4 = ("u4", "I", 2 ** 32 - 1)
+_U8 = ("u8", "Q", 2 ** 64 - 1)
+_NUMERIC = {
+    "id": (_U4, _U8),
+    "user_id": (_U4, _U8),
+    "latitude": (("f4", "f", None),),
+    "longitude": (("f4", "f", None),),
+    "review_count": (_U2, _U4, _U8),
+}
+# 필드 -> (enum 타입, 코드 표, 값이 없을 때 쓸 값 - 모델 컬럼 기본값)
+_CODED = {
+    "category": (Category, CATEGORY_CODES, Category.OTHER),
+    "visibility": (Visibility, VISIBILITY_CODES, Visibility.PUBLIC),
+}
+_RATING_SCALE = 10
+
+
+def _pack(typecode: str, values) -> str:
+    packed = array(typecode, values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return base64.b64encode(packed.tobytes()).decode()
+
+
+def encode(rows: list[dict], fields: list[str]) -> bytes:
+    """PlaceRow 목록 -> 압축 응답 JSON (fields 순서대로 컬럼 구성)"""
+    columns = {}
+    for field in fields:
+        values = [row[field] for row in rows]
+
+        if field in _NUMERIC:
+            largest = max(values, default=0)
+            dtype, typecode, _ = next(
+                (candidate for candidate in _NUMERIC[field] if candidate[2] is None or largest <= candidate[2]),
+                _NUMERIC[field][-1]
+            )
+            columns[field] = {"dtype": dtype, "data": _pack(typecode, values)}
+        elif field in _CODED:
+            enum_type, codes, default = _CODED[field]
+            index = {member: position for position, member in enumerate(enum_type)}
+            index[None] = index[default]
+            columns[field] = {
+                "dtype": "u1",
+                "data": _pack("B", (index[value] for value in values)),
+                "codes": codes,
+            }
+        elif field == "avg_rating":
+            columns[field] = {
+                "dtype": "u1",
+                "data": _pack("B", (round(value * _RATING_SCALE) if value else 0 for value in values)),
+                "scale": _RATING_SCALE,
+            }
+        else:
+            columns[field] = [
+                value.isoformat() if hasattr(value, "isoformat") else value
+                for value in values
+            ]
+
+    payload = {"format": "compact", "count": len(rows), "columns": columns}
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
@@ -0,0 +1,121 @@
+"""중복 등록 맛집 찾기
+
+같은 식당이 이름/좌표가 조금씩 다르게 여러 번 등록되는 경우를 찾는다.
+
+- 후보: 반경 DUPLICATE_RADIUS_M 안의 맛집끼리만 비교한다.
+  단건은 geohash 영역 조회(api.place.service), 일괄은 격자 셀 단위로 묶어
+  자기 셀과 반경이 걸치는 이웃 셀만 본다. (전체 쌍 비교를 하지 않는다)
+- 점수: 소문자로 바꾸고 공백/기호를 뺀 이름의 글자 2-gram Dice 계수
+"""
+from collections import defaultdict
+from typing import Iterable, Iterator, NamedTuple
+
+from sqlalchemy.orm import Session
+
+from api.place.geo import bounding_box, distances_m, grid_cells
+from api.place.models import Place, Visibility
+
+DUPLICATE_RADIUS_M = 100.0
+MIN_NAME_SIMILARITY = 0.5
+BLOCK_PRECISION = 7  # 약 150m x 150m 셀
+
+
+class Candidate(NamedTuple):
+    id: int
+    name: str
+    user_id: int
+    latitude: float
+    longitude: float
+
+
+def name_ngrams(name: str) -> frozenset[str]:
+    """이름의 글자 2-gram 집합 (한 글자 이름은 그 글자)"""
+    normalized = "".join(ch for ch in name.lower() if ch.isalnum())
+    if len(normalized) < 2:
+        return frozenset([normalized]) if normalized else frozenset()
+    return frozenset(normalized[i:i + 2] for i in range(len(normalized) - 1))
+
+
+def name_similarity(a: frozenset[str], b: frozenset[str]) -> float:
+    """2-gram 집합의 Dice 계수"""
+    if not a or not b:
+        return 0.0
+    return 2 * len(a & b) / (len(a) + len(b))
+
+
+def match_candidates(
+    name: str,
+    lat: float,
+    lng: float,
+    candidates: list[Candidate],
+    radius_m: float = DUPLICATE_RADIUS_M,
+    min_similarity: float = MIN_NAME_SIMILARITY
+) -> list[tuple[Candidate, float, float]]:
+    """후보 중 반경 안에서 이름이 비슷한 것 - (후보, 거리, 유사도), 유사도 높은 순"""
+    grams = name_ngrams(name)
+    distances = distances_m(lat, lng, [(c.latitude, c.longitude) for c in candidates])
+
+    matches = []
+    for candidate, distance in zip(candidates, distances):
+        if distance > radius_m:
+            continue
+        similarity = name_similarity(grams, name_ngrams(candidate.name))
+        if similarity >= min_similarity:
+            matches.append((candidate, distance, similarity))
+    matches.sort(key=lambda match: (-match[2], match[1], match[0].id))
+    return matches
+
+
+def _block(lat: float, lng: float) -> tuple[int, int]:
+    return grid_cells(lat, lat, lng, lng, BLOCK_PRECISION)[0]
+
+
+def iter_duplicate_pairs(
+    places: Iterable[Candidate],
+    radius_m: float = DUPLICATE_RADIUS_M,
+    min_similarity: float = MIN_NAME_SIMILARITY
+) -> Iterator[tuple[Candidate, Candidate, float, float]]:
+    """맛집 목록에서 중복 후보 쌍 (a.id < b.id, 거리, 유사도)
+
+    격자 셀별로 나눈 뒤 각 맛집의 반경 영역과 겹치는 셀 안에서만 비교한다.
+    """
+    blocks: dict[tuple[int, int], list[tuple[Candidate, frozenset[str]]]] = defaultdict(list)
+    for place in places:
+        blocks[_block(place.latitude, place.longitude)].append((place, name_ngrams(place.name)))
+
+    radius_km = radius_m / 1000.0
+    for entries in blocks.values():
+        for place, grams in entries:
+            neighbors = [
+                (other, other_grams)
+                for key in grid_cells(*bounding_box(place.latitude, place.longitude, radius_km), BLOCK_PRECISION)
+                for other, other_grams in blocks.get(key, ())
+                if other.id > place.id
+            ]
+            # 이름 유사도를 먼저 걸러 거리 계산 대상을 줄인다
+            similar = [
+                (other, similarity) for other, other_grams in neighbors
+                if (similarity := name_similarity(grams, other_grams)) >= min_similarity
+            ]
+            if not similar:
+                continue
+            distances = distances_m(
+                place.latitude, place.longitude,
+                [(other.latitude, other.longitude) for other, _ in similar]
+            )
+            for (other, similarity), distance in zip(similar, distances):
+                if distance <= radius_m:
+                    yield place, other, distance, similarity
+
+
+def find_public_duplicates(
+    db: Session,
+    radius_m: float = DUPLICATE_RADIUS_M,
+    min_similarity: float = MIN_NAME_SIMILARITY
+) -> Iterator[tuple[Candidate, Candidate, float, float]]:
+    """전체 공개 맛집의 중복 후보 쌍 (일괄 점검용)"""
+    rows = db.query(
+        Place.id, Place.name, Place.user_id, Place.latitude, Place.longitude
+    ).filter(Place.visibility == Visibility.PUBLIC).yield_per(1000)
+    places = [Candidate(*row) for row in rows]
+    return iter_duplicate_pairs(places, radius_m, min_similarity)
@@ -0,0 +1,193 @@
+"""위치 관련 유틸리티
+
+geohash는 위도/경도를 base32 문자열로 인코딩한 값으로, 앞자리(prefix)가 같으면
+같은 격자 셀에 속한다. 따라서 "셀 안의 맛집"은 문자열 범위 조회 한 번으로 찾을 수 있다.
+"""
+import math
+
+EARTH_RADIUS_KM = 6371.0088
+GEOHASH_PRECISION = 9  # 약 4.8m x 4.8m 셀
+MAX_COVERING_CELLS = 32
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+_BASE32_INDEX = {c: i for i, c in enumerate(_BASE32)}
+
+
+def encode_geohash(lat: float, lng: float, precision: int = GEOHASH_PRECISION) -> str:
+    """위도/경도를 geohash 문자열로 변환"""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True  # 짝수 번째 비트는 경도
+
+    while len(chars) < precision:
+        if even:
+            mid = (lng_range[0] + lng_range[1]) / 2
+            if lng >= mid:
+                bits = (bits << 1) | 1
+                lng_range[0] = mid
+            else:
+                bits <<= 1
+                lng_range[1] = mid
+        else:
+            mid = (lat_range[0] + lat_range[1]) / 2
+            if lat >= mid:
+                bits = (bits << 1) | 1
+                lat_range[0] = mid
+            else:
+                bits <<= 1
+                lat_range[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+
+    return "".join(chars)
+
+
+def cell_size(precision: int) -> tuple[float, float]:
+    """precision 자리 geohash 셀의 (위도 크기, 경도 크기) - 단위: 도"""
+    total_bits = precision * 5
+    lng_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lng_bits)
+
+
+def cell_bounds(lat: float, lng: float, precision: int) -> tuple[float, float, float, float]:
+    """좌표가 속한 precision 자리 geohash 셀의 (min_lat, max_lat, min_lng, max_lng)"""
+    lat_size, lng_size = cell_size(precision)
+    min_lat = -90.0 + min(int((lat + 90.0) // lat_size), round(180.0 / lat_size) - 1) * lat_size
+    min_lng = -180.0 + min(int((lng + 180.0) // lng_size), round(360.0 / lng_size) - 1) * lng_size
+    return min_lat, min_lat + lat_size, min_lng, min_lng + lng_size
+
+
+def _grid_span(
+    min_lat: float,
+    max_lat: float,
+    min_lng: float,
+    max_lng: float,
+    precision: int
+) -> tuple[range, range]:
+    """영역을 덮는 precision 격자의 (위도 인덱스 범위, 경도 인덱스 범위)"""
+    lat_size, lng_size = cell_size(precision)
+    lat_cells = round(180.0 / lat_size)
+    lng_cells = round(360.0 / lng_size)
+
+    lat_start = min(int((min_lat + 90.0) // lat_size), lat_cells - 1)
+    lat_end = min(int((max_lat + 90.0) // lat_size), lat_cells - 1)
+    lng_start = min(int((min_lng + 180.0) // lng_size), lng_cells - 1)
+    lng_end = min(int((max_lng + 180.0) // lng_size), lng_cells - 1)
+    return range(lat_start, lat_end + 1), range(lng_start, lng_end + 1)
+
+
+def grid_cells(
+    min_lat: float,
+    max_lat: float,
+    min_lng: float,
+    max_lng: float,
+    precision: int
+) -> list[tuple[int, int]]:
+    """영역과 겹치는 precision 격자 셀의 (위도 인덱스, 경도 인덱스) 목록"""
+    lat_span, lng_span = _grid_span(min_lat, max_lat, min_lng, max_lng, precision)
+    return [(i, j) for i in lat_span for j in lng_span]
+
+
+def covering_cells(
+    min_lat: float,
+    max_lat: float,
+    min_lng: float,
+    max_lng: float,
+    max_cells: int = MAX_COVERING_CELLS
+) -> list[str]:
+    """영역을 덮는 geohash 셀 목록 (셀 개수가 max_cells 이하인 가장 세밀한 precision)"""
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        lat_span, lng_span = _grid_span(min_lat, max_lat, min_lng, max_lng, precision)
+        if len(lat_span) * len(lng_span) <= max_cells or precision == 1:
+            break
+
+    lat_size, lng_size = cell_size(precision)
+    cells = set()
+    for i in lat_span:
+        for j in lng_span:
+            # 셀 중심점으로 인코딩하면 해당 셀의 geohash가 된다
+            center_lat = -90.0 + (i + 0.5) * lat_size
+            center_lng = -180.0 + (j + 0.5) * lng_size
+            cells.add(encode_geohash(center_lat, center_lng, precision))
+    return sorted(cells)
+
+
+def _next_prefix(prefix: str) -> str | None:
+    """같은 길이에서 사전순으로 바로 다음 geohash (없으면 None)"""
+    chars = list(prefix)
+    for pos in range(len(chars) - 1, -1, -1):
+        index = _BASE32_INDEX[chars[pos]]
+        if index < len(_BASE32) - 1:
+            chars[pos] = _BASE32[index + 1]
+            return "".join(chars[:pos + 1]) + _BASE32[0] * (len(chars) - pos - 1)
+        chars[pos] = _BASE32[0]
+    return None
+
+
+def cell_ranges(cells: list[str]) -> list[tuple[str, str | None]]:
+    """셀 목록을 geohash 문자열 범위 [lo, hi) 목록으로 변환 (연속된 셀은 병합)"""
+    ranges: list[tuple[str, str | None]] = []
+    for cell in sorted(cells):
+        hi = _next_prefix(cell)
+        if ranges and ranges[-1][1] == cell:
+            ranges[-1] = (ranges[-1][0], hi)
+        else:
+            ranges.append((cell, hi))
+    return ranges
+
+
+def bounding_box(lat: float, lng: float, radius_km: float) -> tuple[float, float, float, float]:
+    """중심점/반경의 원을 덮는 (min_lat, max_lat, min_lng, max_lng)
+
+    극점을 포함하거나 날짜변경선(±180°)을 넘는 원은 경도 전체 범위로 넓힌다.
+    """
+    angular_radius = radius_km / EARTH_RADIUS_KM
+    lat_delta = math.degrees(angular_radius)
+    min_lat = lat - lat_delta
+    max_lat = lat + lat_delta
+
+    if min_lat <= -90.0 or max_lat >= 90.0:
+        return max(min_lat, -90.0), min(max_lat, 90.0), -180.0, 180.0
+
+    # 원의 경도 방향 최대 폭: asin(sin(r) / cos(lat))
+    ratio = math.sin(angular_radius) / math.cos(math.radians(lat))
+    if ratio >= 1.0:
+        return min_lat, max_lat, -180.0, 180.0
+
+    lng_delta = math.degrees(math.asin(ratio))
+    min_lng = lng - lng_delta
+    max_lng = lng + lng_delta
+    if min_lng < -180.0 or max_lng > 180.0:
+        return min_lat, max_lat, -180.0, 180.0
+    return min_lat, max_lat, min_lng, max_lng
+
+
+def distances_m(
+    lat: float,
+    lng: float,
+    coords: list[tuple[float, float]]
+) -> list[float]:
+    """기준점에서 각 좌표까지의 대원 거리(haversine, 미터)를 한 번에 계산"""
+    lat_rad = math.radians(lat)
+    cos_lat = math.cos(lat_rad)
+    radius_m = EARTH_RADIUS_KM * 1000.0
+
+    result = []
+    for other_lat, other_lng in coords:
+        other_lat_rad = math.radians(other_lat)
+        d_lat = other_lat_rad - lat_rad
+        d_lng = math.radians(other_lng - lng)
+        h = (
+            math.sin(d_lat / 2) ** 2
+            + cos_lat * math.cos(other_lat_rad) * math.sin(d_lng / 2) ** 2
+        )
+        result.append(2 * radius_m * math.asin(min(1.0, math.sqrt(h))))
+    return result
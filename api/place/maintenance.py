@@ -0,0 +1,81 @@
+"""맛집 데이터 관리 명령
+
+사용법:
+    python -m api.place.maintenance repair-ratings     # 평점 집계 재계산
+    python -m api.place.maintenance rebuild-clusters   # 클러스터 셀 집계 재계산
+    python -m api.place.maintenance rebuild-search     # 키워드 검색 인덱스 재색인
+    python -m api.place.maintenance rebuild-tags       # 정규화 태그 행 재생성
+    python -m api.place.maintenance find-duplicates    # 공개 맛집 중복 후보 출력 (JSON Lines)
+"""
+import argparse
+import json
+import sys
+
+from api.database import SessionLocal, init_db
+from api.auth import models as _auth_models  # noqa: F401 - 관계 매핑용 모델 등록
+from api.place import cluster, duplicates, search_index, service
+from api.recommend import models as _recommend_models  # noqa: F401
+
+
+def repair_ratings() -> None:
+    with SessionLocal() as db:
+        updated = service.repair_rating_aggregates(db)
+    print(f"평점 집계 재계산 완료: {updated}개 맛집")
+
+
+def rebuild_clusters() -> None:
+    with SessionLocal() as db:
+        cluster.rebuild_place_cells(db)
+    print("클러스터 셀 집계 재계산 완료")
+
+
+def rebuild_search() -> None:
+    if not search_index.init_search_index():
+        print("검색 인덱스를 사용할 수 없는 DB입니다")
+        return
+    search_index.rebuild_search_index()
+    print("키워드 검색 인덱스 재색인 완료")
+
+
+def rebuild_tags() -> None:
+    with SessionLocal() as db:
+        count = service.rebuild_place_tags(db)
+    print(f"태그 재생성 완료: {count}개 맛집")
+
+
+def find_duplicates() -> None:
+    count = 0
+    with SessionLocal() as db:
+        for place, other, distance, similarity in duplicates.find_public_duplicates(db):
+            print(json.dumps({
+                "place_id": place.id,
+                "place_name": place.name,
+                "duplicate_id": other.id,
+                "duplicate_name": other.name,
+                "distance_m": round(distance, 1),
+                "similarity": round(similarity, 3),
+            }, ensure_ascii=False))
+            count += 1
+    print(f"중복 후보: {count}쌍", file=sys.stderr)
+
+
+COMMANDS = {
+    "repair-ratings": repair_ratings,
+    "rebuild-clusters": rebuild_clusters,
+    "rebuild-search": rebuild_search,
+    "rebuild-tags": rebuild_tags,
+    "find-duplicates": find_duplicates,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="TasteMap 맛집 데이터 관리")
+    parser.add_argument("command", choices=COMMANDS.keys())
+    args = parser.parse_args()
+
+    init_db()
+    COMMANDS[args.command]()
+
+
+if __name__ == "__main__":
+    main()
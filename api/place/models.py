@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -25,6 +25,17 @@ class Visibility(str, enum.Enum):
 
 class Place(Base):
     __tablename__ = "places"
+    __table_args__ = (
+        # 지도 영역/주변 조회: 소유자 또는 공개 범위 + geohash 범위 조회
+        Index("ix_places_user_geohash", "user_id", "geohash"),
+        Index("ix_places_visibility_geohash", "visibility", "geohash"),
+        # 평점 필터/정렬
+        Index("ix_places_user_avg_rating", "user_id", "avg_rating"),
+        # 목록 정렬 (커서 페이지네이션)
+        Index("ix_places_user_created_at", "user_id", "created_at"),
+        Index("ix_places_user_name", "user_id", "name"),
+        Index("ix_places_user_visited_at", "user_id", "visited_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -36,15 +47,21 @@ class Place(Base):
     latitude = Column(Float, nullable=False)
     longitude = Column(Float, nullable=False)
     address = Column(String(500))
+    geohash = Column(String(12))  # 공간 인덱스용 키 (api.place.geo 참고)
 
     # 추가 정보
     memo = Column(Text)
-    tags = Column(String(500))  # 쉼표로 구분된 태그
+    tags = Column(String(500))  # 쉼표로 구분된 태그 (검색용 정규화 사본: PlaceTag)
     visited_at = Column(DateTime(timezone=True))
 
     # 공개 범위
     visibility = Column(SQLEnum(Visibility), default=Visibility.PUBLIC)
 
+    # 평점 집계 (리뷰 작성/수정/삭제 시 api.review.service에서 갱신)
+    rating_sum = Column(Float, default=0.0)
+    review_count = Column(Integer, default=0)
+    avg_rating = Column(Float, index=True)
+
     # 타임스탬프
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -52,3 +69,47 @@ class Place(Base):
     # 관계
     user = relationship("User", back_populates="places")
     reviews = relationship("Review", back_populates="place", cascade="all, delete-orphan")
+    tag_entries = relationship("PlaceTag", cascade="all, delete-orphan")
+
+
+class PlaceTag(Base):
+    """맛집 태그 (Place.tags를 태그 하나당 한 행으로 정규화 - 태그 필터/집계용)
+
+    Place.tags가 원본이며 맛집 쓰기 시점에 api.place.service에서 동기화한다.
+    """
+    __tablename__ = "place_tags"
+    __table_args__ = (
+        Index("ix_place_tags_tag_place", "tag", "place_id"),
+    )
+
+    place_id = Column(Integer, ForeignKey("places.id", ondelete="CASCADE"), primary_key=True)
+    tag = Column(String(50), primary_key=True)
+
+
+class PlaceCell(Base):
+    """공개 맛집의 geohash 셀별 집계 (지도 클러스터용)
+
+    precision 자리 geohash 셀 x 카테고리마다 맛집 수, 좌표 합, 리뷰 평점 합을 쌓아두고
+    맛집/리뷰 쓰기 시점에 증감한다. (api.place.cluster 참고)
+    """
+    __tablename__ = "place_cells"
+
+    precision = Column(Integer, primary_key=True)
+    cell = Column(String(12), primary_key=True)
+    category = Column(SQLEnum(Category), primary_key=True)
+
+    place_count = Column(Integer, nullable=False, default=0)
+    latitude_sum = Column(Float, nullable=False, default=0.0)
+    longitude_sum = Column(Float, nullable=False, default=0.0)
+    rating_sum = Column(Float, nullable=False, default=0.0)
+    review_count = Column(Integer, nullable=False, default=0)
+
+
+class TileVersion(Base):
+    """지도 타일(z/x/y)별 데이터 버전 - 타일 안의 맛집/리뷰가 바뀔 때마다 증가 (ETag용)"""
+    __tablename__ = "tile_versions"
+
+    z = Column(Integer, primary_key=True)
+    x = Column(Integer, primary_key=True)
+    y = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
@@ -1,23 +1,43 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from api.database import get_db
 from api.auth.models import User
 from api.auth.dependencies import get_current_user
 from api.place.models import Category, Visibility
-from api.place.schemas import PlaceCreate, PlaceUpdate, PlaceResponse, PlaceListResponse
-from api.place import service
+from api.place.schemas import (
+    PlaceCreate,
+    PlaceUpdate,
+    PlaceResponse,
+    PlaceDetailResponse,
+    PlaceCreateResponse,
+    PlaceDuplicate,
+    PlaceListResponse,
+    PlaceClusterResponse,
+    PlaceFacetsResponse,
+    FacetCount,
+    PlaceImportResponse,
+    place_list_json,
+    place_rows_json,
+)
+from api.place import service, cluster, compact, tiles
 
 router = APIRouter(prefix="/places", tags=["places"])
 
 
-@router.post("", response_model=PlaceResponse, status_code=status.HTTP_201_CREATED)
+def _json(adapter, value) -> Response:
+    """목록 응답을 response_model 재검증 없이 바로 JSON으로 직렬화 (스키마 문서는 response_model 기준)"""
+    return Response(content=adapter.dump_json(value), media_type="application/json")
+
+
+@router.post("", response_model=PlaceCreateResponse, status_code=status.HTTP_201_CREATED)
 def create_place(
     place_data: PlaceCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """맛집 등록"""
+    """맛집 등록 (근처에 이름이 비슷한 맛집이 있으면 duplicates로 알려준다)"""
     place = service.create_place(db, current_user.id, place_data)
     return place
 
@@ -26,12 +46,16 @@ def create_place(
 def get_my_places(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: str | None = Query(None),
+    with_total: bool = Query(True),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """내 맛집 목록 조회"""
-    places, total = service.get_user_places(db, current_user.id, skip, limit)
-    return PlaceListResponse(places=places, total=total)
+    """내 맛집 목록 조회 (cursor가 있으면 skip 대신 커서 다음부터)"""
+    places, total, next_cursor = service.get_user_places(
+        db, current_user.id, skip, limit, cursor, with_total
+    )
+    return _json(place_list_json, {"places": places, "total": total, "next_cursor": next_cursor})
 
 
 @router.get("/bounds", response_model=list[PlaceResponse])
@@ -41,14 +65,96 @@ def get_places_in_bounds(
     min_lng: float = Query(..., ge=-180, le=180),
     max_lng: float = Query(..., ge=-180, le=180),
     include_public: bool = Query(False),
+    format: str = Query("json", pattern="^(json|compact)$"),
+    fields: str | None = Query(None, description="쉼표로 구분한 응답 필드 (id는 항상 포함)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """지도 영역 내 맛집 조회"""
+    """지도 영역 내 맛집 조회
+
+    format=compact면 마커용 컬럼형 압축 응답 (api/place/compact.py 참고, 기본 필드는
+    id/좌표/카테고리/평점)을 반환한다.
+    """
+    field_list = _parse_fields(fields)
+    if format == "compact" and field_list is None:
+        field_list = list(compact.DEFAULT_FIELDS)
+
     places = service.get_places_in_bounds(
-        db, current_user.id, min_lat, max_lat, min_lng, max_lng, include_public
+        db, current_user.id, min_lat, max_lat, min_lng, max_lng, include_public, field_list
+    )
+    if format == "compact":
+        return Response(content=compact.encode(places, field_list), media_type="application/json")
+    return _json(place_rows_json, places)
+
+
+def _parse_fields(fields: str | None) -> list[str] | None:
+    if not fields:
+        return None
+    field_list = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in field_list if field not in service.PLACE_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"알 수 없는 필드입니다: {', '.join(unknown)}"
+        )
+    return field_list
+
+
+@router.get("/clusters", response_model=PlaceClusterResponse)
+def get_place_clusters(
+    min_lat: float = Query(..., ge=-90, le=90),
+    max_lat: float = Query(..., ge=-90, le=90),
+    min_lng: float = Query(..., ge=-180, le=180),
+    max_lng: float = Query(..., ge=-180, le=180),
+    zoom: int = Query(..., ge=0, le=22),
+    include_public: bool = Query(False),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """지도 영역 내 맛집 클러스터 조회 (확대 시 개별 맛집)"""
+    if zoom >= cluster.PLACES_MIN_ZOOM:
+        places = service.get_places_in_bounds(
+            db, current_user.id, min_lat, max_lat, min_lng, max_lng, include_public
+        )
+        return PlaceClusterResponse(zoom=zoom, clustered=False, places=places)
+
+    clusters = cluster.get_clusters(
+        db, current_user.id, min_lat, max_lat, min_lng, max_lng,
+        cluster.precision_for_zoom(zoom), include_public
+    )
+    return PlaceClusterResponse(zoom=zoom, clustered=True, clusters=clusters)
+
+
+@router.get("/tiles/{z}/{x}/{y}")
+def get_place_tile(
+    z: int,
+    x: int,
+    y: int,
+    request: Request,
+    include_public: bool = Query(False),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """XYZ 타일 단위 맛집/클러스터 조회 (컬럼형 JSON, ETag 캐싱)"""
+    if not tiles.is_valid_tile(z, x, y):
+        raise HTTPException(status_code=400, detail="잘못된 타일 좌표입니다")
+
+    version = tiles.get_tile_version(db, z, x, y)
+    etag = tiles.make_etag(current_user.id, include_public, z, x, y, version)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, no-cache",
+        "Vary": "Authorization",
+    }
+
+    if tiles.etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    body = tiles.tile_cache.get_or_compute(
+        (current_user.id, include_public, z, x, y, version),
+        lambda: service.render_tile(db, current_user.id, z, x, y, include_public)
     )
-    return places
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get("/nearby", response_model=list[PlaceResponse])
@@ -57,14 +163,31 @@ def get_nearby_places(
     lng: float = Query(..., ge=-180, le=180),
     radius_km: float = Query(1.0, ge=0.1, le=50),
     include_public: bool = Query(False),
+    limit: int = Query(100, ge=1, le=100),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """내 위치 기반 주변 맛집 조회"""
+    """내 위치 기반 주변 맛집 조회 (가까운 순)"""
     places = service.get_places_nearby(
-        db, current_user.id, lat, lng, radius_km, include_public
+        db, current_user.id, lat, lng, radius_km, include_public, limit
+    )
+    return _json(place_rows_json, places)
+
+
+@router.get("/knn", response_model=list[PlaceResponse])
+def get_nearest_places(
+    lat: float = Query(..., ge=-90, le=90),
+    lng: float = Query(..., ge=-180, le=180),
+    k: int = Query(20, ge=1, le=100),
+    include_public: bool = Query(False),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """내 위치에서 가장 가까운 맛집 k개 조회 (가까운 순)"""
+    places = service.get_nearest_places(
+        db, current_user.id, lat, lng, k, include_public
     )
-    return places
+    return _json(place_rows_json, places)
 
 
 @router.get("/search", response_model=PlaceListResponse)
@@ -73,26 +196,169 @@ def search_places(
     category: Category | None = Query(None),
     min_rating: float | None = Query(None, ge=1, le=5),
     only_mine: bool = Query(True),
-    sort_by: str = Query("created_at", regex="^(created_at|name|visited_at)$"),
+    tags_any: str | None = Query(None, description="쉼표로 구분한 태그 중 하나라도 있는 맛집"),
+    tags_all: str | None = Query(None, description="쉼표로 구분한 태그가 모두 있는 맛집"),
+    sort_by: str = Query("created_at", pattern="^(created_at|name|visited_at|relevance|rating|distance)$"),
+    lat: float | None = Query(None, ge=-90, le=90, description="sort_by=distance 기준점"),
+    lng: float | None = Query(None, ge=-180, le=180, description="sort_by=distance 기준점"),
+    radius_km: float = Query(service.SEARCH_DISTANCE_RADIUS_KM, ge=0.1, le=50),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: str | None = Query(None),
+    with_total: bool = Query(True),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """맛집 검색/필터"""
-    places, total = service.search_places(
-        db, current_user.id, keyword, category, min_rating, only_mine, sort_by, skip, limit
+    """맛집 검색/필터 (cursor가 있으면 skip 대신 커서 다음부터)"""
+    if sort_by == "distance" and (lat is None or lng is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="거리순 정렬에는 lat, lng가 필요합니다"
+        )
+
+    places, total, next_cursor = service.search_places(
+        db, current_user.id, keyword, category, min_rating, only_mine,
+        service.split_tags(tags_any), service.split_tags(tags_all), sort_by,
+        skip, limit, cursor, with_total, lat, lng, radius_km
     )
-    return PlaceListResponse(places=places, total=total)
+    return _json(place_list_json, {"places": places, "total": total, "next_cursor": next_cursor})
 
 
-@router.get("/{place_id}", response_model=PlaceResponse)
+@router.get("/facets", response_model=PlaceFacetsResponse)
+def get_place_facets(
+    keyword: str | None = Query(None),
+    category: Category | None = Query(None),
+    min_rating: float | None = Query(None, ge=1, le=5),
+    only_mine: bool = Query(True),
+    min_lat: float | None = Query(None, ge=-90, le=90),
+    max_lat: float | None = Query(None, ge=-90, le=90),
+    min_lng: float | None = Query(None, ge=-180, le=180),
+    max_lng: float | None = Query(None, ge=-180, le=180),
+    tags_any: str | None = Query(None, description="쉼표로 구분한 태그 중 하나라도 있는 맛집"),
+    tags_all: str | None = Query(None, description="쉼표로 구분한 태그가 모두 있는 맛집"),
+    tag_limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """검색 필터별 개수 (카테고리/평점 구간/상위 태그, 영역은 선택)"""
+    box = _parse_box(min_lat, max_lat, min_lng, max_lng)
+    return service.get_place_facets(
+        db, current_user.id, keyword, category, min_rating, only_mine, box,
+        service.split_tags(tags_any), service.split_tags(tags_all), tag_limit
+    )
+
+
+@router.get("/tags", response_model=list[FacetCount])
+def get_place_tags(
+    only_mine: bool = Query(True),
+    prefix: str | None = Query(None, description="태그 자동완성용 접두어"),
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """태그별 맛집 수 (많은 순)"""
+    return service.get_tag_counts(db, current_user.id, only_mine, prefix, limit)
+
+
+def _parse_box(
+    min_lat: float | None,
+    max_lat: float | None,
+    min_lng: float | None,
+    max_lng: float | None
+) -> tuple[float, float, float, float] | None:
+    """선택적 영역 파라미터 - 네 값을 모두 주거나 모두 생략해야 한다"""
+    values = (min_lat, max_lat, min_lng, max_lng)
+    if all(value is None for value in values):
+        return None
+    if any(value is None for value in values):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="영역은 min_lat, max_lat, min_lng, max_lng를 모두 지정해야 합니다"
+        )
+    return values
+
+
+MAX_BATCH_IDS = 100
+
+
+@router.get("/batch", response_model=list[PlaceResponse])
+def get_places_batch(
+    ids: str = Query(..., description="쉼표로 구분한 맛집 id (최대 100개)"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """맛집 여러 개 조회 (요청 순서 유지, 없거나 접근 권한이 없는 맛집은 제외)"""
+    try:
+        place_ids = [int(place_id) for place_id in ids.split(",") if place_id.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 맛집 id입니다")
+
+    if len(place_ids) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {MAX_BATCH_IDS}개까지 조회할 수 있습니다"
+        )
+
+    places = service.get_places_by_ids(db, current_user.id, place_ids)
+    return _json(place_rows_json, places)
+
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "geojson": "application/geo+json",
+}
+
+
+@router.get("/export")
+def export_places(
+    format: str = Query("ndjson", pattern="^(ndjson|geojson)$"),
+    current_user: User = Depends(get_current_user)
+):
+    """내 맛집 전체 내보내기 (리뷰 포함, 스트리밍)"""
+    return StreamingResponse(
+        service.export_places(current_user.id, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="taste_map_places.{format}"'}
+    )
+
+
+@router.post("/import", response_model=PlaceImportResponse)
+def import_places(
+    file: UploadFile = File(...),
+    format: str | None = Query(None, pattern="^(csv|jsonl)$"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """맛집 일괄 등록 (CSV/JSONL, 형식 생략 시 파일 확장자로 판별)
+
+    행 단위로 검증해 실패한 행은 건너뛰고 행 번호별 오류를 돌려준다.
+    """
+    format = format or service.detect_import_format(file.filename)
+    if format is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="CSV 또는 JSONL 파일만 가져올 수 있습니다"
+        )
+    return service.import_places(db, current_user.id, file.file, format)
+
+
+@router.get("/{place_id}", response_model=PlaceDetailResponse, response_model_exclude_unset=True)
 def get_place(
     place_id: int,
+    include: str | None = Query(None, description="쉼표로 구분: reviews, stats, histogram"),
+    review_limit: int = Query(10, ge=1, le=100),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """맛집 상세 조회"""
+    """맛집 상세 조회 (include로 리뷰 첫 페이지/평점 통계/별점 분포를 함께 조회)"""
+    includes = {item.strip() for item in include.split(",") if item.strip()} if include else set()
+    unknown = includes - service.DETAIL_INCLUDES
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"알 수 없는 include 항목입니다: {', '.join(sorted(unknown))}"
+        )
+
     place = service.get_place_by_id(db, place_id)
     if not place:
         raise HTTPException(status_code=404, detail="맛집을 찾을 수 없습니다")
@@ -101,7 +367,26 @@ def get_place(
     if place.user_id != current_user.id and place.visibility != Visibility.PUBLIC:
         raise HTTPException(status_code=403, detail="접근 권한이 없습니다")
 
-    return service.get_place_response_by_id(db, place_id)
+    return service.get_place_detail(db, place, includes, review_limit)
+
+
+@router.get("/{place_id}/duplicates", response_model=list[PlaceDuplicate])
+def get_place_duplicates(
+    place_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """근처에 이름이 비슷하게 등록된 맛집 (중복 등록 후보)"""
+    place = service.get_place_by_id(db, place_id)
+    if not place:
+        raise HTTPException(status_code=404, detail="맛집을 찾을 수 없습니다")
+
+    if place.user_id != current_user.id and place.visibility != Visibility.PUBLIC:
+        raise HTTPException(status_code=403, detail="접근 권한이 없습니다")
+
+    return service.find_duplicates(
+        db, current_user.id, place.name, place.latitude, place.longitude, exclude_id=place.id
+    )
 
 
 @router.put("/{place_id}", response_model=PlaceResponse)
@@ -1,8 +1,11 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from datetime import datetime
 from typing import Optional
 
+from typing_extensions import TypedDict
+
 from api.place.models import Category, Visibility
+from api.review.schemas import PlaceReviewStats, ReviewResponse
 
 
 class PlaceCreate(BaseModel):
@@ -48,10 +51,106 @@ class PlaceResponse(BaseModel):
     avg_rating: Optional[float] = None
     review_count: int = 0
 
+    # 주변 조회 시 기준점으로부터의 거리
+    distance_m: Optional[float] = None
+
     class Config:
         from_attributes = True
 
 
+class PlaceDuplicate(BaseModel):
+    """중복 등록으로 보이는 맛집"""
+    place_id: int
+    name: str
+    user_id: int
+    distance_m: float
+    similarity: float  # 이름 유사도 (0~1)
+
+
+class PlaceCreateResponse(PlaceResponse):
+    duplicates: list[PlaceDuplicate] = []  # 등록 시점에 근처에서 찾은 비슷한 맛집
+
+
+class PlaceDetailResponse(PlaceResponse):
+    """include로 요청한 항목만 채워진다"""
+    reviews: Optional[list[ReviewResponse]] = None  # 최신 리뷰 첫 페이지
+    reviews_next_cursor: Optional[str] = None  # /reviews/place/{id}?cursor= 로 이어서 조회
+    stats: Optional[PlaceReviewStats] = None
+    histogram: Optional[dict[int, int]] = None  # 별점(정수 부분) -> 리뷰 수
+
+
 class PlaceListResponse(BaseModel):
     places: list[PlaceResponse]
-    total: int
+    total: Optional[int] = None  # with_total=false면 생략
+    next_cursor: Optional[str] = None  # 다음 페이지 요청 시 cursor로 전달
+
+
+class PlaceRow(TypedDict):
+    """목록 응답용 맛집 행 - PlaceResponse와 같은 필드를 ORM 객체/모델 검증 없이 바로 직렬화"""
+    id: int
+    user_id: int
+    name: str
+    category: Category
+    latitude: float
+    longitude: float
+    address: Optional[str]
+    memo: Optional[str]
+    tags: Optional[str]
+    visited_at: Optional[datetime]
+    visibility: Visibility
+    created_at: datetime
+    updated_at: Optional[datetime]
+    avg_rating: Optional[float]
+    review_count: int
+    distance_m: Optional[float]
+
+
+class PlaceListPayload(TypedDict):
+    """PlaceListResponse와 같은 모양의 목록 응답"""
+    places: list[PlaceRow]
+    total: Optional[int]
+    next_cursor: Optional[str]
+
+
+# 목록 응답 JSON 직렬화기 (response_model 재검증을 거치지 않는다)
+place_rows_json = TypeAdapter(list[PlaceRow])
+place_list_json = TypeAdapter(PlaceListPayload)
+
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+
+class PlaceFacetsResponse(BaseModel):
+    total: int  # 모든 조건을 만족하는 맛집 수
+    categories: dict[str, int]  # 카테고리 -> 맛집 수 (카테고리 조건 제외)
+    ratings: dict[str, int]  # 평균 평점 구간("5"~"1", 리뷰 없음은 "none") -> 맛집 수 (최소 평점 조건 제외)
+    tags: list[FacetCount]  # 많이 쓰인 태그 순
+
+
+class PlaceCluster(BaseModel):
+    geohash: str  # 클러스터 셀
+    count: int
+    latitude: float  # 무게중심
+    longitude: float
+    dominant_category: Category
+    avg_rating: Optional[float] = None
+
+
+class PlaceClusterResponse(BaseModel):
+    zoom: int
+    clustered: bool  # False면 places에 개별 맛집
+    clusters: list[PlaceCluster] = []
+    places: list[PlaceResponse] = []
+
+
+class PlaceImportError(BaseModel):
+    row: int  # 파일 내 행 번호 (CSV는 헤더 다음 행이 1)
+    errors: list[str]
+
+
+class PlaceImportResponse(BaseModel):
+    imported: int
+    failed: int
+    errors: list[PlaceImportError] = []  # 최대 IMPORT_MAX_REPORTED_ERRORS개
@@ -0,0 +1,126 @@
+"""맛집 키워드 검색용 전문 검색 인덱스 (SQLite FTS5, trigram 토크나이저)
+
+places_fts 가상 테이블에 맛집 이름/메모/태그와 리뷰 내용을 담는다. (rowid = 맛집 id)
+trigram 토크나이저라 한글 상호의 일부("김밥천" 등)도 부분 일치로 찾을 수 있으며,
+places/reviews 테이블의 트리거로 동기화되므로 서비스 코드는 신경 쓸 필요가 없다.
+
+trigram은 3글자 이상만 색인되므로 더 짧은 키워드는 기존 LIKE 검색을 쓴다.
+SQLite가 아니거나 FTS5 trigram을 지원하지 않으면 비활성화된다.
+"""
+import logging
+
+from sqlalchemy import column, func, literal_column, select, table, text
+from sqlalchemy.exc import OperationalError
+
+from api.database import engine
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "places_fts"
+MIN_KEYWORD_LENGTH = 3
+
+# bm25 컬럼 가중치: name, memo, tags, reviews
+BM25_WEIGHTS = (10.0, 2.0, 5.0, 1.0)
+
+_REVIEWS_OF = """(
+    SELECT coalesce(group_concat(content, ' '), '') FROM reviews WHERE place_id = {place_id}
+)"""
+
+_DDL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE}
+        USING fts5(name, memo, tags, reviews, tokenize='trigram')""",
+
+    f"""CREATE TRIGGER IF NOT EXISTS places_fts_ai AFTER INSERT ON places BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, name, memo, tags, reviews)
+        VALUES (new.id, new.name, coalesce(new.memo, ''), coalesce(new.tags, ''), '');
+    END""",
+
+    f"""CREATE TRIGGER IF NOT EXISTS places_fts_au AFTER UPDATE OF name, memo, tags ON places BEGIN
+        UPDATE {FTS_TABLE}
+        SET name = new.name, memo = coalesce(new.memo, ''), tags = coalesce(new.tags, '')
+        WHERE rowid = new.id;
+    END""",
+
+    f"""CREATE TRIGGER IF NOT EXISTS places_fts_ad AFTER DELETE ON places BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = old.id;
+    END""",
+
+    f"""CREATE TRIGGER IF NOT EXISTS reviews_fts_ai AFTER INSERT ON reviews BEGIN
+        UPDATE {FTS_TABLE} SET reviews = {_REVIEWS_OF.format(place_id="new.place_id")}
+        WHERE rowid = new.place_id;
+    END""",
+
+    f"""CREATE TRIGGER IF NOT EXISTS reviews_fts_au AFTER UPDATE OF content ON reviews BEGIN
+        UPDATE {FTS_TABLE} SET reviews = {_REVIEWS_OF.format(place_id="new.place_id")}
+        WHERE rowid = new.place_id;
+    END""",
+
+    f"""CREATE TRIGGER IF NOT EXISTS reviews_fts_ad AFTER DELETE ON reviews BEGIN
+        UPDATE {FTS_TABLE} SET reviews = {_REVIEWS_OF.format(place_id="old.place_id")}
+        WHERE rowid = old.place_id;
+    END""",
+]
+
+_REBUILD = [
+    f"DELETE FROM {FTS_TABLE}",
+    f"""INSERT INTO {FTS_TABLE}(rowid, name, memo, tags, reviews)
+        SELECT id, name, coalesce(memo, ''), coalesce(tags, ''),
+               {_REVIEWS_OF.format(place_id="places.id")}
+        FROM places""",
+]
+
+_enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def init_search_index() -> bool:
+    """가상 테이블/트리거 생성 (최초 생성 시 기존 데이터 색인)"""
+    global _enabled
+    if engine.dialect.name != "sqlite":
+        return False
+
+    try:
+        with engine.begin() as conn:
+            exists = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {"name": FTS_TABLE}
+            ).first() is not None
+            for statement in _DDL:
+                conn.execute(text(statement))
+            if not exists:
+                for statement in _REBUILD:
+                    conn.execute(text(statement))
+    except OperationalError as e:
+        logger.warning(f"FTS5 trigram 검색 인덱스를 사용할 수 없습니다: {e}")
+        return False
+
+    _enabled = True
+    return True
+
+
+def rebuild_search_index() -> None:
+    """검색 인덱스 전체 재색인"""
+    with engine.begin() as conn:
+        for statement in _REBUILD:
+            conn.execute(text(statement))
+
+
+def can_search(keyword: str) -> bool:
+    """키워드를 전문 검색 인덱스로 처리할 수 있는지"""
+    return _enabled and len(keyword.strip()) >= MIN_KEYWORD_LENGTH
+
+
+def match_subquery(keyword: str):
+    """키워드와 일치하는 (place_id, rank) 서브쿼리 - rank는 작을수록 관련도 높음"""
+    fts = table(FTS_TABLE, column("rowid"))
+    fts_column = literal_column(FTS_TABLE)
+    # 구문(phrase) 검색으로 감싸 FTS 쿼리 문법 문자를 무력화
+    phrase = '"' + keyword.strip().replace('"', '""') + '"'
+
+    return select(
+        fts.c.rowid.label("place_id"),
+        func.bm25(fts_column, *BM25_WEIGHTS).label("rank")
+    ).select_from(fts).where(fts_column.op("MATCH")(phrase)).subquery()
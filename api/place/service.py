@@ -1,18 +1,41 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func, or_
+import csv
+import heapq
+import io
+import json
+from typing import BinaryIO, Iterator
 
-from api.place.models import Place, Visibility
-from api.place.schemas import PlaceCreate, PlaceUpdate, PlaceResponse
-from api.review.models import Review
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import Integer, and_, cast, func, insert, literal, or_, select
 
+from api import cache
+from api.database import SessionLocal
+from api.pagination import decode_cursor, encode_cursor, paginate, sort_key_column
+from api.place import cluster, duplicates, search_index, tiles
+from api.place.geo import encode_geohash, covering_cells, cell_ranges, bounding_box, distances_m
+from api.place.models import Category, Place, PlaceTag, Visibility
+from api.place.spatial_index import spatial_index
+from api.place.schemas import (
+    PlaceCreate,
+    PlaceUpdate,
+    PlaceResponse,
+    PlaceDetailResponse,
+    PlaceCreateResponse,
+    PlaceDuplicate,
+    PlaceFacetsResponse,
+    FacetCount,
+    PlaceRow,
+    PlaceImportError,
+    PlaceImportResponse,
+)
+from api.review.models import Review
+from api.review.schemas import PlaceReviewStats
 
-def _enrich_place_with_stats(db: Session, place: Place) -> PlaceResponse:
-    """Place에 avg_rating, review_count 추가"""
-    stats = db.query(
-        func.avg(Review.rating).label("avg_rating"),
-        func.count(Review.id).label("review_count")
-    ).filter(Review.place_id == place.id).first()
 
+def _to_response(place: Place) -> PlaceResponse:
+    """Place -> PlaceResponse (평점 집계는 Place에 비정규화되어 있다)"""
     return PlaceResponse(
         id=place.id,
         user_id=place.user_id,
@@ -27,83 +50,414 @@ def _enrich_place_with_stats(db: Session, place: Place) -> PlaceResponse:
         visibility=place.visibility,
         created_at=place.created_at,
         updated_at=place.updated_at,
-        avg_rating=round(stats.avg_rating, 1) if stats.avg_rating else None,
-        review_count=stats.review_count or 0
+        avg_rating=round(place.avg_rating, 1) if place.avg_rating else None,
+        review_count=place.review_count or 0
     )
 
 
-def _enrich_places_with_stats(db: Session, places: list[Place]) -> list[PlaceResponse]:
-    """여러 Place에 avg_rating, review_count 추가"""
-    if not places:
-        return []
+# 목록 조회용 컬럼 - ORM 객체 대신 튜플로 읽어 PlaceRow로 바로 직렬화한다
+PLACE_ROW_COLUMNS = (
+    Place.id, Place.user_id, Place.name, Place.category, Place.latitude, Place.longitude,
+    Place.address, Place.memo, Place.tags, Place.visited_at, Place.visibility,
+    Place.created_at, Place.updated_at, Place.avg_rating,
+    func.coalesce(Place.review_count, 0).label("review_count"),
+)
+_PLACE_ROW_KEYS = tuple(column.key for column in PLACE_ROW_COLUMNS)
+_PLACE_ROW_COLUMN_MAP = dict(zip(_PLACE_ROW_KEYS, PLACE_ROW_COLUMNS))
+PLACE_FIELDS = frozenset(_PLACE_ROW_KEYS)
 
-    place_ids = [p.id for p in places]
 
-    # 한 번의 쿼리로 모든 통계 조회
-    stats = db.query(
-        Review.place_id,
-        func.avg(Review.rating).label("avg_rating"),
-        func.count(Review.id).label("review_count")
-    ).filter(Review.place_id.in_(place_ids)).group_by(Review.place_id).all()
+def _projection(fields: list[str] | None) -> tuple[tuple[str, ...], tuple]:
+    """조회할 필드 -> (키, 컬럼) - 지정하면 id는 항상 포함"""
+    if fields is None:
+        return _PLACE_ROW_KEYS, PLACE_ROW_COLUMNS
+    keys = ("id",) + tuple(field for field in dict.fromkeys(fields) if field != "id")
+    return keys, tuple(_PLACE_ROW_COLUMN_MAP[key] for key in keys)
 
-    stats_map = {s.place_id: (s.avg_rating, s.review_count) for s in stats}
 
+def _to_rows(rows, keys: tuple[str, ...] = _PLACE_ROW_KEYS) -> list[PlaceRow]:
+    """PLACE_ROW_COLUMNS(또는 그 일부) 조회 결과 -> PlaceRow 목록"""
+    full = keys is _PLACE_ROW_KEYS
+    has_rating = "avg_rating" in keys
     result = []
-    for place in places:
-        avg_rating, review_count = stats_map.get(place.id, (None, 0))
-        result.append(PlaceResponse(
-            id=place.id,
-            user_id=place.user_id,
-            name=place.name,
-            category=place.category,
-            latitude=place.latitude,
-            longitude=place.longitude,
-            address=place.address,
-            memo=place.memo,
-            tags=place.tags,
-            visited_at=place.visited_at,
-            visibility=place.visibility,
-            created_at=place.created_at,
-            updated_at=place.updated_at,
-            avg_rating=round(avg_rating, 1) if avg_rating else None,
-            review_count=review_count or 0
-        ))
+    for row in rows:
+        item = dict(zip(keys, row))
+        if has_rating:
+            avg_rating = item["avg_rating"]
+            item["avg_rating"] = round(avg_rating, 1) if avg_rating else None
+        if full:
+            item["distance_m"] = None
+        result.append(item)
     return result
 
 
-def create_place(db: Session, user_id: int, place_data: PlaceCreate) -> PlaceResponse:
+MAX_TAG_LENGTH = 50
+
+
+def normalize_tag(tag: str) -> str:
+    """태그 비교용 정규화 (앞뒤 공백/# 제거, 소문자)"""
+    return tag.strip().lstrip("#").strip().lower()[:MAX_TAG_LENGTH]
+
+
+def split_tags(tags: str | None) -> list[str]:
+    """쉼표로 구분된 태그 문자열 -> 정규화된 태그 목록 (빈 값/중복 제외)"""
+    if not tags:
+        return []
+    return list(dict.fromkeys(tag for tag in map(normalize_tag, tags.split(",")) if tag))
+
+
+def _sync_tags(place: Place) -> None:
+    """Place.tags -> 정규화 태그 행 동기화 (남는 태그의 행은 그대로 둔다)"""
+    current = {entry.tag: entry for entry in place.tag_entries}
+    place.tag_entries = [current.get(tag) or PlaceTag(tag=tag) for tag in split_tags(place.tags)]
+
+
+def _tag_filters(tags_any: list[str] | None, tags_all: list[str] | None) -> list:
+    """태그 조건 (place_tags의 (tag, place_id) 인덱스 조회)"""
+    conditions = []
+    if tags_any:
+        conditions.append(Place.id.in_(
+            select(PlaceTag.place_id).where(PlaceTag.tag.in_(tags_any))
+        ))
+    if tags_all:
+        conditions.append(Place.id.in_(
+            select(PlaceTag.place_id).where(PlaceTag.tag.in_(tags_all))
+            .group_by(PlaceTag.place_id)
+            .having(func.count(PlaceTag.tag) == len(tags_all))
+        ))
+    return conditions
+
+
+def rebuild_place_tags(db: Session, batch_size: int = 1000) -> int:
+    """태그 행 전체 재생성 - 태그가 있는 맛집 수 반환"""
+    db.query(PlaceTag).delete()
+    rows = db.query(Place.id, Place.tags).filter(
+        Place.tags.isnot(None), Place.tags != ""
+    ).order_by(Place.id).yield_per(batch_size)
+
+    count = 0
+    batch = []
+    for place_id, tags in rows:
+        batch.extend({"place_id": place_id, "tag": tag} for tag in split_tags(tags))
+        count += 1
+        if len(batch) >= batch_size:
+            db.execute(insert(PlaceTag), batch)
+            batch = []
+    if batch:
+        db.execute(insert(PlaceTag), batch)
+    db.commit()
+    return count
+
+
+def ensure_place_tags(db: Session) -> None:
+    """태그 행이 비어있는데 태그가 있는 맛집이 있으면 생성 (기존 DB 최초 기동 시)"""
+    if db.query(PlaceTag.place_id).first() is not None:
+        return
+    if db.query(Place.id).filter(Place.tags.isnot(None), Place.tags != "").first() is None:
+        return
+    rebuild_place_tags(db)
+
+
+def _sync_geohash(place: Place) -> None:
+    """좌표로부터 공간 인덱스 키(geohash) 갱신"""
+    place.geohash = encode_geohash(place.latitude, place.longitude)
+
+
+def _box_filter(
+    user_id: int,
+    min_lat: float,
+    max_lat: float,
+    min_lng: float,
+    max_lng: float,
+    include_public: bool = False
+):
+    """영역 조회 조건
+
+    영역을 덮는 geohash 셀 범위마다 소유자/공개 조건을 함께 걸어
+    (user_id, geohash), (visibility, geohash) 인덱스 범위 조회가 되도록 한다.
+    셀 경계에 걸친 맛집은 마지막의 좌표 조건으로 걸러낸다.
+    """
+    ranges = cell_ranges(covering_cells(min_lat, max_lat, min_lng, max_lng))
+
+    scopes = [Place.user_id == user_id]
+    if include_public:
+        scopes.append(Place.visibility == Visibility.PUBLIC)
+
+    cell_terms = []
+    for scope in scopes:
+        for lo, hi in ranges:
+            conditions = [scope, Place.geohash >= lo]
+            if hi is not None:
+                conditions.append(Place.geohash < hi)
+            cell_terms.append(and_(*conditions))
+
+    return and_(
+        or_(*cell_terms),
+        Place.latitude >= min_lat,
+        Place.latitude <= max_lat,
+        Place.longitude >= min_lng,
+        Place.longitude <= max_lng
+    )
+
+
+def _box_candidates(
+    db: Session,
+    user_id: int,
+    min_lat: float,
+    max_lat: float,
+    min_lng: float,
+    max_lng: float,
+    include_public: bool = False
+) -> list[tuple[int, float, float]]:
+    """영역 안에서 조회 가능한 맛집의 (id, 위도, 경도) 목록 (인메모리 인덱스 우선)"""
+    if spatial_index.ready:
+        return spatial_index.query_box(user_id, min_lat, max_lat, min_lng, max_lng, include_public)
+
+    rows = db.query(Place.id, Place.latitude, Place.longitude).filter(
+        _box_filter(user_id, min_lat, max_lat, min_lng, max_lng, include_public)
+    ).all()
+    return [(r.id, r.latitude, r.longitude) for r in rows]
+
+
+def _index_place(place: Place) -> None:
+    """인메모리 공간 인덱스에 맛집 반영"""
+    spatial_index.upsert(
+        place.id, place.latitude, place.longitude, place.user_id,
+        place.visibility == Visibility.PUBLIC
+    )
+
+
+def load_spatial_index(db: Session) -> None:
+    """전체 맛집으로 인메모리 공간 인덱스 적재"""
+    rows = db.query(
+        Place.id, Place.latitude, Place.longitude, Place.user_id, Place.visibility
+    ).yield_per(10000)
+    spatial_index.build(
+        (r.id, r.latitude, r.longitude, r.user_id, r.visibility == Visibility.PUBLIC)
+        for r in rows
+    )
+
+
+def repair_rating_aggregates(db: Session, only_missing: bool = False) -> int:
+    """리뷰 테이블로부터 맛집 평점 집계(rating_sum, review_count, avg_rating) 재계산
+
+    only_missing=True면 집계가 비어있는(컬럼 추가 직후의) 맛집만 채운다.
+    반환: 갱신한 맛집 수
+    """
+    rating_sum = select(func.coalesce(func.sum(Review.rating), 0.0)).where(
+        Review.place_id == Place.id
+    ).scalar_subquery()
+    review_count = select(func.count(Review.id)).where(
+        Review.place_id == Place.id
+    ).scalar_subquery()
+    avg_rating = select(func.avg(Review.rating)).where(
+        Review.place_id == Place.id
+    ).scalar_subquery()
+
+    query = db.query(Place)
+    if only_missing:
+        query = query.filter(Place.review_count.is_(None))
+    updated = query.update({
+        Place.rating_sum: rating_sum,
+        Place.review_count: review_count,
+        Place.avg_rating: avg_rating,
+    }, synchronize_session=False)
+    db.commit()
+    return updated
+
+
+def backfill_geohashes(db: Session, batch_size: int = 1000) -> int:
+    """geohash가 비어있는 기존 맛집 채우기 (반환: 갱신한 개수)"""
+    updated = 0
+    while True:
+        places = db.query(Place).filter(Place.geohash.is_(None)).limit(batch_size).all()
+        if not places:
+            break
+        for place in places:
+            _sync_geohash(place)
+        db.commit()
+        updated += len(places)
+    return updated
+
+
+def create_place(db: Session, user_id: int, place_data: PlaceCreate) -> PlaceCreateResponse:
+    # 추가 전에 조회해야 새 맛집 자신이 후보에 섞이지 않는다 (autoflush)
+    similar = find_duplicates(db, user_id, place_data.name, place_data.latitude, place_data.longitude)
+
     db_place = Place(
         user_id=user_id,
         **place_data.model_dump()
     )
+    _sync_geohash(db_place)
+    _sync_tags(db_place)
     db.add(db_place)
+    cluster.add_place(db, db_place)
+    tiles.bump_tiles(db, db_place.latitude, db_place.longitude)
+    cache.bump_user_data(db, [user_id], public=db_place.visibility == Visibility.PUBLIC)
     db.commit()
     db.refresh(db_place)
-    return _enrich_place_with_stats(db, db_place)
+    _index_place(db_place)
+    return PlaceCreateResponse(**_to_response(db_place).model_dump(), duplicates=similar)
+
+
+def find_duplicates(
+    db: Session,
+    user_id: int,
+    name: str,
+    lat: float,
+    lng: float,
+    exclude_id: int | None = None
+) -> list[PlaceDuplicate]:
+    """근처(내 맛집 + 공개 맛집)에서 이름이 비슷한 맛집 - 유사도 높은 순"""
+    radius_km = duplicates.DUPLICATE_RADIUS_M / 1000.0
+    query = db.query(
+        Place.id, Place.name, Place.user_id, Place.latitude, Place.longitude
+    ).filter(_box_filter(user_id, *bounding_box(lat, lng, radius_km), include_public=True))
+    if exclude_id is not None:
+        query = query.filter(Place.id != exclude_id)
+
+    candidates = [duplicates.Candidate(*row) for row in query]
+    return [
+        PlaceDuplicate(
+            place_id=candidate.id,
+            name=candidate.name,
+            user_id=candidate.user_id,
+            distance_m=round(distance, 1),
+            similarity=round(similarity, 3)
+        )
+        for candidate, distance, similarity in duplicates.match_candidates(name, lat, lng, candidates)
+    ]
 
 
 def get_place_by_id(db: Session, place_id: int) -> Place | None:
     return db.query(Place).filter(Place.id == place_id).first()
 
 
-def get_place_response_by_id(db: Session, place_id: int) -> PlaceResponse | None:
-    """Place 조회 + 통계 포함"""
-    place = get_place_by_id(db, place_id)
-    if not place:
-        return None
-    return _enrich_place_with_stats(db, place)
+def _get_place_rows_in_order(
+    db: Session,
+    place_ids: list[int],
+    fields: list[str] | None = None,
+    visible_to: int | None = None
+) -> list[PlaceRow]:
+    """id 목록 순서를 유지하며 맛집 행 조회 (없는 id는 제외)
+
+    visible_to를 주면 그 사용자의 맛집이거나 공개된 맛집만 남긴다.
+    """
+    keys, columns = _projection(fields)
+    row_map = {}
+    for start in range(0, len(place_ids), 500):
+        chunk = place_ids[start:start + 500]
+        query = db.query(*columns).filter(Place.id.in_(chunk))
+        if visible_to is not None:
+            query = query.filter(
+                or_(Place.user_id == visible_to, Place.visibility == Visibility.PUBLIC)
+            )
+        for row in _to_rows(query, keys):
+            row_map[row["id"]] = row
+    return [row_map[i] for i in place_ids if i in row_map]
+
+
+def get_places_by_ids(db: Session, user_id: int, place_ids: list[int]) -> list[PlaceRow]:
+    """맛집 여러 개를 요청 순서대로 한 번에 조회
+
+    중복 id는 한 번만, 없거나 접근 권한이 없는 맛집은 결과에서 빠진다.
+    """
+    return _get_place_rows_in_order(db, list(dict.fromkeys(place_ids)), visible_to=user_id)
+
+
+DETAIL_INCLUDES = frozenset({"reviews", "stats", "histogram"})
+RATING_BUCKETS = range(1, 6)
+
+
+def get_place_detail(
+    db: Session,
+    place: Place,
+    include: set[str],
+    review_limit: int = 10
+) -> PlaceDetailResponse:
+    """이미 조회한 맛집 행 + include 항목으로 상세 응답 구성
+
+    stats는 맛집 행의 평점 집계 컬럼을, reviews/histogram은 리뷰 테이블을 한 번 읽어 만든다.
+    (최신 리뷰 review_limit개 + 별점 구간마다 대표 행 하나를 구간별 개수와 함께 조회)
+    """
+    detail = {}
+    review_count = place.review_count or 0
+
+    if "stats" in include:
+        detail["stats"] = PlaceReviewStats(
+            place_id=place.id,
+            avg_rating=round(place.avg_rating, 1) if place.avg_rating else 0,
+            review_count=review_count
+        )
+
+    wants_reviews = "reviews" in include
+    wants_histogram = "histogram" in include
+    if wants_reviews or wants_histogram:
+        reviews, histogram, next_cursor = [], dict.fromkeys(RATING_BUCKETS, 0), None
+        if review_count:
+            reviews, histogram, next_cursor = _load_review_summary(
+                db, place.id, review_limit if wants_reviews else 0
+            )
+        if wants_reviews:
+            detail["reviews"] = reviews
+            detail["reviews_next_cursor"] = next_cursor
+        if wants_histogram:
+            detail["histogram"] = histogram
+
+    return PlaceDetailResponse(**_to_response(place).model_dump(), **detail)
+
+
+def _load_review_summary(
+    db: Session,
+    place_id: int,
+    limit: int
+) -> tuple[list[Review], dict[int, int], str | None]:
+    """맛집의 (최신 리뷰 limit개, 별점 구간별 리뷰 수, 다음 페이지 커서)를 쿼리 한 번으로 조회"""
+    # 리뷰 목록 API(paginate)와 같은 정렬/커서 기준
+    sort_key = sort_key_column(db, Review.created_at)
+    bucket = cast(Review.rating, Integer)
+    ranked = db.query(
+        Review,
+        sort_key.label("sort_key"),
+        bucket.label("bucket"),
+        func.row_number().over(order_by=(sort_key.desc(), Review.id.desc())).label("review_rank"),
+        func.row_number().over(partition_by=bucket, order_by=Review.id).label("bucket_rank"),
+        func.count().over(partition_by=bucket).label("bucket_count")
+    ).filter(Review.place_id == place_id).subquery()
+
+    review = aliased(Review, ranked)
+    rows = db.query(
+        review, ranked.c.sort_key, ranked.c.bucket, ranked.c.review_rank, ranked.c.bucket_count
+    ).filter(
+        or_(ranked.c.review_rank <= limit + 1, ranked.c.bucket_rank == 1)
+    ).order_by(ranked.c.review_rank).all()
+
+    histogram = dict.fromkeys(RATING_BUCKETS, 0)
+    reviews, next_cursor, last_key = [], None, None
+    for row in rows:
+        histogram[row.bucket] = row.bucket_count
+        if row.review_rank <= limit:
+            reviews.append(row[0])
+            last_key = (row.sort_key, row[0].id)
+        elif row.review_rank == limit + 1 and last_key:
+            next_cursor = encode_cursor(*last_key)
+    return reviews, histogram, next_cursor
 
 
 def get_user_places(
     db: Session,
     user_id: int,
     skip: int = 0,
-    limit: int = 100
-) -> tuple[list[PlaceResponse], int]:
-    query = db.query(Place).filter(Place.user_id == user_id)
-    total = query.count()
-    places = query.offset(skip).limit(limit).all()
-    return _enrich_places_with_stats(db, places), total
+    limit: int = 100,
+    cursor: str | None = None,
+    with_total: bool = True
+) -> tuple[list[PlaceRow], int | None, str | None]:
+    query = db.query(*PLACE_ROW_COLUMNS).filter(Place.user_id == user_id)
+    rows, total, next_cursor = paginate(
+        query, Place.id, Place.id,
+        cursor=cursor, skip=skip, limit=limit, with_total=with_total
+    )
+    return _to_rows(rows), total, next_cursor
 
 
 def get_places_in_bounds(
@@ -113,24 +467,21 @@ def get_places_in_bounds(
     max_lat: float,
     min_lng: float,
     max_lng: float,
-    include_public: bool = False
-) -> list[PlaceResponse]:
-    """지도 영역 내 맛집 조회"""
-    query = db.query(Place).filter(
-        Place.latitude >= min_lat,
-        Place.latitude <= max_lat,
-        Place.longitude >= min_lng,
-        Place.longitude <= max_lng
-    )
-
-    if include_public:
-        query = query.filter(
-            or_(Place.user_id == user_id, Place.visibility == Visibility.PUBLIC)
+    include_public: bool = False,
+    fields: list[str] | None = None
+) -> list[PlaceRow]:
+    """지도 영역 내 맛집 조회 (fields를 지정하면 해당 필드와 id만)"""
+    if spatial_index.ready:
+        candidates = spatial_index.query_box(
+            user_id, min_lat, max_lat, min_lng, max_lng, include_public
         )
-    else:
-        query = query.filter(Place.user_id == user_id)
+        return _get_place_rows_in_order(db, [place_id for place_id, _, _ in candidates], fields)
 
-    return _enrich_places_with_stats(db, query.all())
+    keys, columns = _projection(fields)
+    query = db.query(*columns).filter(
+        _box_filter(user_id, min_lat, max_lat, min_lng, max_lng, include_public)
+    )
+    return _to_rows(query, keys)
 
 
 def get_places_nearby(
@@ -139,51 +490,106 @@ def get_places_nearby(
     lat: float,
     lng: float,
     radius_km: float = 1.0,
-    include_public: bool = False
-) -> list[PlaceResponse]:
-    """반경 내 맛집 조회 (간단한 거리 계산)"""
-    # 대략적인 위도/경도 범위 계산 (1도 ≈ 111km)
-    delta = radius_km / 111.0
-
-    query = db.query(Place).filter(
-        Place.latitude >= lat - delta,
-        Place.latitude <= lat + delta,
-        Place.longitude >= lng - delta,
-        Place.longitude <= lng + delta
+    include_public: bool = False,
+    limit: int = 100
+) -> list[PlaceRow]:
+    """반경 내 맛집 조회 (가까운 순, 최대 limit개)"""
+    # 1) 반경을 덮는 사각 영역으로 후보 좌표만 조회
+    candidates = _box_candidates(
+        db, user_id, *bounding_box(lat, lng, radius_km), include_public
     )
 
-    if include_public:
-        query = query.filter(
-            or_(Place.user_id == user_id, Place.visibility == Visibility.PUBLIC)
-        )
-    else:
-        query = query.filter(Place.user_id == user_id)
+    # 2) 후보 전체에 대해 실제 대원 거리 계산 후 반경 밖 제거 + 거리순 정렬
+    distances = distances_m(lat, lng, [(c_lat, c_lng) for _, c_lat, c_lng in candidates])
+    radius_m = radius_km * 1000.0
+    nearest = heapq.nsmallest(limit, (
+        (distance, place_id) for (place_id, _, _), distance in zip(candidates, distances)
+        if distance <= radius_m
+    ))
 
-    return _enrich_places_with_stats(db, query.all())
+    # 3) 최종 limit개만 전체 로우 조회
+    return _places_with_distance(db, nearest)
 
 
-def search_places(
+SEARCH_DISTANCE_RADIUS_KM = 5.0
+
+KNN_INITIAL_RADIUS_KM = 0.5
+KNN_MAX_RADIUS_KM = 20_100.0  # 지구 반 둘레 - 이 이상이면 전체 영역
+
+
+def get_nearest_places(
     db: Session,
     user_id: int,
-    keyword: str | None = None,
-    category: str | None = None,
-    min_rating: float | None = None,
-    only_mine: bool = True,
-    sort_by: str = "created_at",
-    skip: int = 0,
-    limit: int = 100
-) -> tuple[list[PlaceResponse], int]:
-    """맛집 검색/필터"""
-    query = db.query(Place)
+    lat: float,
+    lng: float,
+    k: int = 20,
+    include_public: bool = False
+) -> list[PlaceRow]:
+    """가까운 맛집 k개 조회
 
-    if only_mine:
+    작은 반경에서 시작해 반경 안에서 확정된 후보가 k개 이상이 될 때까지
+    반경을 두 배씩 넓힌다. 반경 안의 점은 모두 탐색 영역 안에 있으므로,
+    반경 이내 후보가 k개면 그것이 정확한 k-최근접이다.
+    """
+    radius_km = KNN_INITIAL_RADIUS_KM
+    while True:
+        candidates = _box_candidates(
+            db, user_id, *bounding_box(lat, lng, radius_km), include_public
+        )
+        distances = distances_m(lat, lng, [(c_lat, c_lng) for _, c_lat, c_lng in candidates])
+
+        if radius_km >= KNN_MAX_RADIUS_KM:
+            confirmed = list(zip(distances, (place_id for place_id, _, _ in candidates)))
+            break
+
+        radius_m = radius_km * 1000.0
+        confirmed = [
+            (distance, place_id) for (place_id, _, _), distance in zip(candidates, distances)
+            if distance <= radius_m
+        ]
+        if len(confirmed) >= k:
+            break
+        radius_km = min(radius_km * 2, KNN_MAX_RADIUS_KM)
+
+    return _places_with_distance(db, heapq.nsmallest(k, confirmed))
+
+
+def _places_with_distance(db: Session, nearest: list[tuple[float, int]]) -> list[PlaceRow]:
+    """(거리, id) 목록 순서대로 맛집 조회 + distance_m 채우기"""
+    rows = _get_place_rows_in_order(db, [place_id for _, place_id in nearest])
+    distance_map = {place_id: distance for distance, place_id in nearest}
+    for row in rows:
+        row["distance_m"] = round(distance_map[row["id"]], 1)
+    return rows
+
+
+def _search_scope(
+    query,
+    user_id: int,
+    keyword: str | None,
+    only_mine: bool,
+    box: tuple[float, float, float, float] | None = None
+):
+    """검색 대상 범위(내 맛집/공개 맛집, 영역)와 키워드 조건 적용
+
+    Returns:
+        tuple: (조건이 적용된 query, 전문 검색 서브쿼리 또는 None)
+    """
+    if box is not None:
+        query = query.filter(_box_filter(user_id, *box, include_public=not only_mine))
+    elif only_mine:
         query = query.filter(Place.user_id == user_id)
     else:
         query = query.filter(
             or_(Place.user_id == user_id, Place.visibility == Visibility.PUBLIC)
         )
 
-    if keyword:
+    matches = None
+    if keyword and search_index.can_search(keyword):
+        # 전문 검색 인덱스 (이름/메모/태그/리뷰 내용)
+        matches = search_index.match_subquery(keyword)
+        query = query.join(matches, matches.c.place_id == Place.id)
+    elif keyword:
         keyword_filter = f"%{keyword}%"
         query = query.filter(
             or_(
@@ -192,43 +598,553 @@ def search_places(
                 Place.tags.ilike(keyword_filter)
             )
         )
+    return query, matches
+
+
+def search_places(
+    db: Session,
+    user_id: int,
+    keyword: str | None = None,
+    category: str | None = None,
+    min_rating: float | None = None,
+    only_mine: bool = True,
+    tags_any: list[str] | None = None,
+    tags_all: list[str] | None = None,
+    sort_by: str = "created_at",
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+    with_total: bool = True,
+    lat: float | None = None,
+    lng: float | None = None,
+    radius_km: float = SEARCH_DISTANCE_RADIUS_KM
+) -> tuple[list[PlaceRow], int | None, str | None]:
+    """맛집 검색/필터
+
+    sort_by=distance면 (lat, lng) 반경 radius_km 안의 맛집만 가까운 순으로 돌려준다.
+    """
+    if sort_by == "distance":
+        # 영역 조건으로 후보를 좁힌 뒤 후보의 좌표만 읽어 거리 계산
+        query, _ = _search_scope(
+            db.query(Place.id, Place.latitude, Place.longitude),
+            user_id, keyword, only_mine, bounding_box(lat, lng, radius_km)
+        )
+    else:
+        query, matches = _search_scope(db.query(*PLACE_ROW_COLUMNS), user_id, keyword, only_mine)
 
     if category:
         query = query.filter(Place.category == category)
 
-    # min_rating 필터: 서브쿼리로 평균 평점 필터링
+    # min_rating 필터: 비정규화된 평균 평점 컬럼 사용
     if min_rating is not None:
-        subquery = db.query(
-            Review.place_id,
-            func.avg(Review.rating).label("avg_rating")
-        ).group_by(Review.place_id).subquery()
-
-        query = query.join(
-            subquery, Place.id == subquery.c.place_id
-        ).filter(subquery.c.avg_rating >= min_rating)
-
-    # 정렬
-    if sort_by == "created_at":
-        query = query.order_by(Place.created_at.desc())
+        query = query.filter(Place.avg_rating >= min_rating)
+
+    query = query.filter(*_tag_filters(tags_any, tags_all))
+
+    if sort_by == "distance":
+        return _paginate_by_distance(
+            db, query.all(), lat, lng, radius_km, skip, limit, cursor, with_total
+        )
+
+    # 정렬 (relevance는 전문 검색일 때만, 아니면 최근 등록순) - 동순위는 id로
+    if sort_by == "relevance" and matches is not None:
+        sort_column, descending, nullable = matches.c.rank, False, False
+    elif sort_by == "rating":
+        # 비정규화된 평균 평점 컬럼 ((user_id, avg_rating) 인덱스) - 평점 없는 맛집은 뒤로
+        sort_column, descending, nullable = Place.avg_rating, True, True
     elif sort_by == "name":
-        query = query.order_by(Place.name)
+        sort_column, descending, nullable = Place.name, False, False
     elif sort_by == "visited_at":
-        query = query.order_by(Place.visited_at.desc())
+        sort_column, descending, nullable = Place.visited_at, True, True
+    else:
+        sort_column, descending, nullable = Place.created_at, True, False
+
+    rows, total, next_cursor = paginate(
+        query, sort_column, Place.id, descending, nullable,
+        cursor=cursor, skip=skip, limit=limit, with_total=with_total
+    )
+    return _to_rows(rows), total, next_cursor
+
+
+def _paginate_by_distance(
+    db: Session,
+    candidates: list,
+    lat: float,
+    lng: float,
+    radius_km: float,
+    skip: int,
+    limit: int,
+    cursor: str | None,
+    with_total: bool
+) -> tuple[list[PlaceRow], int | None, str | None]:
+    """검색 후보 (id, 위도, 경도)를 거리순으로 한 페이지 조회 (커서는 (거리, id))"""
+    distances = distances_m(lat, lng, [(c.latitude, c.longitude) for c in candidates])
+    radius_m = radius_km * 1000.0
+    keyed = [
+        (distance, candidate.id) for candidate, distance in zip(candidates, distances)
+        if distance <= radius_m
+    ]
+    total = len(keyed) if with_total else None
+
+    if cursor:
+        after = decode_cursor(cursor)
+        if not isinstance(after[0], (int, float)):
+            raise HTTPException(status_code=400, detail="잘못된 커서입니다")
+        keyed = [key for key in keyed if key > after]
+        skip = 0
+
+    page = heapq.nsmallest(skip + limit + 1, keyed)[skip:]
+    next_cursor = encode_cursor(*page[limit - 1]) if len(page) > limit else None
+    return _places_with_distance(db, page[:limit]), total, next_cursor
+
+
+FACET_CACHE_SIZE = 1024
+facet_cache = cache.LRUCache(max_size=FACET_CACHE_SIZE)
+
+
+def get_place_facets(
+    db: Session,
+    user_id: int,
+    keyword: str | None = None,
+    category: Category | None = None,
+    min_rating: float | None = None,
+    only_mine: bool = True,
+    box: tuple[float, float, float, float] | None = None,
+    tags_any: list[str] | None = None,
+    tags_all: list[str] | None = None,
+    tag_limit: int = 20
+) -> PlaceFacetsResponse:
+    """검색 조건별 카테고리/평점 구간/태그 개수 (사용자 데이터 버전 단위 캐시)"""
+    scopes = [cache.user_scope(user_id)]
+    if not only_mine:
+        scopes.append(cache.PUBLIC_SCOPE)
+    key = (
+        "facets", user_id, cache.get_versions(db, scopes),
+        keyword, category, min_rating, only_mine, box,
+        tuple(tags_any or ()), tuple(tags_all or ()), tag_limit
+    )
+    return facet_cache.get_or_compute(
+        key,
+        lambda: _compute_facets(
+            db, user_id, keyword, category, min_rating, only_mine, box, tags_any, tags_all, tag_limit
+        )
+    )
+
+
+def _compute_facets(
+    db: Session,
+    user_id: int,
+    keyword: str | None,
+    category: Category | None,
+    min_rating: float | None,
+    only_mine: bool,
+    box: tuple[float, float, float, float] | None,
+    tags_any: list[str] | None,
+    tags_all: list[str] | None,
+    tag_limit: int
+) -> PlaceFacetsResponse:
+    """(카테고리, 평점 구간, 최소 평점 충족 여부)별 개수를 쿼리 한 번으로 묶어 집계하고,
+    태그별 개수는 place_tags에서 GROUP BY로 집계 (get_tag_counts와 같은 기준)
+
+    각 패싯의 개수에는 그 패싯 자신의 조건을 적용하지 않는다.
+    (카테고리를 골라도 다른 카테고리의 개수가 보이도록)
+    """
+    bucket = cast(Place.avg_rating, Integer)
+    meets_rating = Place.avg_rating >= min_rating if min_rating is not None else literal(True)
+    query, _ = _search_scope(
+        db.query(Place.category, bucket, meets_rating, func.count(Place.id)),
+        user_id, keyword, only_mine, box
+    )
+    query = query.filter(*_tag_filters(tags_any, tags_all))
+    rows = query.group_by(Place.category, bucket, meets_rating).all()
+
+    categories = dict.fromkeys((c.value for c in Category), 0)
+    ratings = dict.fromkeys([*(str(b) for b in reversed(RATING_BUCKETS)), "none"], 0)
+    total = 0
+    for row_category, row_bucket, row_meets_rating, count in rows:
+        category_ok = category is None or row_category == category
+        rating_ok = bool(row_meets_rating)
+        if rating_ok:
+            categories[(row_category or Category.OTHER).value] += count
+        if category_ok:
+            ratings[str(row_bucket) if row_bucket else "none"] += count
+        if category_ok and rating_ok:
+            total += count
+
+    tag_count = func.count(PlaceTag.place_id)
+    tag_query, _ = _search_scope(
+        db.query(PlaceTag.tag, tag_count).join(Place, Place.id == PlaceTag.place_id),
+        user_id, keyword, only_mine, box
+    )
+    tag_query = tag_query.filter(*_tag_filters(tags_any, tags_all))
+    if category is not None:
+        tag_query = tag_query.filter(Place.category == category)
+    if min_rating is not None:
+        tag_query = tag_query.filter(Place.avg_rating >= min_rating)
+    tag_rows = tag_query.group_by(PlaceTag.tag).order_by(tag_count.desc(), PlaceTag.tag).limit(tag_limit)
+
+    return PlaceFacetsResponse(
+        total=total,
+        categories=categories,
+        ratings=ratings,
+        tags=[FacetCount(value=tag, count=count) for tag, count in tag_rows]
+    )
+
 
-    total = query.count()
-    places = query.offset(skip).limit(limit).all()
-    return _enrich_places_with_stats(db, places), total
+def get_tag_counts(
+    db: Session,
+    user_id: int,
+    only_mine: bool = True,
+    prefix: str | None = None,
+    limit: int = 50
+) -> list[FacetCount]:
+    """태그별 맛집 수 (많은 순) - place_tags 인덱스로 집계"""
+    count = func.count(PlaceTag.place_id)
+    query = db.query(PlaceTag.tag, count).join(Place, Place.id == PlaceTag.place_id)
+    if only_mine:
+        query = query.filter(Place.user_id == user_id)
+    else:
+        query = query.filter(
+            or_(Place.user_id == user_id, Place.visibility == Visibility.PUBLIC)
+        )
+    if prefix:
+        normalized = normalize_tag(prefix)
+        if normalized:
+            # LIKE 대신 범위 조건으로 (tag, place_id) 인덱스 사용
+            query = query.filter(PlaceTag.tag >= normalized, PlaceTag.tag < normalized + "\U0010ffff")
+
+    rows = query.group_by(PlaceTag.tag).order_by(count.desc(), PlaceTag.tag).limit(limit).all()
+    return [FacetCount(value=tag, count=tag_count) for tag, tag_count in rows]
+
+
+def _review_totals(place: Place) -> tuple[float, int]:
+    """맛집의 (리뷰 평점 합, 리뷰 수)"""
+    return place.rating_sum or 0.0, place.review_count or 0
 
 
 def update_place(db: Session, place: Place, place_data: PlaceUpdate) -> PlaceResponse:
     update_data = place_data.model_dump(exclude_unset=True)
+    was_public = place.visibility == Visibility.PUBLIC
+
+    # 위치/카테고리/공개 범위가 바뀌면 클러스터 집계도 옮긴다
+    moves_cluster = bool(update_data.keys() & {"latitude", "longitude", "category", "visibility"})
+    if moves_cluster:
+        totals = _review_totals(place)
+        cluster.remove_place(db, place, *totals)
+    tiles.bump_tiles(db, place.latitude, place.longitude)
+
     for field, value in update_data.items():
         setattr(place, field, value)
+    if "latitude" in update_data or "longitude" in update_data:
+        _sync_geohash(place)
+        tiles.bump_tiles(db, place.latitude, place.longitude)
+    if "tags" in update_data:
+        _sync_tags(place)
+
+    if moves_cluster:
+        cluster.add_place(db, place, *totals)
+    cache.bump_user_data(
+        db, [place.user_id], public=was_public or place.visibility == Visibility.PUBLIC
+    )
     db.commit()
     db.refresh(place)
-    return _enrich_place_with_stats(db, place)
+    _index_place(place)
+    return _to_response(place)
 
 
 def delete_place(db: Session, place: Place) -> None:
+    place_id = place.id
+    cluster.remove_place(db, place, *_review_totals(place))
+    tiles.bump_tiles(db, place.latitude, place.longitude)
+    # 맛집과 함께 삭제되는 리뷰 작성자들의 데이터도 바뀐다
+    reviewer_ids = [
+        row.user_id for row in db.query(Review.user_id).filter(Review.place_id == place_id).distinct()
+    ]
+    cache.bump_user_data(
+        db, [place.user_id, *reviewer_ids], public=place.visibility == Visibility.PUBLIC
+    )
     db.delete(place)
     db.commit()
+    spatial_index.remove(place_id)
+
+
+def render_tile(
+    db: Session,
+    user_id: int,
+    z: int,
+    x: int,
+    y: int,
+    include_public: bool = False
+) -> bytes:
+    """타일 안의 맛집(확대 시) 또는 클러스터를 컬럼형 JSON으로 인코딩"""
+    min_lat, max_lat, min_lng, max_lng = tiles.tile_bounds(z, x, y)
+
+    def in_tile(lat: float, lng: float) -> bool:
+        # 인접 타일과 겹치지 않도록 반열린 구간으로 판정
+        return min_lat <= lat < max_lat and min_lng <= lng < max_lng
+
+    payload = {"z": z, "x": x, "y": y}
+    if z >= cluster.PLACES_MIN_ZOOM:
+        places = [
+            p for p in get_places_in_bounds(
+                db, user_id, min_lat, max_lat, min_lng, max_lng, include_public
+            )
+            if in_tile(p["latitude"], p["longitude"])
+        ]
+        payload["clustered"] = False
+        payload["places"] = {
+            "id": [p["id"] for p in places],
+            "name": [p["name"] for p in places],
+            "lat": [p["latitude"] for p in places],
+            "lng": [p["longitude"] for p in places],
+            "category": [p["category"].value for p in places],
+            "avg_rating": [p["avg_rating"] for p in places],
+        }
+    else:
+        clusters = [
+            c for c in cluster.get_clusters(
+                db, user_id, min_lat, max_lat, min_lng, max_lng,
+                cluster.precision_for_zoom(z), include_public
+            )
+            if in_tile(c.latitude, c.longitude)
+        ]
+        payload["clustered"] = True
+        payload["clusters"] = {
+            "geohash": [c.geohash for c in clusters],
+            "count": [c.count for c in clusters],
+            "lat": [c.latitude for c in clusters],
+            "lng": [c.longitude for c in clusters],
+            "category": [c.dominant_category.value for c in clusters],
+            "avg_rating": [c.avg_rating for c in clusters],
+        }
+
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+EXPORT_BATCH_SIZE = 1000
+
+
+def _export_record(place: Place, reviews: list[Review]) -> dict:
+    """내보내기용 맛집 레코드 (리뷰 포함)"""
+    return {
+        "id": place.id,
+        "name": place.name,
+        "category": place.category.value if place.category else None,
+        "latitude": place.latitude,
+        "longitude": place.longitude,
+        "address": place.address,
+        "memo": place.memo,
+        "tags": place.tags,
+        "visited_at": place.visited_at.isoformat() if place.visited_at else None,
+        "visibility": place.visibility.value if place.visibility else None,
+        "created_at": place.created_at.isoformat() if place.created_at else None,
+        "avg_rating": round(place.avg_rating, 1) if place.avg_rating else None,
+        "review_count": place.review_count or 0,
+        "reviews": [
+            {
+                "id": review.id,
+                "user_id": review.user_id,
+                "rating": review.rating,
+                "content": review.content,
+                "recommendation": review.recommendation.value if review.recommendation else None,
+                "created_at": review.created_at.isoformat() if review.created_at else None,
+            }
+            for review in reviews
+        ],
+    }
+
+
+def iter_export_records(db: Session, user_id: int) -> Iterator[dict]:
+    """사용자의 맛집을 리뷰와 함께 한 번의 조인 쿼리로 순차 조회
+
+    (맛집, 리뷰) 행을 id 순으로 yield_per 단위로 읽으면서 같은 맛집의 행을 묶으므로
+    맛집 수와 관계없이 메모리 사용량이 일정하다.
+    """
+    rows = db.query(Place, Review).outerjoin(
+        Review, Review.place_id == Place.id
+    ).filter(
+        Place.user_id == user_id
+    ).order_by(Place.id, Review.id).yield_per(EXPORT_BATCH_SIZE)
+
+    current: Place | None = None
+    reviews: list[Review] = []
+    for place, review in rows:
+        if current is not None and place.id != current.id:
+            yield _export_record(current, reviews)
+            reviews = []
+        current = place
+        if review is not None:
+            reviews.append(review)
+
+    if current is not None:
+        yield _export_record(current, reviews)
+
+
+def export_places(user_id: int, format: str = "ndjson") -> Iterator[bytes]:
+    """맛집 내보내기 스트림 (ndjson: 한 줄에 맛집 하나, geojson: FeatureCollection)
+
+    응답 스트리밍 중에도 유효하도록 요청 세션과 별개의 세션을 직접 연다.
+    """
+    def dumps(value: dict) -> bytes:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+    with SessionLocal() as db:
+        records = iter_export_records(db, user_id)
+
+        if format == "ndjson":
+            for record in records:
+                yield dumps(record) + b"\n"
+            return
+
+        yield b'{"type":"FeatureCollection","features":['
+        for index, record in enumerate(records):
+            feature = {
+                "type": "Feature",
+                "id": record["id"],
+                "geometry": {
+                    "type": "Point",
+                    "coordinates": [record["longitude"], record["latitude"]],
+                },
+                "properties": record,
+            }
+            yield (b"," if index else b"") + dumps(feature)
+        yield b"]}"
+
+
+IMPORT_BATCH_SIZE = 1000
+IMPORT_MAX_REPORTED_ERRORS = 1000
+IMPORT_FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+
+
+def detect_import_format(filename: str | None) -> str | None:
+    """파일 확장자로 가져오기 형식 판별 (csv / jsonl)"""
+    if not filename:
+        return None
+    for extension, format in IMPORT_FORMATS.items():
+        if filename.lower().endswith(extension):
+            return format
+    return None
+
+
+def _iter_import_rows(file: BinaryIO, format: str) -> Iterator[tuple[int, dict | None, str | None]]:
+    """업로드 파일을 한 행씩 읽어 (행 번호, 데이터, 파싱 오류) 반환"""
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    row_number = 0
+    try:
+        if format == "csv":
+            for row_number, row in enumerate(csv.DictReader(text), start=1):
+                # 빈 칸은 생략해 PlaceCreate 기본값이 적용되도록 한다
+                data = {
+                    key.strip(): value.strip()
+                    for key, value in row.items()
+                    if key and isinstance(value, str) and value.strip()
+                }
+                yield row_number, data, None
+        else:
+            for row_number, line in enumerate(text, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    data = json.loads(line)
+                except ValueError:
+                    yield row_number, None, "JSON 형식이 아닙니다"
+                    continue
+                if not isinstance(data, dict):
+                    yield row_number, None, "JSON 객체가 아닙니다"
+                    continue
+                yield row_number, data, None
+    except (UnicodeDecodeError, csv.Error) as e:
+        yield row_number + 1, None, f"파일을 읽을 수 없습니다: {e}"
+    finally:
+        text.detach()
+
+
+def _validation_messages(error: ValidationError) -> list[str]:
+    return [
+        f"{'.'.join(str(loc) for loc in e['loc']) or 'row'}: {e['msg']}"
+        for e in error.errors()
+    ]
+
+
+def _insert_import_batch(db: Session, user_id: int, batch: list[tuple[int, PlaceCreate]]) -> list[int]:
+    """검증된 맛집 한 묶음을 한 트랜잭션으로 일괄 INSERT 후 생성된 id 반환"""
+    values = []
+    for _, place_data in batch:
+        row = place_data.model_dump()
+        row["user_id"] = user_id
+        row["geohash"] = encode_geohash(row["latitude"], row["longitude"])
+        values.append(row)
+
+    place_ids = list(db.scalars(
+        insert(Place).returning(Place.id, sort_by_parameter_order=True),
+        values
+    ))
+    tag_rows = [
+        {"place_id": place_id, "tag": tag}
+        for place_id, row in zip(place_ids, values)
+        for tag in split_tags(row["tags"])
+    ]
+    if tag_rows:
+        db.execute(insert(PlaceTag), tag_rows)
+    # 클러스터/타일 갱신용 (세션에 추가하지 않는 임시 객체)
+    cluster.add_places(db, [Place(**row) for row in values])
+    tiles.bump_tiles_many(db, [(row["latitude"], row["longitude"]) for row in values])
+    cache.bump_user_data(
+        db, [user_id], public=any(row["visibility"] == Visibility.PUBLIC for row in values)
+    )
+    db.commit()
+
+    for place_id, row in zip(place_ids, values):
+        spatial_index.upsert(
+            place_id, row["latitude"], row["longitude"], user_id,
+            row["visibility"] == Visibility.PUBLIC
+        )
+    return place_ids
+
+
+def import_places(db: Session, user_id: int, file: BinaryIO, format: str) -> PlaceImportResponse:
+    """CSV/JSONL 파일의 맛집 일괄 등록
+
+    행을 스트리밍으로 읽어 PlaceCreate로 검증하고, 통과한 행을 IMPORT_BATCH_SIZE개씩
+    executemany INSERT + 커밋한다. 실패한 행은 건너뛰고 행 번호별 오류로 보고하며,
+    앞서 커밋된 묶음은 이후 묶음이 실패해도 유지된다.
+    검색 인덱스는 트리거로 함께 갱신된다.
+    """
+    imported = 0
+    failed = 0
+    errors: list[PlaceImportError] = []
+
+    def report(row_number: int, messages: list[str]) -> None:
+        nonlocal failed
+        failed += 1
+        if len(errors) < IMPORT_MAX_REPORTED_ERRORS:
+            errors.append(PlaceImportError(row=row_number, errors=messages))
+
+    batch: list[tuple[int, PlaceCreate]] = []
+
+    def flush_batch() -> None:
+        nonlocal imported
+        if not batch:
+            return
+        try:
+            imported += len(_insert_import_batch(db, user_id, batch))
+        except SQLAlchemyError as e:
+            db.rollback()
+            for row_number, _ in batch:
+                report(row_number, [f"저장 실패: {e.__class__.__name__}"])
+        batch.clear()
+
+    for row_number, data, parse_error in _iter_import_rows(file, format):
+        if parse_error:
+            report(row_number, [parse_error])
+            continue
+        try:
+            batch.append((row_number, PlaceCreate.model_validate(data)))
+        except ValidationError as e:
+            report(row_number, _validation_messages(e))
+            continue
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            flush_batch()
+    flush_batch()
+
+    return PlaceImportResponse(imported=imported, failed=failed, errors=errors)
@@ -0,0 +1,188 @@
+"""인메모리 공간 인덱스
+
+모든 맛집 좌표를 배열에 담아 STR(Sort-Tile-Recursive) 방식으로 일괄 적재한
+R-tree로, 지도 영역 조회의 좌표 필터를 DB 대신 처리한다.
+
+- 적재 이후의 추가/수정은 _pending, 삭제/수정 전 위치는 _removed에 모아두고
+  변경량이 일정 비율을 넘으면 트리를 다시 적재한다.
+- 프로세스 단위 인덱스이므로 워커가 하나일 때만 사용해야 한다. (SPATIAL_INDEX_ENABLED)
+"""
+import math
+import threading
+from array import array
+from typing import Iterable
+
+LEAF_SIZE = 64   # 리프 하나에 담는 점 개수
+NODE_SIZE = 16   # 내부 노드 하나의 자식 개수
+
+# (place_id, latitude, longitude, user_id, is_public)
+IndexEntry = tuple[int, float, float, int, bool]
+
+
+class _PackedRTree:
+    """읽기 전용 R-tree (배열 기반)"""
+
+    def __init__(self, entries: list[IndexEntry]):
+        n = len(entries)
+
+        # STR 적재: 경도순으로 세로 띠를 나누고, 띠 안에서 위도순 정렬
+        entries.sort(key=lambda e: e[2])
+        leaf_count = math.ceil(n / LEAF_SIZE)
+        slab_size = max(math.ceil(math.sqrt(leaf_count)), 1) * LEAF_SIZE
+        packed: list[IndexEntry] = []
+        for start in range(0, n, slab_size):
+            packed.extend(sorted(entries[start:start + slab_size], key=lambda e: e[1]))
+
+        self.ids = array("q", (e[0] for e in packed))
+        self.lats = array("d", (e[1] for e in packed))
+        self.lngs = array("d", (e[2] for e in packed))
+        self.owners = array("q", (e[3] for e in packed))
+        self.public = bytearray(1 if e[4] else 0 for e in packed)
+
+        # levels[0]: 리프 경계 상자, levels[-1]: 루트 경계 상자들
+        # 각 레벨은 (min_lat, max_lat, min_lng, max_lng) 배열 4개
+        self.levels: list[tuple[array, array, array, array]] = []
+        boxes = self._leaf_boxes()
+        self.levels.append(boxes)
+        while len(boxes[0]) > NODE_SIZE:
+            boxes = self._parent_boxes(boxes)
+            self.levels.append(boxes)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _leaf_boxes(self) -> tuple[array, array, array, array]:
+        min_lat, max_lat, min_lng, max_lng = (array("d") for _ in range(4))
+        for start in range(0, len(self.ids), LEAF_SIZE):
+            lats = self.lats[start:start + LEAF_SIZE]
+            lngs = self.lngs[start:start + LEAF_SIZE]
+            min_lat.append(min(lats))
+            max_lat.append(max(lats))
+            min_lng.append(min(lngs))
+            max_lng.append(max(lngs))
+        return min_lat, max_lat, min_lng, max_lng
+
+    @staticmethod
+    def _parent_boxes(children: tuple[array, array, array, array]) -> tuple[array, array, array, array]:
+        min_lat, max_lat, min_lng, max_lng = (array("d") for _ in range(4))
+        for start in range(0, len(children[0]), NODE_SIZE):
+            end = start + NODE_SIZE
+            min_lat.append(min(children[0][start:end]))
+            max_lat.append(max(children[1][start:end]))
+            min_lng.append(min(children[2][start:end]))
+            max_lng.append(max(children[3][start:end]))
+        return min_lat, max_lat, min_lng, max_lng
+
+    def search(self, min_lat: float, max_lat: float, min_lng: float, max_lng: float) -> Iterable[int]:
+        """영역 안에 있는 점의 배열 위치"""
+        if not self.ids:
+            return
+
+        top = len(self.levels) - 1
+        stack = [(top, i) for i in range(len(self.levels[top][0]))]
+        while stack:
+            level, node = stack.pop()
+            boxes = self.levels[level]
+            if (boxes[0][node] > max_lat or boxes[1][node] < min_lat
+                    or boxes[2][node] > max_lng or boxes[3][node] < min_lng):
+                continue
+
+            if level == 0:
+                for pos in range(node * LEAF_SIZE, min((node + 1) * LEAF_SIZE, len(self.ids))):
+                    if (min_lat <= self.lats[pos] <= max_lat
+                            and min_lng <= self.lngs[pos] <= max_lng):
+                        yield pos
+            else:
+                child_count = len(self.levels[level - 1][0])
+                for child in range(node * NODE_SIZE, min((node + 1) * NODE_SIZE, child_count)):
+                    stack.append((level - 1, child))
+
+
+class SpatialIndex:
+    """맛집 좌표 인덱스 (트리 + 변경분 버퍼)"""
+
+    def __init__(self, rebuild_ratio: float = 0.1, min_rebuild: int = 1024):
+        self._lock = threading.Lock()
+        self._tree: _PackedRTree | None = None
+        self._pending: dict[int, IndexEntry] = {}  # 적재 이후 추가/수정된 항목
+        self._removed: set[int] = set()            # 트리 안의 항목 중 무효가 된 id
+        self._rebuild_ratio = rebuild_ratio
+        self._min_rebuild = min_rebuild
+
+    @property
+    def ready(self) -> bool:
+        return self._tree is not None
+
+    def build(self, entries: Iterable[IndexEntry]) -> None:
+        """전체 항목으로 인덱스 (재)적재"""
+        tree = _PackedRTree(list(entries))
+        with self._lock:
+            self._tree = tree
+            self._pending.clear()
+            self._removed.clear()
+
+    def upsert(self, place_id: int, latitude: float, longitude: float, user_id: int, is_public: bool) -> None:
+        with self._lock:
+            if self._tree is None:
+                return
+            self._removed.add(place_id)
+            self._pending[place_id] = (place_id, latitude, longitude, user_id, is_public)
+            self._maybe_rebuild()
+
+    def remove(self, place_id: int) -> None:
+        with self._lock:
+            if self._tree is None:
+                return
+            self._removed.add(place_id)
+            self._pending.pop(place_id, None)
+            self._maybe_rebuild()
+
+    def query_box(
+        self,
+        user_id: int,
+        min_lat: float,
+        max_lat: float,
+        min_lng: float,
+        max_lng: float,
+        include_public: bool = False
+    ) -> list[tuple[int, float, float]]:
+        """영역 안에서 조회 가능한 맛집의 (id, 위도, 경도) 목록"""
+        with self._lock:
+            tree = self._tree
+            if tree is None:
+                return []
+
+            result = []
+            for pos in tree.search(min_lat, max_lat, min_lng, max_lng):
+                place_id = tree.ids[pos]
+                if place_id in self._removed:
+                    continue
+                if tree.owners[pos] == user_id or (include_public and tree.public[pos]):
+                    result.append((place_id, tree.lats[pos], tree.lngs[pos]))
+
+            for place_id, lat, lng, owner, is_public in self._pending.values():
+                if not (min_lat <= lat <= max_lat and min_lng <= lng <= max_lng):
+                    continue
+                if owner == user_id or (include_public and is_public):
+                    result.append((place_id, lat, lng))
+            return result
+
+    def _maybe_rebuild(self) -> None:
+        """변경분이 많아지면 트리 재적재 (lock을 잡은 상태에서 호출)"""
+        changes = len(self._pending) + len(self._removed)
+        if changes < max(self._min_rebuild, self._rebuild_ratio * len(self._tree)):
+            return
+
+        tree = self._tree
+        entries = [
+            (tree.ids[pos], tree.lats[pos], tree.lngs[pos], tree.owners[pos], bool(tree.public[pos]))
+            for pos in range(len(tree))
+            if tree.ids[pos] not in self._removed
+        ]
+        entries.extend(self._pending.values())
+        self._tree = _PackedRTree(entries)
+        self._pending.clear()
+        self._removed.clear()
+
+
+spatial_index = SpatialIndex()
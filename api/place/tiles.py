@@ -0,0 +1,118 @@
+"""지도 타일 (XYZ, Web Mercator)
+
+타일마다 DB에 버전을 두고 타일 안의 맛집/리뷰가 바뀔 때 증가시킨다.
+클러스터 타일은 셀 중심점이 타일 안에 있는 클러스터를 그리므로, 맛집이 속한
+클러스터 셀과 겹치는 타일(인접 타일 포함)을 모두 증가시킨다.
+응답의 ETag는 이 버전으로 만들어지므로 브라우저/프록시는 조건부 요청으로,
+프로세스 안에서는 (사용자, 타일, 버전) 단위 캐시로 같은 응답을 재사용한다.
+
+쓰기 한 번에 줌 0~20의 타일 버전 행 수십 개(보통 30~40개, 고위도에서 더 많다)를
+UPSERT 한 문장으로 올린다. 저줌 행은 모든 쓰기가 건드리는 핫스팟이지만 맛집/리뷰 쓰기는
+지도 조회에 비해 드물고, SQLite는 쓰기 트랜잭션을 어차피 직렬화하므로 행 단위 경합이
+추가로 생기지 않는다. 쓰기가 많아지면 저줌 타일은 버전 대신 짧은 TTL로 캐시하는 편이 낫다.
+"""
+import math
+from typing import Iterable
+
+from sqlalchemy import bindparam
+from sqlalchemy.orm import Session
+
+from api.cache import LRUCache
+from api.database import upsert
+from api.place.cluster import PLACES_MIN_ZOOM, precision_for_zoom
+from api.place.geo import cell_bounds
+from api.place.models import TileVersion
+
+MAX_TILE_ZOOM = 20
+MAX_MERCATOR_LAT = 85.05112878
+TILE_CACHE_SIZE = 2048
+
+
+def tile_bounds(z: int, x: int, y: int) -> tuple[float, float, float, float]:
+    """타일의 (min_lat, max_lat, min_lng, max_lng)"""
+    n = 2 ** z
+
+    def lat_at(tile_y: int) -> float:
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * tile_y / n))))
+
+    return lat_at(y + 1), lat_at(y), x / n * 360.0 - 180.0, (x + 1) / n * 360.0 - 180.0
+
+
+def tile_for(lat: float, lng: float, z: int) -> tuple[int, int]:
+    """좌표가 속한 z 레벨 타일의 (x, y)"""
+    n = 2 ** z
+    lat = max(min(lat, MAX_MERCATOR_LAT), -MAX_MERCATOR_LAT)
+    x = int((lng + 180.0) / 360.0 * n)
+    y = int((1 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
+def is_valid_tile(z: int, x: int, y: int) -> bool:
+    return 0 <= z <= MAX_TILE_ZOOM and 0 <= x < 2 ** z and 0 <= y < 2 ** z
+
+
+def tiles_for_place(lat: float, lng: float, z: int) -> set[tuple[int, int]]:
+    """좌표의 맛집이 바뀌면 내용이 달라질 수 있는 z 레벨 타일들의 (x, y)
+
+    개별 맛집을 그리는 줌에서는 좌표를 포함하는 타일 하나, 클러스터를 그리는 줌에서는
+    클러스터 셀과 겹치는 타일 전부 (셀 중심점은 셀 안 어디로든 움직일 수 있다)
+    """
+    if z >= PLACES_MIN_ZOOM:
+        return {tile_for(lat, lng, z)}
+
+    min_lat, max_lat, min_lng, max_lng = cell_bounds(lat, lng, precision_for_zoom(z))
+    min_x, min_y = tile_for(max_lat, min_lng, z)
+    max_x, max_y = tile_for(min_lat, max_lng, z)
+    return {(x, y) for x in range(min_x, max_x + 1) for y in range(min_y, max_y + 1)}
+
+
+def bump_tiles(db: Session, lat: float, lng: float) -> None:
+    """좌표의 맛집이 영향을 주는 모든 줌 레벨 타일의 버전 증가 - 커밋은 호출자가 한다"""
+    bump_tiles_many(db, [(lat, lng)])
+
+
+def bump_tiles_many(db: Session, coords: Iterable[tuple[float, float]]) -> None:
+    """여러 좌표가 영향을 주는 타일들의 버전을 타일마다 한 번씩 증가 - 커밋은 호출자가 한다"""
+    keys_by_zoom: dict[int, set[tuple[int, int]]] = {z: set() for z in range(MAX_TILE_ZOOM + 1)}
+    for lat, lng in coords:
+        for z, keys in keys_by_zoom.items():
+            keys.update(tiles_for_place(lat, lng, z))
+
+    # 타일 수가 많을 수 있어 ORM 객체 대신 executemany UPSERT로 처리
+    table = TileVersion.__table__
+    rows = [
+        {"tile_z": z, "tile_x": x, "tile_y": y}
+        for z, keys in keys_by_zoom.items()
+        for x, y in sorted(keys)
+    ]
+    db.execute(
+        upsert(table).values(
+            z=bindparam("tile_z"), x=bindparam("tile_x"), y=bindparam("tile_y"), version=1
+        ).on_conflict_do_update(
+            index_elements=[table.c.z, table.c.x, table.c.y],
+            set_={"version": table.c.version + 1}
+        ),
+        rows
+    )
+
+
+def get_tile_version(db: Session, z: int, x: int, y: int) -> int:
+    tile = db.get(TileVersion, (z, x, y))
+    return tile.version if tile else 0
+
+
+def make_etag(user_id: int, include_public: bool, z: int, x: int, y: int, version: int) -> str:
+    scope = f"u{user_id}{'p' if include_public else ''}"
+    return f'"{z}-{x}-{y}-v{version}-{scope}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 헤더에 etag가 포함되어 있는지 (약한 비교)"""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+# 렌더링된 타일 응답 (키에 타일 버전이 포함된다)
+tile_cache = LRUCache(max_size=TILE_CACHE_SIZE)
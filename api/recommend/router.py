@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
 from api.database import get_db
@@ -19,14 +19,16 @@ router = APIRouter(prefix="/recommend", tags=["recommend"])
 @router.post("", response_model=RecommendResponse)
 async def get_recommendation(
     request: RecommendRequest,
-    db: Session = Depends(get_db),
+    http_request: Request,
     current_user: User = Depends(get_current_user)
 ):
     """AI 맛집 추천 요청
 
     자연어로 맛집 추천을 요청합니다.
     """
-    response = await service.get_recommendation(db, current_user.id, request)
+    response = await service.get_recommendation(
+        current_user.id, request, is_disconnected=http_request.is_disconnected
+    )
     return response
 
 
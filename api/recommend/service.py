@@ -1,10 +1,13 @@
 import asyncio
 import secrets
 import logging
+from typing import Awaitable, Callable
 
 from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
+from api.database import SessionLocal
 from api.recommend.models import RecommendationSession, RecommendationFeedback
 from api.recommend.schemas import RecommendRequest, RecommendResponse
 from api.place.models import Place, Visibility
@@ -49,30 +52,81 @@ def update_session_messages(
     db.commit()
 
 
+def _open_session(user_id: int, session_token: str | None) -> tuple[int, str, list[dict]]:
+    """토큰의 세션 (없거나 다른 사용자의 것이면 새로 생성) -> (id, 토큰, 메시지 목록)
+
+    스레드 풀에서 실행하므로 요청 세션 대신 자기 DB 세션을 쓴다.
+    """
+    with SessionLocal() as db:
+        session = get_session_by_token(db, session_token, user_id) if session_token else None
+        session = session or create_session(db, user_id)
+        return session.id, session.access_token, list(session.messages or [])
+
+
+def _save_messages(session_id: int, user_message: str, assistant_message: str) -> None:
+    """세션 메시지 업데이트 (스레드 풀에서 자기 DB 세션으로)"""
+    with SessionLocal() as db:
+        session = db.get(RecommendationSession, session_id)
+        update_session_messages(db, session, user_message, assistant_message)
+
+
+DISCONNECT_POLL_SECONDS = 0.5
+
+
+async def _await_unless_disconnected(coro, is_disconnected: Callable[[], Awaitable[bool]] | None):
+    """coro를 기다리되 클라이언트 연결이 끊어지면 취소"""
+    task = asyncio.ensure_future(coro)
+    if is_disconnected is None:
+        return await task
+
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_SECONDS)
+            if done:
+                return task.result()
+            if await is_disconnected():
+                task.cancel()
+                raise HTTPException(status_code=499, detail="클라이언트 연결이 끊어졌습니다")
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+
+
 async def get_recommendation(
-    db: Session,
     user_id: int,
-    request: RecommendRequest
+    request: RecommendRequest,
+    is_disconnected: Callable[[], Awaitable[bool]] | None = None
 ) -> RecommendResponse:
-    """AI 추천 요청 처리"""
+    """AI 추천 요청 처리
+
+    LLM 호출은 비동기(동시 실행 수/제한 시간 적용)로 기다리고,
+    클라이언트 연결이 끊어지면(is_disconnected) 호출을 취소한다.
+    DB 작업은 이벤트 루프를 막지 않도록 스레드 풀에서 단계마다 새 세션으로 실행한다.
+    """
     # 세션 처리
-    if request.session_token:
-        session = get_session_by_token(db, request.session_token, user_id)
-        if not session:
-            session = create_session(db, user_id)
-    else:
-        session = create_session(db, user_id)
-
-    # AI 추천 생성 (동기 함수를 비동기로 실행 + 예외 처리)
+    session_id, session_token, messages = await run_in_threadpool(
+        _open_session, user_id, request.session_token
+    )
+
+    # AI 추천 생성 (예외 처리)
     try:
-        message, is_asking, recommended_places = await asyncio.to_thread(
-            generate_recommendation,
-            db=db,
-            user_id=user_id,
-            user_message=request.message,
-            messages_history=session.messages or [],
-            latitude=request.latitude,
-            longitude=request.longitude
+        message, is_asking, recommended_places = await _await_unless_disconnected(
+            generate_recommendation(
+                user_id=user_id,
+                user_message=request.message,
+                messages_history=messages,
+                latitude=request.latitude,
+                longitude=request.longitude
+            ),
+            is_disconnected
+        )
+    except HTTPException:
+        raise
+    except asyncio.TimeoutError:
+        logger.error("AI 추천 생성 시간 초과")
+        raise HTTPException(
+            status_code=504,
+            detail="AI 추천 응답이 늦어지고 있습니다. 잠시 후 다시 시도해주세요."
         )
     except Exception as e:
         logger.error(f"AI 추천 생성 실패: {e}")
@@ -82,10 +136,10 @@ async def get_recommendation(
         )
 
     # 세션 메시지 업데이트
-    update_session_messages(db, session, request.message, message)
+    await run_in_threadpool(_save_messages, session_id, request.message, message)
 
     return RecommendResponse(
-        session_token=session.access_token,
+        session_token=session_token,
         message=message,
         is_asking=is_asking,
         recommended_places=recommended_places
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -15,6 +15,11 @@ class RecommendationType(str, enum.Enum):
 
 class Review(Base):
     __tablename__ = "reviews"
+    __table_args__ = (
+        # 목록 정렬 (커서 페이지네이션)
+        Index("ix_reviews_place_created_at", "place_id", "created_at"),
+        Index("ix_reviews_user_created_at", "user_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
 from api.database import get_db
@@ -42,20 +42,34 @@ def create_review(
     return review
 
 
+def _set_page_headers(response: Response, total: int | None, next_cursor: str | None) -> None:
+    """목록 응답의 페이지 정보 헤더 (응답 본문은 기존과 같은 리스트)"""
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    if total is not None:
+        response.headers["X-Total-Count"] = str(total)
+
+
 @router.get("/place/{place_id}", response_model=list[ReviewResponse])
 def get_place_reviews(
     place_id: int,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: str | None = Query(None),
+    with_total: bool = Query(False),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """맛집의 리뷰 목록 조회"""
+    """맛집의 리뷰 목록 조회 (다음 페이지 커서는 X-Next-Cursor 헤더)"""
     # 맛집 존재 및 접근 권한 확인
     place = get_place_by_id(db, place_id)
     _check_place_access(place, current_user.id)
 
-    reviews, _ = service.get_reviews_by_place(db, place_id, skip, limit)
+    reviews, total, next_cursor = service.get_reviews_by_place(
+        db, place_id, skip, limit, cursor, with_total
+    )
+    _set_page_headers(response, total, next_cursor)
     return reviews
 
 
@@ -75,13 +89,19 @@ def get_place_review_stats(
 
 @router.get("/my", response_model=list[ReviewResponse])
 def get_my_reviews(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: str | None = Query(None),
+    with_total: bool = Query(False),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """내 리뷰 목록 조회"""
-    reviews, _ = service.get_reviews_by_user(db, current_user.id, skip, limit)
+    """내 리뷰 목록 조회 (다음 페이지 커서는 X-Next-Cursor 헤더)"""
+    reviews, total, next_cursor = service.get_reviews_by_user(
+        db, current_user.id, skip, limit, cursor, with_total
+    )
+    _set_page_headers(response, total, next_cursor)
     return reviews
 
 
@@ -1,16 +1,50 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import case, func, update
 
+from api import cache
+from api.pagination import paginate
+from api.place import cluster, tiles
+from api.place.models import Place, Visibility
 from api.review.models import Review
 from api.review.schemas import ReviewCreate, ReviewUpdate
 
 
+def _apply_rating_change(db: Session, place: Place, rating_delta: float, review_delta: int) -> None:
+    """맛집 평점 변화를 평점 집계/클러스터 집계/타일 버전에 반영 - 커밋은 호출자가 한다"""
+    # 동시 수정에도 값이 유실되지 않도록 DB에서 증감 (UPDATE ... SET x = x + ?)
+    new_sum = func.coalesce(Place.rating_sum, 0.0) + rating_delta
+    new_count = func.coalesce(Place.review_count, 0) + review_delta
+    # 리뷰 쓰기는 맛집 자체의 수정이 아니므로 updated_at(onupdate)은 그대로 둔다
+    db.execute(
+        update(Place).where(Place.id == place.id).values(
+            rating_sum=new_sum,
+            review_count=new_count,
+            avg_rating=case((new_count > 0, new_sum / new_count), else_=None),
+            updated_at=Place.updated_at
+        ).execution_options(synchronize_session=False)
+    )
+    db.expire(place, ["rating_sum", "review_count", "avg_rating"])
+
+    cluster.apply_review(db, place, rating_delta, review_delta)
+    tiles.bump_tiles(db, place.latitude, place.longitude)
+
+
+def _bump_review_data(db: Session, review: Review, place: Place) -> None:
+    """리뷰 작성자와 맛집 소유자의 데이터 버전 증가 - 커밋은 호출자가 한다"""
+    cache.bump_user_data(
+        db, [review.user_id, place.user_id], public=place.visibility == Visibility.PUBLIC
+    )
+
+
 def create_review(db: Session, user_id: int, review_data: ReviewCreate) -> Review:
     db_review = Review(
         user_id=user_id,
         **review_data.model_dump()
     )
     db.add(db_review)
+    place = db.get(Place, db_review.place_id)
+    _apply_rating_change(db, place, db_review.rating, 1)
+    _bump_review_data(db, db_review, place)
     db.commit()
     db.refresh(db_review)
     return db_review
@@ -24,32 +58,35 @@ def get_reviews_by_place(
     db: Session,
     place_id: int,
     skip: int = 0,
-    limit: int = 100
-) -> tuple[list[Review], int]:
+    limit: int = 100,
+    cursor: str | None = None,
+    with_total: bool = False
+) -> tuple[list[Review], int | None, str | None]:
     query = db.query(Review).filter(Review.place_id == place_id)
-    total = query.count()
-    reviews = query.order_by(Review.created_at.desc()).offset(skip).limit(limit).all()
-    return reviews, total
+    return paginate(
+        query, Review.created_at, Review.id, descending=True,
+        cursor=cursor, skip=skip, limit=limit, with_total=with_total
+    )
 
 
 def get_reviews_by_user(
     db: Session,
     user_id: int,
     skip: int = 0,
-    limit: int = 100
-) -> tuple[list[Review], int]:
+    limit: int = 100,
+    cursor: str | None = None,
+    with_total: bool = False
+) -> tuple[list[Review], int | None, str | None]:
     query = db.query(Review).filter(Review.user_id == user_id)
-    total = query.count()
-    reviews = query.order_by(Review.created_at.desc()).offset(skip).limit(limit).all()
-    return reviews, total
+    return paginate(
+        query, Review.created_at, Review.id, descending=True,
+        cursor=cursor, skip=skip, limit=limit, with_total=with_total
+    )
 
 
 def get_place_stats(db: Session, place_id: int) -> dict:
-    """맛집의 평균 평점과 리뷰 수 조회"""
-    result = db.query(
-        func.avg(Review.rating).label("avg_rating"),
-        func.count(Review.id).label("review_count")
-    ).filter(Review.place_id == place_id).first()
+    """맛집의 평균 평점과 리뷰 수 조회 (Place의 집계 컬럼)"""
+    result = db.query(Place.avg_rating, Place.review_count).filter(Place.id == place_id).first()
 
     return {
         "place_id": place_id,
@@ -60,14 +97,20 @@ def get_place_stats(db: Session, place_id: int) -> dict:
 
 def update_review(db: Session, review: Review, review_data: ReviewUpdate) -> Review:
     update_data = review_data.model_dump(exclude_unset=True)
+    old_rating = review.rating
     for field, value in update_data.items():
         setattr(review, field, value)
+    if review.rating != old_rating:
+        _apply_rating_change(db, review.place, review.rating - old_rating, 0)
+    _bump_review_data(db, review, review.place)
     db.commit()
     db.refresh(review)
     return review
 
 
 def delete_review(db: Session, review: Review) -> None:
+    _apply_rating_change(db, review.place, -review.rating, -1)
+    _bump_review_data(db, review, review.place)
     db.delete(review)
     db.commit()
 
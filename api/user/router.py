@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from api.database import get_db
+from api.auth.models import User
+from api.auth.dependencies import get_current_user
+from api.user.schemas import UserStatsResponse
+from api.user import service
+
+router = APIRouter(prefix="/users", tags=["users"])
+
+
+@router.get("/me/stats", response_model=UserStatsResponse)
+def get_my_stats(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """내 취향 통계 (카테고리/평점 분포, 월별 방문, 많이 쓴 태그)"""
+    return service.get_user_stats(db, current_user.id)
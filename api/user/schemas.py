@@ -0,0 +1,15 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from api.place.schemas import FacetCount
+
+
+class UserStatsResponse(BaseModel):
+    place_count: int
+    review_count: int
+    avg_rating: Optional[float] = None  # 내가 준 평점 평균
+    categories: dict[str, int]  # 카테고리 -> 맛집 수
+    ratings: dict[str, int]  # 내가 준 평점 구간("5"~"1") -> 리뷰 수
+    visits_per_month: dict[str, int]  # "YYYY-MM" -> 맛집 수 (방문일, 없으면 등록일 기준)
+    top_tags: list[FacetCount]
@@ -0,0 +1,59 @@
+from sqlalchemy import Date, Integer, cast, func
+from sqlalchemy.orm import Session
+
+from api import cache
+from api.place.models import Category, Place
+from api.place.service import RATING_BUCKETS, get_tag_counts
+from api.review.models import Review
+from api.user.schemas import UserStatsResponse
+
+STATS_CACHE_SIZE = 1024
+TOP_TAG_LIMIT = 10
+
+stats_cache = cache.LRUCache(max_size=STATS_CACHE_SIZE)
+
+
+def get_user_stats(db: Session, user_id: int) -> UserStatsResponse:
+    """사용자 취향 통계 (사용자 데이터 버전 단위 캐시 - 맛집/리뷰 쓰기 후 첫 조회에만 다시 계산)"""
+    key = ("stats", user_id, cache.get_versions(db, [cache.user_scope(user_id)]))
+    return stats_cache.get_or_compute(key, lambda: _compute_user_stats(db, user_id))
+
+
+def _compute_user_stats(db: Session, user_id: int) -> UserStatsResponse:
+    """맛집 (카테고리, 월)별 / 리뷰 평점 구간별 / 태그별 집계 쿼리 3번으로 계산"""
+    # 월 단위 함수는 DB마다 달라 날짜(DATE()) 단위로 묶고 월은 아래에서 합친다
+    day = func.date(func.coalesce(Place.visited_at, Place.created_at), type_=Date)
+    place_rows = db.query(Place.category, day, func.count(Place.id)).filter(
+        Place.user_id == user_id
+    ).group_by(Place.category, day).all()
+
+    bucket = cast(Review.rating, Integer)
+    review_rows = db.query(bucket, func.count(Review.id), func.sum(Review.rating)).filter(
+        Review.user_id == user_id
+    ).group_by(bucket).all()
+
+    categories = dict.fromkeys((c.value for c in Category), 0)
+    visits: dict[str, int] = {}
+    for row_category, row_day, count in place_rows:
+        categories[(row_category or Category.OTHER).value] += count
+        if row_day:
+            row_month = row_day.strftime("%Y-%m")
+            visits[row_month] = visits.get(row_month, 0) + count
+
+    ratings = dict.fromkeys((str(b) for b in reversed(RATING_BUCKETS)), 0)
+    review_count = 0
+    rating_sum = 0.0
+    for row_bucket, count, row_sum in review_rows:
+        ratings[str(row_bucket)] += count
+        review_count += count
+        rating_sum += row_sum
+
+    return UserStatsResponse(
+        place_count=sum(categories.values()),
+        review_count=review_count,
+        avg_rating=round(rating_sum / review_count, 1) if review_count else None,
+        categories=categories,
+        ratings=ratings,
+        visits_per_month=dict(sorted(visits.items())),
+        top_tags=get_tag_counts(db, user_id, only_mine=True, limit=TOP_TAG_LIMIT)
+    )
@@ -0,0 +1,107 @@
+"""맛집 목록 응답 직렬화 벤치마크
+
+지도 영역 조회(/places/bounds) 응답 본문을 만드는 두 경로의 처리량(rows/sec)을 비교한다.
+
+- orm: Place ORM 객체 조회 -> PlaceResponse 생성 -> response_model 검증/직렬화 -> json.dumps
+  (엔드포인트가 모델 목록을 반환할 때 FastAPI가 거치는 과정, 변경 전 방식)
+- rows: 필요한 컬럼만 튜플로 조회 -> PlaceRow -> TypeAdapter.dump_json (현재 목록 API)
+
+사용법:
+    python -m benchmarks.place_list_serialization --rows 20000 --repeat 5
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+# api 모듈이 설정을 읽기 전에 임시 DB 지정
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db")
+
+from pydantic import TypeAdapter
+from sqlalchemy import insert
+
+from api.database import SessionLocal, init_db
+from api.auth import models as _auth_models  # noqa: F401 - 관계 매핑용 모델 등록
+from api.place import service
+from api.place.geo import encode_geohash
+from api.place.models import Category, Place, Visibility
+from api.place.schemas import PlaceResponse, place_rows_json
+from api.recommend import models as _recommend_models  # noqa: F401
+
+USER_ID = 1
+BOX = (37.0, 38.0, 126.5, 127.5)
+
+_place_responses = TypeAdapter(list[PlaceResponse])
+
+
+def seed(rows: int) -> None:
+    values = []
+    for i in range(rows):
+        lat = random.uniform(BOX[0], BOX[1])
+        lng = random.uniform(BOX[2], BOX[3])
+        values.append({
+            "user_id": USER_ID,
+            "name": f"맛집 {i}",
+            "category": random.choice(list(Category)),
+            "latitude": lat,
+            "longitude": lng,
+            "geohash": encode_geohash(lat, lng),
+            "address": f"서울시 어딘가 {i}",
+            "memo": "메모" * 10,
+            "tags": "맛집,데이트",
+            "visibility": Visibility.PUBLIC,
+            "avg_rating": random.choice([None, 3.5, 4.0, 4.5]),
+            "review_count": random.randint(0, 5),
+        })
+    with SessionLocal() as db:
+        db.execute(insert(Place), values)
+        db.commit()
+
+
+def orm_path() -> bytes:
+    with SessionLocal() as db:
+        places = db.query(Place).filter(service._box_filter(USER_ID, *BOX)).all()
+        responses = [service._to_response(place) for place in places]
+        validated = _place_responses.validate_python(responses)
+        content = _place_responses.dump_python(validated, mode="json")
+        return json.dumps(content, ensure_ascii=False).encode()
+
+
+def rows_path() -> bytes:
+    with SessionLocal() as db:
+        rows = service.get_places_in_bounds(db, USER_ID, *BOX)
+        return place_rows_json.dump_json(rows)
+
+
+def measure(name: str, run, rows: int, repeat: int) -> float:
+    run()  # 워밍업
+    best = min(_timed(run) for _ in range(repeat))
+    print(f"{name:>5}: {best * 1000:8.1f} ms  {rows / best:12,.0f} rows/sec")
+    return best
+
+
+def _timed(run) -> float:
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    init_db()
+    seed(args.rows)
+    assert json.loads(orm_path()) == json.loads(rows_path())
+
+    before = measure("orm", orm_path, args.rows, args.repeat)
+    after = measure("rows", rows_path, args.rows, args.repeat)
+    print(f"speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
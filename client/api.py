@@ -45,6 +45,14 @@ class APIClient:
         response.raise_for_status()
         return response.json()
 
+    def get_my_stats(self) -> dict:
+        response = httpx.get(
+            f"{API_BASE_URL}/users/me/stats",
+            headers=self._headers()
+        )
+        response.raise_for_status()
+        return response.json()
+
     # ==================== Places ====================
 
     def get_my_places(self, skip: int = 0, limit: int = 100) -> dict:
@@ -65,10 +73,25 @@ class APIClient:
         response.raise_for_status()
         return response.json()
 
-    def get_place(self, place_id: int) -> dict:
+    def get_place(self, place_id: int, include: Optional[list[str]] = None, review_limit: int = 10) -> dict:
+        params = {}
+        if include:
+            params["include"] = ",".join(include)
+            params["review_limit"] = review_limit
+
         response = httpx.get(
             f"{API_BASE_URL}/places/{place_id}",
-            headers=self._headers()
+            headers=self._headers(),
+            params=params
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def get_places(self, place_ids: list[int]) -> list:
+        response = httpx.get(
+            f"{API_BASE_URL}/places/batch",
+            headers=self._headers(),
+            params={"ids": ",".join(str(place_id) for place_id in place_ids)}
         )
         response.raise_for_status()
         return response.json()
@@ -89,20 +112,60 @@ class APIClient:
         )
         response.raise_for_status()
 
+    def get_places_in_bounds(
+        self,
+        min_lat: float,
+        max_lat: float,
+        min_lng: float,
+        max_lng: float,
+        include_public: bool = False,
+        format: str = "json",
+        fields: Optional[list[str]] = None
+    ):
+        params = {
+            "min_lat": min_lat,
+            "max_lat": max_lat,
+            "min_lng": min_lng,
+            "max_lng": max_lng,
+            "include_public": include_public,
+            "format": format,
+        }
+        if fields:
+            params["fields"] = ",".join(fields)
+
+        response = httpx.get(
+            f"{API_BASE_URL}/places/bounds",
+            headers=self._headers(),
+            params=params
+        )
+        response.raise_for_status()
+        return response.json()
+
     def search_places(
         self,
         keyword: Optional[str] = None,
         category: Optional[str] = None,
         min_rating: Optional[float] = None,
-        only_mine: bool = True
+        only_mine: bool = True,
+        tags: Optional[list[str]] = None,
+        sort_by: Optional[str] = None,
+        lat: Optional[float] = None,
+        lng: Optional[float] = None
     ) -> dict:
         params = {"only_mine": only_mine}
+        if sort_by:
+            params["sort_by"] = sort_by
+        if lat is not None and lng is not None:
+            params["lat"] = lat
+            params["lng"] = lng
         if keyword:
             params["keyword"] = keyword
         if category:
             params["category"] = category
         if min_rating:
             params["min_rating"] = min_rating
+        if tags:
+            params["tags_all"] = ",".join(tags)
 
         response = httpx.get(
             f"{API_BASE_URL}/places/search",
@@ -112,6 +175,42 @@ class APIClient:
         response.raise_for_status()
         return response.json()
 
+    def get_place_facets(
+        self,
+        keyword: Optional[str] = None,
+        category: Optional[str] = None,
+        min_rating: Optional[float] = None,
+        only_mine: bool = True
+    ) -> dict:
+        params = {"only_mine": only_mine}
+        if keyword:
+            params["keyword"] = keyword
+        if category:
+            params["category"] = category
+        if min_rating:
+            params["min_rating"] = min_rating
+
+        response = httpx.get(
+            f"{API_BASE_URL}/places/facets",
+            headers=self._headers(),
+            params=params
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def get_place_tags(self, prefix: Optional[str] = None, only_mine: bool = True, limit: int = 50) -> list:
+        params = {"only_mine": only_mine, "limit": limit}
+        if prefix:
+            params["prefix"] = prefix
+
+        response = httpx.get(
+            f"{API_BASE_URL}/places/tags",
+            headers=self._headers(),
+            params=params
+        )
+        response.raise_for_status()
+        return response.json()
+
     # ==================== Reviews ====================
 
     def get_place_reviews(self, place_id: int) -> list:
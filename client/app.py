@@ -28,6 +28,8 @@ if "map_center" not in st.session_state:
     st.session_state.map_center = [37.5665, 126.9780]  # 서울 기본
 if "map_zoom" not in st.session_state:
     st.session_state.map_zoom = 13
+if "map_bounds" not in st.session_state:
+    st.session_state.map_bounds = None  # 마지막으로 본 지도 영역
 
 
 def main():
@@ -60,7 +62,7 @@ def show_main_app():
 
         menu = st.radio(
             "메뉴",
-            ["🗺️ 지도", "➕ 맛집 등록", "🤖 AI 추천"],
+            ["🗺️ 지도", "➕ 맛집 등록", "🤖 AI 추천", "📊 내 통계"],
             label_visibility="collapsed"
         )
 
@@ -74,6 +76,9 @@ def show_main_app():
     elif menu == "🤖 AI 추천":
         from client.views import recommend
         recommend.show_recommend()
+    elif menu == "📊 내 통계":
+        from client.views import stats
+        stats.show_stats()
 
 
 if __name__ == "__main__":
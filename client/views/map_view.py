@@ -1,9 +1,19 @@
+import base64
+import sys
+from array import array
+
 import streamlit as st
 import folium
 from streamlit_folium import st_folium
 from client.api import api_client
 from client.views.places import CATEGORY_MAP
 
+# 지도 영역 조회 시 마커 표시에 필요한 필드만 압축 형식으로 받는다
+MARKER_FIELDS = ["id", "name", "latitude", "longitude", "category", "avg_rating"]
+
+# 압축 응답 dtype -> array 타입 코드
+COMPACT_TYPECODES = {"u1": "B", "u2": "H", "u4": "I", "u8": "Q", "f4": "f"}
+
 
 def show_map_view():
     st.title("🗺️ 내 맛집 지도")
@@ -12,14 +22,33 @@ def show_map_view():
     col1, col2, col3 = st.columns([2, 1, 1])
     with col1:
         keyword = st.text_input("검색", placeholder="맛집 이름, 태그로 검색", label_visibility="collapsed")
+
+    # 필터별 개수 (직전에 고른 카테고리/평점 기준)
+    facets = load_facets(
+        keyword,
+        st.session_state.get("map_category_filter", "전체"),
+        st.session_state.get("map_min_rating")
+    )
+
     with col2:
         category_options = ["전체"] + [name for name in CATEGORY_MAP.values()]
-        category_filter = st.selectbox("카테고리", category_options, label_visibility="collapsed")
+        category_filter = st.selectbox(
+            "카테고리", category_options, key="map_category_filter",
+            format_func=lambda name: format_category_option(name, facets),
+            label_visibility="collapsed"
+        )
     with col3:
-        min_rating = st.selectbox("평점", [None, 4.0, 3.0, 2.0], format_func=lambda x: "전체" if x is None else f"⭐{x}+", label_visibility="collapsed")
+        min_rating = st.selectbox(
+            "평점", [None, 4.0, 3.0, 2.0], key="map_min_rating",
+            format_func=lambda x: format_rating_option(x, facets),
+            label_visibility="collapsed"
+        )
 
-    # 맛집 데이터 로드
-    places = load_places(keyword, category_filter, min_rating)
+    # 맛집 데이터 로드 (필터가 없으면 보고 있는 지도 영역의 마커)
+    if not keyword and category_filter == "전체" and min_rating is None and st.session_state.map_bounds:
+        places = load_markers(st.session_state.map_bounds)
+    else:
+        places = load_places(keyword, category_filter, min_rating)
 
     # 레이아웃: 지도 | 상세정보
     map_col, detail_col = st.columns([2, 1])
@@ -31,9 +60,15 @@ def show_map_view():
             m,
             width=None,
             height=500,
-            returned_objects=["last_object_clicked"]
+            returned_objects=["last_object_clicked", "bounds", "zoom"]
         )
 
+        # 지도 이동/확대 시 다음 조회 영역 갱신
+        if map_data and map_data.get("bounds") and map_data["bounds"].get("_southWest"):
+            st.session_state.map_bounds = map_data["bounds"]
+            if map_data.get("zoom"):
+                st.session_state.map_zoom = map_data["zoom"]
+
         # 마커 클릭 감지
         if map_data and map_data.get("last_object_clicked"):
             clicked = map_data["last_object_clicked"]
@@ -43,7 +78,7 @@ def show_map_view():
             # 클릭한 위치와 가장 가까운 맛집 찾기
             for place in places:
                 if abs(place["latitude"] - clicked_lat) < 0.0001 and abs(place["longitude"] - clicked_lng) < 0.0001:
-                    st.session_state.selected_place = place
+                    select_place(place)
                     break
 
     with detail_col:
@@ -58,20 +93,54 @@ def show_map_view():
             for place in places[:10]:
                 with st.container(border=True):
                     if st.button(f"📍 {place['name']}", key=f"list_{place['id']}", use_container_width=True):
-                        st.session_state.selected_place = place
+                        select_place(place)
                         st.session_state.map_center = [place["latitude"], place["longitude"]]
                         st.rerun()
 
 
+def get_category_code(category: str) -> str | None:
+    for code, name in CATEGORY_MAP.items():
+        if name == category:
+            return code
+    return None
+
+
+def load_facets(keyword: str, category: str, min_rating: float | None) -> dict | None:
+    try:
+        return api_client.get_place_facets(
+            keyword=keyword if keyword else None,
+            category=get_category_code(category),
+            min_rating=min_rating,
+            only_mine=True
+        )
+    except Exception:
+        return None
+
+
+def format_category_option(name: str, facets: dict | None) -> str:
+    if not facets:
+        return name
+    if name == "전체":
+        return f"{name} ({sum(facets['categories'].values())})"
+    return f"{name} ({facets['categories'].get(get_category_code(name), 0)})"
+
+
+def format_rating_option(min_rating: float | None, facets: dict | None) -> str:
+    label = "전체" if min_rating is None else f"⭐{min_rating}+"
+    if not facets:
+        return label
+    ratings = facets["ratings"]
+    if min_rating is None:
+        count = sum(ratings.values())
+    else:
+        count = sum(ratings.get(str(star), 0) for star in range(int(min_rating), 6))
+    return f"{label} ({count})"
+
+
 def load_places(keyword: str, category: str, min_rating: float) -> list:
     try:
         # 카테고리 코드 변환
-        category_code = None
-        if category != "전체":
-            for code, name in CATEGORY_MAP.items():
-                if name == category:
-                    category_code = code
-                    break
+        category_code = get_category_code(category) if category != "전체" else None
 
         result = api_client.search_places(
             keyword=keyword if keyword else None,
@@ -85,9 +154,62 @@ def load_places(keyword: str, category: str, min_rating: float) -> list:
         return []
 
 
+def load_markers(bounds: dict) -> list:
+    try:
+        south_west, north_east = bounds["_southWest"], bounds["_northEast"]
+        payload = api_client.get_places_in_bounds(
+            min_lat=max(south_west["lat"], -90),
+            max_lat=min(north_east["lat"], 90),
+            min_lng=max(south_west["lng"], -180),
+            max_lng=min(north_east["lng"], 180),
+            format="compact",
+            fields=MARKER_FIELDS
+        )
+        return decode_compact_places(payload)
+    except Exception as e:
+        st.error(f"맛집 로드 실패: {e}")
+        return []
+
+
+def decode_compact_places(payload: dict) -> list:
+    """format=compact 응답 -> 맛집 dict 목록"""
+    columns = {}
+    for field, column in payload["columns"].items():
+        if isinstance(column, list):
+            columns[field] = column
+            continue
+
+        values = array(COMPACT_TYPECODES[column["dtype"]])
+        values.frombytes(base64.b64decode(column["data"]))
+        if sys.byteorder == "big":
+            values.byteswap()
+
+        if "codes" in column:
+            columns[field] = [column["codes"][value] for value in values]
+        elif "scale" in column:
+            columns[field] = [value / column["scale"] if value else None for value in values]
+        else:
+            columns[field] = values.tolist()
+
+    fields = list(columns)
+    return [dict(zip(fields, row)) for row in zip(*columns.values())]
+
+
+def select_place(place: dict):
+    # 마커용 맛집은 일부 필드만 있으므로 상세 정보는 패널을 열 때 조회한다
+    st.session_state.selected_place = place
+
+
 def create_map(places: list) -> folium.Map:
-    # 맛집이 있으면 중심점 계산
-    if places:
+    bounds = st.session_state.map_bounds
+    if bounds:
+        # 보고 있던 영역 유지
+        center = [
+            (bounds["_southWest"]["lat"] + bounds["_northEast"]["lat"]) / 2,
+            (bounds["_southWest"]["lng"] + bounds["_northEast"]["lng"]) / 2,
+        ]
+    elif places:
+        # 맛집이 있으면 중심점 계산
         avg_lat = sum(p["latitude"] for p in places) / len(places)
         avg_lng = sum(p["longitude"] for p in places) / len(places)
         center = [avg_lat, avg_lng]
@@ -138,6 +260,13 @@ def get_marker_color(category: str) -> str:
 
 
 def show_place_detail(place: dict):
+    # 맛집 정보 + 리뷰 첫 페이지 + 별점 분포를 한 번에 조회
+    try:
+        place = api_client.get_place(place["id"], include=["reviews", "histogram"], review_limit=5)
+    except Exception as e:
+        st.error(f"맛집 조회 실패: {e}")
+        return
+
     st.subheader(f"📍 {place['name']}")
 
     # 닫기 버튼
@@ -168,7 +297,7 @@ def show_place_detail(place: dict):
 
     # 리뷰 섹션
     st.divider()
-    show_reviews_section(place["id"])
+    show_reviews_section(place["id"], place.get("reviews", []), place.get("histogram"))
 
     # 수정/삭제
     st.divider()
@@ -193,12 +322,13 @@ def show_place_detail(place: dict):
                 st.warning("다시 클릭하면 삭제됩니다")
 
 
-def show_reviews_section(place_id: int):
+def show_reviews_section(place_id: int, reviews: list, histogram: dict | None = None):
     st.write("**리뷰**")
 
-    try:
-        reviews = api_client.get_place_reviews(place_id)
+    if histogram and any(histogram.values()):
+        st.caption(" · ".join(f"{star}점 {histogram.get(str(star), 0)}" for star in range(5, 0, -1)))
 
+    try:
         if reviews:
             for review in reviews[:5]:
                 with st.container(border=True):
@@ -57,6 +57,11 @@ def show_add_place():
                 }
                 result = api_client.create_place(data)
                 st.success(f"'{result['name']}' 맛집이 등록되었습니다!")
+                for duplicate in result.get("duplicates", [])[:3]:
+                    st.warning(
+                        f"근처 {duplicate['distance_m']:.0f}m에 비슷한 맛집 "
+                        f"'{duplicate['name']}'이(가) 이미 있습니다"
+                    )
             except Exception as e:
                 st.error(f"등록 실패: {e}")
 
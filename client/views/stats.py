@@ -0,0 +1,40 @@
+import streamlit as st
+from client.api import api_client
+from client.views.places import CATEGORY_MAP
+
+
+def show_stats():
+    st.title("📊 내 통계")
+
+    try:
+        stats = api_client.get_my_stats()
+    except Exception as e:
+        st.error(f"통계 조회 실패: {e}")
+        return
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("맛집", stats["place_count"])
+    col2.metric("리뷰", stats["review_count"])
+    col3.metric("평균 평점", f"⭐ {stats['avg_rating']}" if stats.get("avg_rating") else "-")
+
+    if not stats["place_count"]:
+        st.info("맛집을 등록하면 통계가 표시됩니다")
+        return
+
+    st.subheader("카테고리")
+    st.bar_chart({
+        CATEGORY_MAP.get(code, code): count
+        for code, count in stats["categories"].items() if count
+    })
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("내가 준 평점")
+        st.bar_chart({f"{star}점": count for star, count in stats["ratings"].items()})
+    with col2:
+        st.subheader("월별 방문")
+        st.line_chart(stats["visits_per_month"])
+
+    if stats["top_tags"]:
+        st.subheader("많이 쓴 태그")
+        st.write(" ".join(f"`#{tag['value']}` {tag['count']}" for tag in stats["top_tags"]))
@@ -0,0 +1,40 @@
+import itertools
+import os
+import tempfile
+
+# api.database가 import 시점에 엔진을 만들므로 그 전에 테스트용 DB를 지정한다
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/test.db"
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.auth.dependencies import get_current_user
+from api.auth.models import User
+from api.database import SessionLocal
+from api.main import app
+
+_user_ids = itertools.count(1)
+
+
+@pytest.fixture
+def db():
+    with SessionLocal() as session:
+        yield session
+
+
+@pytest.fixture
+def user(db):
+    n = next(_user_ids)
+    db_user = User(email=f"user{n}@example.com", username=f"user{n}")
+    db.add(db_user)
+    db.commit()
+    db.refresh(db_user)
+    return db_user
+
+
+@pytest.fixture
+def client(user):
+    app.dependency_overrides[get_current_user] = lambda: user
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
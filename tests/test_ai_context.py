@@ -0,0 +1,16 @@
+from api.ai import retrieval
+from api.ai.context import PlaceEntry, UserPlaces, select_places
+
+
+def _user_places(*places: tuple[str, float | None]) -> UserPlaces:
+    entries = [PlaceEntry(i, text, rating, text) for i, (text, rating) in enumerate(places, 1)]
+    documents = [retrieval.tokenize(text) for text, _ in places]
+    return UserPlaces(entries, retrieval.BM25Index(documents))
+
+
+def test_select_places_ranks_even_under_top_k():
+    places = _user_places(("파스타 맛집", 5.0), ("김치찌개 맛집", 3.0), ("카페", 4.0))
+
+    chosen = select_places(places, retrieval.query_weights("김치찌개"), top_k=30)
+
+    assert [entry.place_id for entry in chosen] == [2, 1, 3]
@@ -0,0 +1,46 @@
+from sqlalchemy import update
+
+from api.place import cluster
+from api.place.geo import encode_geohash
+from api.place.models import Category, Place, PlaceCell
+
+
+def test_cell_precisions_match_cluster_zooms():
+    used = {cluster.precision_for_zoom(z) for z in range(cluster.PLACES_MIN_ZOOM)}
+    assert used == set(cluster.CLUSTER_PRECISIONS)
+
+
+def test_rebuild_merges_null_category_into_other(client, db):
+    first = client.post("/places", json={"name": "a", "latitude": 10.0, "longitude": 10.0}).json()
+    client.post("/places", json={
+        "name": "b", "latitude": 10.0001, "longitude": 10.0001, "category": "other"
+    })
+    db.execute(update(Place).where(Place.id == first["id"]).values(category=None))
+    db.commit()
+
+    cluster.rebuild_place_cells(db)
+
+    cell = encode_geohash(10.0, 10.0, 6)
+    cells = db.query(PlaceCell).filter(PlaceCell.precision == 6, PlaceCell.cell == cell).all()
+    assert [(c.category, c.place_count) for c in cells] == [(Category.OTHER, 2)]
+
+
+def test_cells_follow_place_writes(client, db):
+    place = client.post("/places", json={"name": "a", "latitude": 45.0, "longitude": -100.0}).json()
+    other = client.post("/places", json={"name": "b", "latitude": 45.0001, "longitude": -100.0001}).json()
+    cell = encode_geohash(45.0, -100.0, 6)
+
+    def cells():
+        db.expire_all()
+        return [
+            (c.place_count, c.review_count)
+            for c in db.query(PlaceCell).filter(PlaceCell.precision == 6, PlaceCell.cell == cell)
+        ]
+
+    assert cells() == [(2, 0)]
+    client.post("/reviews", json={"place_id": place["id"], "rating": 5})
+    assert cells() == [(2, 1)]
+    client.delete(f"/places/{place['id']}")
+    assert cells() == [(1, 0)]
+    client.delete(f"/places/{other['id']}")
+    assert cells() == []
@@ -0,0 +1,46 @@
+import base64
+import json
+from array import array
+
+from sqlalchemy import update
+
+from api.place.compact import CATEGORY_CODES, encode
+from api.place.models import Place
+
+
+def test_compact_bounds_encodes_missing_category_as_other(client, db):
+    place = client.post("/places", json={
+        "name": "a", "latitude": -30.0, "longitude": -60.0, "category": "cafe"
+    }).json()
+    db.execute(update(Place).where(Place.id == place["id"]).values(category=None))
+    db.commit()
+
+    response = client.get("/places/bounds", params={
+        "min_lat": -30.1, "max_lat": -29.9, "min_lng": -60.1, "max_lng": -59.9, "format": "compact"
+    })
+
+    assert response.status_code == 200
+    column = response.json()["columns"]["category"]
+    codes = base64.b64decode(column["data"])
+    assert [column["codes"][code] for code in codes] == ["other"]
+    assert column["codes"] == CATEGORY_CODES
+
+
+def _decode(column: dict) -> list:
+    typecodes = {"u2": "H", "u4": "I", "u8": "Q"}
+    return list(array(typecodes[column["dtype"]], base64.b64decode(column["data"])))
+
+
+def test_compact_widens_integer_columns_past_their_range():
+    rows = [
+        {"id": 2 ** 32 - 1, "review_count": 2 ** 16 - 1},
+        {"id": 1, "review_count": 0},
+    ]
+    columns = json.loads(encode(rows, ["id", "review_count"]))["columns"]
+    assert (columns["id"]["dtype"], columns["review_count"]["dtype"]) == ("u4", "u2")
+
+    rows.append({"id": 2 ** 32, "review_count": 2 ** 16})
+    columns = json.loads(encode(rows, ["id", "review_count"]))["columns"]
+    assert (columns["id"]["dtype"], columns["review_count"]["dtype"]) == ("u8", "u4")
+    assert _decode(columns["id"]) == [2 ** 32 - 1, 1, 2 ** 32]
+    assert _decode(columns["review_count"]) == [2 ** 16 - 1, 0, 2 ** 16]
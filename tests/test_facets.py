@@ -0,0 +1,12 @@
+def test_facet_tags_match_tag_counts(client):
+    for name, category, tags in [("a", "cafe", "Brunch, 데이트"), ("b", "cafe", "brunch"), ("c", "bar", "데이트")]:
+        client.post("/places", json={
+            "name": name, "category": category, "latitude": 5.0, "longitude": 5.0, "tags": tags
+        })
+
+    facets = client.get("/places/facets").json()
+    assert facets["tags"] == client.get("/places/tags").json()
+    assert {t["value"]: t["count"] for t in facets["tags"]} == {"brunch": 2, "데이트": 2}
+
+    bar_tags = client.get("/places/facets", params={"category": "bar"}).json()["tags"]
+    assert bar_tags == [{"value": "데이트", "count": 1}]
@@ -0,0 +1,55 @@
+import pytest
+
+from api.auth.models import User
+from api.pagination import encode_cursor
+from api.review import service as review_service
+from api.review.schemas import ReviewCreate
+
+
+def test_cursor_pages_cover_every_place_once(client):
+    created = [
+        client.post("/places", json={"name": f"p{i}", "latitude": 1.0, "longitude": 2.0}).json()["id"]
+        for i in range(5)
+    ]
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        page = client.get("/places/search", params=params).json()
+        seen.extend(place["id"] for place in page["places"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert seen == sorted(created, reverse=True)
+
+
+@pytest.mark.parametrize("cursor", [
+    "W1sxXSwxXQ",  # [[1],1]
+    "not-a-cursor",
+    encode_cursor({"a": 1}, 1),
+    encode_cursor("x", "1"),
+    encode_cursor("not a date", 1),
+    encode_cursor(3, 1),
+])
+def test_malformed_cursor_is_rejected(client, cursor):
+    response = client.get("/places/search", params={"cursor": cursor})
+    assert response.status_code == 400
+
+
+def test_place_detail_review_cursor_continues_review_listing(client, db, user):
+    place = client.post("/places", json={"name": "a", "latitude": 1.5, "longitude": 2.5}).json()
+    reviews = []
+    for i in range(3):
+        reviewer = User(email=f"reviewer{user.id}-{i}@example.com", username=f"reviewer{user.id}-{i}")
+        db.add(reviewer)
+        db.commit()
+        review = review_service.create_review(db, reviewer.id, ReviewCreate(place_id=place["id"], rating=3))
+        reviews.append(review.id)
+
+    detail = client.get(f"/places/{place['id']}", params={"include": "reviews", "review_limit": 1}).json()
+    rest = client.get(
+        f"/reviews/place/{place['id']}", params={"cursor": detail["reviews_next_cursor"]}
+    ).json()
+
+    assert [r["id"] for r in detail["reviews"]] + [r["id"] for r in rest] == sorted(reviews, reverse=True)
@@ -0,0 +1,35 @@
+import json
+import threading
+
+from api.ai import chat
+
+
+def test_recommendation_db_work_runs_off_event_loop(client, monkeypatch):
+    place = client.post("/places", json={"name": "김밥집", "latitude": 50.0, "longitude": 50.0}).json()
+    threads, histories = {}, []
+
+    def build_prompt(db, user_id, user_message, messages_history, *args):
+        threads["build_prompt"] = threading.current_thread()
+        histories.append(messages_history)
+        return original_build_prompt(db, user_id, user_message, messages_history, *args)
+
+    async def generate_response_async(prompt):
+        threads["loop"] = threading.current_thread()
+        return json.dumps({"message": "추천", "is_asking": False, "place_ids": [place["id"]], "reasons": {}})
+
+    original_build_prompt = chat.build_prompt
+    monkeypatch.setattr(chat, "build_prompt", build_prompt)
+    monkeypatch.setattr(chat, "generate_response_async", generate_response_async)
+
+    response = client.post("/recommend", json={"message": "김밥"})
+
+    assert response.status_code == 200, response.text
+    assert [p["id"] for p in response.json()["recommended_places"]] == [place["id"]]
+    assert threads["build_prompt"] is not threads["loop"]
+
+    # 스레드 풀에서 저장한 대화가 같은 세션의 다음 요청에 이어진다
+    token = response.json()["session_token"]
+    client.post("/recommend", json={"message": "또", "session_token": token})
+    assert histories[-1] == [
+        {"role": "user", "content": "김밥"}, {"role": "assistant", "content": "추천"}
+    ]
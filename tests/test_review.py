@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import update
+
+from api.place.models import Place
+
+
+def test_review_writes_keep_place_updated_at(client, db):
+    place = client.post("/places", json={"name": "a", "latitude": -20.0, "longitude": 40.0}).json()
+    db.execute(update(Place).where(Place.id == place["id"]).values(updated_at=datetime(2024, 1, 1)))
+    db.commit()
+    updated_at = client.get(f"/places/{place['id']}").json()["updated_at"]
+
+    review = client.post("/reviews", json={"place_id": place["id"], "rating": 4}).json()
+    client.put(f"/reviews/{review['id']}", json={"rating": 2})
+    detail = client.get(f"/places/{place['id']}").json()
+    assert detail["avg_rating"] == 2.0
+    assert detail["updated_at"] == updated_at
+
+    client.delete(f"/reviews/{review['id']}")
+    detail = client.get(f"/places/{place['id']}").json()
+    assert detail["review_count"] == 0
+    assert detail["updated_at"] == updated_at
@@ -0,0 +1,50 @@
+from api.place import tiles
+from api.place.cluster import precision_for_zoom
+from api.place.geo import cell_bounds
+
+
+def _straddling_cell(z: int, lng: float) -> tuple[tuple[int, int], float, float]:
+    """클러스터 셀이 아래쪽 타일 경계를 넘는 z 레벨 타일과, 그 경계 위/아래의 같은 셀 안 위도"""
+    x, y = tiles.tile_for(37.0, lng, z)
+    while True:
+        edge = tiles.tile_bounds(z, x, y)[0]
+        cell_min_lat, cell_max_lat, _, _ = cell_bounds(edge, lng, precision_for_zoom(z))
+        if cell_min_lat < edge < cell_max_lat:
+            return (x, y), (edge + cell_max_lat) / 2, (cell_min_lat + edge) / 2
+        y += 1
+
+
+def test_write_near_tile_edge_changes_neighbour_etag(client):
+    z, lng = 10, 127.1
+    (x, y), inside_lat, outside_lat = _straddling_cell(z, lng)
+    assert tiles.tile_for(outside_lat, lng, z) != (x, y)
+
+    client.post("/places", json={"name": "a", "latitude": inside_lat, "longitude": lng})
+    before = client.get(f"/places/tiles/{z}/{x}/{y}")
+    assert before.json()["clusters"]["count"] == [1]
+
+    # 이웃 타일에 속한 좌표지만 같은 클러스터 셀이라 이 타일의 클러스터가 바뀐다
+    client.post("/places", json={"name": "b", "latitude": outside_lat, "longitude": lng})
+    after = client.get(f"/places/tiles/{z}/{x}/{y}", headers={"If-None-Match": before.headers["etag"]})
+
+    assert after.status_code == 200
+    assert after.headers["etag"] != before.headers["etag"]
+
+
+def test_bump_tiles_upserts_versions(db):
+    lat, lng = -33.9, 18.4
+    z, (x, y) = 12, tiles.tile_for(-33.9, 18.4, 12)
+    assert tiles.get_tile_version(db, z, x, y) == 0
+
+    tiles.bump_tiles(db, lat, lng)
+    tiles.bump_tiles(db, lat, lng)
+    db.commit()
+
+    assert tiles.get_tile_version(db, z, x, y) == 2
+
+
+def test_write_bumps_a_bounded_number_of_tiles():
+    # 쓰기 한 번의 버전 갱신 행 수 (모듈 docstring의 쓰기 증폭 참고)
+    for lat in (0.0, 37.5, 60.0):
+        bumped = sum(len(tiles.tiles_for_place(lat, 127.0, z)) for z in range(tiles.MAX_TILE_ZOOM + 1))
+        assert bumped <= 64
@@ -0,0 +1,10 @@
+def test_stats_counts_visits_per_month(client):
+    for name, visited_at in [("a", "2024-03-01T12:00:00"), ("b", "2024-03-31T23:00:00"), ("c", "2024-04-02T09:00:00")]:
+        client.post("/places", json={
+            "name": name, "latitude": -40.0, "longitude": 150.0, "visited_at": visited_at
+        })
+
+    stats = client.get("/users/me/stats").json()
+
+    assert stats["place_count"] == 3
+    assert stats["visits_per_month"] == {"2024-03": 2, "2024-04": 1}